@@ -23,9 +23,12 @@ description:
   - Create or delete AWS Dynamo DB tables.
   - Can update the provisioned throughput on existing tables.
   - Returns the status of the specified table.
+  - With boto3, the table and its global indexes are compared with a single DescribeTable call and the
+    changes are sent in as few UpdateTable calls as DynamoDB allows.
 author: Alan Loi (@loia)
 requirements:
   - "boto >= 2.37.0"
+  - "boto3, required for I(tables), I(wait) and changing index definitions"
 options:
   state:
     description:
@@ -36,11 +39,42 @@ options:
   name:
     description:
       - Name of the table.
-    required: true
+      - Required unless I(tables) is given.
+    required: false
+  tables:
+    description:
+      - List of tables to manage in one task, each given as a table name or as a dict with a C(name) key and
+        any of C(hash_key_name), C(hash_key_type), C(range_key_name), C(range_key_type), C(read_capacity),
+        C(write_capacity) and C(indexes). Values not given in a dict default to the module options.
+      - Tables are processed concurrently, up to I(max_workers) at a time. Requires boto3.
+    required: false
+    default: null
+    version_added: "2.3"
+  max_workers:
+    description:
+      - Maximum number of tables processed at the same time when I(tables) is given.
+    required: false
+    default: 8
+    version_added: "2.3"
+  wait:
+    description:
+      - Wait for created or updated tables and their global indexes to become C(ACTIVE), and for deleted
+        tables to be gone. Requires boto3.
+      - Changes to global indexes that need several UpdateTable calls always wait between the calls.
+    required: false
+    default: "no"
+    choices: [ "yes", "no" ]
+    version_added: "2.3"
+  wait_timeout:
+    description:
+      - How long in seconds to wait for a table.
+    required: false
+    default: 600
+    version_added: "2.3"
   hash_key_name:
     description:
       - Name of the hash key.
-      - Required when C(state=present).
+      - Required when C(state=present), for every table.
     required: false
     default: null
   hash_key_type:
@@ -76,6 +110,7 @@ options:
       - "required options: ['name', 'type', 'hash_key_name']"
       - "valid types: ['all', 'global_all', 'global_include', 'global_keys_only', 'include', 'keys_only']"
       - "other options: ['hash_key_type', 'range_key_name', 'range_key_type', 'includes', 'read_capacity', 'write_capacity']"
+      - With boto3, a global index whose keys or projection differ from the existing one is deleted and created again.
     required: false
     default: []
     version_added: "2.1"
@@ -123,6 +158,20 @@ EXAMPLES = '''
     name: my-table
     region: us-east-1
     state: absent
+
+# Create several tables at once and wait until they are all active
+- dynamodb_table:
+    region: us-east-1
+    hash_key_name: id
+    wait: yes
+    tables:
+      - users
+      - name: sessions
+        read_capacity: 5
+        write_capacity: 5
+      - name: events
+        range_key_name: create_time
+        range_key_type: NUMBER
 '''
 
 RETURN = '''
@@ -131,8 +180,18 @@ table_status:
     returned: success
     type: string
     sample: ACTIVE
+tables:
+    description: The result for every table, in the order of I(tables).
+    returned: when tables is given
+    type: list
+    sample: [{"table_name": "users", "changed": true, "table_status": "ACTIVE"}]
 '''
 
+import random
+import threading
+import time
+
+
 try:
     import boto
     import boto.dynamodb2
@@ -152,10 +211,38 @@ try:
 except ImportError:
     HAS_BOTO = False
 
+try:
+    import boto3
+    import botocore
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
 DYNAMO_TYPE_DEFAULT = 'STRING'
 INDEX_REQUIRED_OPTIONS = ['name', 'type', 'hash_key_name']
 INDEX_OPTIONS = INDEX_REQUIRED_OPTIONS + ['hash_key_type', 'range_key_name', 'range_key_type', 'includes', 'read_capacity', 'write_capacity']
 INDEX_TYPE_OPTIONS = ['all', 'global_all', 'global_include', 'global_keys_only', 'include', 'keys_only']
+TABLE_OPTIONS = ['name', 'hash_key_name', 'hash_key_type', 'range_key_name', 'range_key_type', 'read_capacity', 'write_capacity', 'indexes']
+
+# boto3 names of the attribute and projection types
+ATTRIBUTE_TYPE_MAP = {
+    'STRING': 'S',
+    'NUMBER': 'N',
+    'BINARY': 'B'
+}
+PROJECTION_TYPE_MAP = {
+    'all': 'ALL',
+    'global_all': 'ALL',
+    'include': 'INCLUDE',
+    'global_include': 'INCLUDE',
+    'keys_only': 'KEYS_ONLY',
+    'global_keys_only': 'KEYS_ONLY'
+}
+
+MAX_TABLE_WORKERS = 8
+# Shortest and longest pause between two DescribeTable calls when waiting
+POLL_DELAY = 2
+MAX_POLL_DELAY = 20
 
 
 def create_or_update_dynamo_table(connection, module):
@@ -370,13 +457,343 @@ def get_indexes(all_indexes):
     return indexes, global_indexes
 
 
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+
+def error_code(e):
+    return e.response.get('Error', {}).get('Code')
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def get_key_schema(hash_key_name, range_key_name):
+    key_schema = [dict(AttributeName=hash_key_name, KeyType='HASH')]
+    if range_key_name:
+        key_schema.append(dict(AttributeName=range_key_name, KeyType='RANGE'))
+    return key_schema
+
+
+def get_attribute_definitions(spec, indexes):
+    """ AttributeDefinitions for the keys of the table and of the given indexes """
+    attributes = {}
+    for item in [spec] + indexes:
+        attributes[item['hash_key_name']] = item.get('hash_key_type') or DYNAMO_TYPE_DEFAULT
+        if item.get('range_key_name'):
+            attributes[item['range_key_name']] = item.get('range_key_type') or DYNAMO_TYPE_DEFAULT
+    return [dict(AttributeName=name, AttributeType=ATTRIBUTE_TYPE_MAP[attributes[name]])
+            for name in sorted(attributes)]
+
+
+def get_throughput(item):
+    return dict(ReadCapacityUnits=int(item.get('read_capacity', 1)),
+                WriteCapacityUnits=int(item.get('write_capacity', 1)))
+
+
+def is_global_index(index):
+    return index['type'].startswith('global_')
+
+
+def get_index_definition(index):
+    projection = dict(ProjectionType=PROJECTION_TYPE_MAP[index['type']])
+    if projection['ProjectionType'] == 'INCLUDE':
+        projection['NonKeyAttributes'] = index.get('includes', [])
+    definition = dict(
+        IndexName=index['name'],
+        KeySchema=get_key_schema(index['hash_key_name'], index.get('range_key_name')),
+        Projection=projection,
+    )
+    if is_global_index(index):
+        definition['ProvisionedThroughput'] = get_throughput(index)
+    return definition
+
+
+def index_layout(definition):
+    """ The parts of an index that can only be changed by creating it again """
+    projection = definition['Projection']
+    return (definition['KeySchema'], projection['ProjectionType'],
+            sorted(projection.get('NonKeyAttributes', [])))
+
+
+def throughput_changed(current, wanted):
+    return current['ReadCapacityUnits'] != wanted['ReadCapacityUnits'] or \
+           current['WriteCapacityUnits'] != wanted['WriteCapacityUnits']
+
+
+def describe_table(client, name):
+    """ Returns the description of the table, or None if it does not exist """
+    try:
+        return client.describe_table(TableName=name)['Table']
+    except botocore.exceptions.ClientError as e:
+        if error_code(e) == 'ResourceNotFoundException':
+            return None
+        raise
+
+
+def table_is_active(table):
+    return table['TableStatus'] == 'ACTIVE' and \
+           all(index.get('IndexStatus') == 'ACTIVE' for index in table.get('GlobalSecondaryIndexes', []))
+
+
+def wait_for_table_active(client, name, wait_timeout):
+    """
+    Polls DescribeTable with backoff until the table and all of its global
+    indexes are ACTIVE, and returns the table description.
+    """
+    deadline = time.time() + wait_timeout
+    attempt = 0
+    while True:
+        table = describe_table(client, name)
+        if table is not None and table_is_active(table):
+            return table
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise Exception('Timed out waiting for table %s to become active' % name)
+        time.sleep(min(backoff_delay(attempt, POLL_DELAY, MAX_POLL_DELAY), remaining))
+        attempt += 1
+
+
+def waiter_config(wait_timeout):
+    """ Spreads the attempts of a dynamodb waiter over wait_timeout seconds """
+    return dict(Delay=POLL_DELAY, MaxAttempts=max(1, int(wait_timeout) // POLL_DELAY))
+
+
+def get_table_updates(table, spec, indexes):
+    """
+    Compares the description of a table with the wanted state and returns the
+    keyword arguments of the UpdateTable calls that converge it, in order.
+
+    Throughput changes of the table and of all kept global indexes go into the
+    first call. DynamoDB only accepts one global index creation or deletion
+    per call, so each of those gets a call of its own.
+    """
+    current = dict((index['IndexName'], index) for index in table.get('GlobalSecondaryIndexes', []))
+    wanted = dict((index['name'], get_index_definition(index)) for index in indexes if is_global_index(index))
+
+    recreated = [name for name in wanted if name in current and index_layout(current[name]) != index_layout(wanted[name])]
+    deleted = sorted(name for name in current if name not in wanted) + sorted(recreated)
+    created = sorted(name for name in wanted if name not in current) + sorted(recreated)
+
+    updates = []
+    first = {}
+    throughput = get_throughput(spec)
+    if throughput_changed(table['ProvisionedThroughput'], throughput):
+        first['ProvisionedThroughput'] = throughput
+    index_updates = []
+    for name in sorted(wanted):
+        if name in current and name not in recreated and \
+                throughput_changed(current[name]['ProvisionedThroughput'], wanted[name]['ProvisionedThroughput']):
+            index_updates.append(dict(Update=dict(IndexName=name, ProvisionedThroughput=wanted[name]['ProvisionedThroughput'])))
+    if index_updates:
+        first['GlobalSecondaryIndexUpdates'] = index_updates
+    if first:
+        updates.append(first)
+
+    for name in deleted:
+        updates.append(dict(GlobalSecondaryIndexUpdates=[dict(Delete=dict(IndexName=name))]))
+    for name in created:
+        index = [index for index in indexes if index['name'] == name]
+        updates.append(dict(
+            AttributeDefinitions=get_attribute_definitions(spec, index),
+            GlobalSecondaryIndexUpdates=[dict(Create=wanted[name])],
+        ))
+    return updates
+
+
+def table_result(spec, region):
+    return dict(
+        region=region,
+        table_name=spec['name'],
+        hash_key_name=spec['hash_key_name'],
+        hash_key_type=spec['hash_key_type'],
+        range_key_name=spec['range_key_name'],
+        range_key_type=spec['range_key_type'],
+        read_capacity=spec['read_capacity'],
+        write_capacity=spec['write_capacity'],
+        indexes=spec['indexes'],
+    )
+
+
+def ensure_table_boto3(client, spec, region, check_mode=False, wait=False, wait_timeout=600):
+    """ Create the table or converge an existing one, and return the result for it """
+
+    result = table_result(spec, region)
+    indexes = spec['indexes']
+    table = describe_table(client, spec['name'])
+
+    if table is None:
+        result['changed'] = True
+        if check_mode:
+            return result
+        params = dict(
+            TableName=spec['name'],
+            KeySchema=get_key_schema(spec['hash_key_name'], spec['range_key_name']),
+            AttributeDefinitions=get_attribute_definitions(spec, indexes),
+            ProvisionedThroughput=get_throughput(spec),
+        )
+        global_indexes = [get_index_definition(index) for index in indexes if is_global_index(index)]
+        local_indexes = [get_index_definition(index) for index in indexes if not is_global_index(index)]
+        if global_indexes:
+            params['GlobalSecondaryIndexes'] = global_indexes
+        if local_indexes:
+            params['LocalSecondaryIndexes'] = local_indexes
+        table = client.create_table(**params)['TableDescription']
+        if wait:
+            client.get_waiter('table_exists').wait(TableName=spec['name'], WaiterConfig=waiter_config(wait_timeout))
+            table = dict(table, TableStatus='ACTIVE')
+        result['table_status'] = table['TableStatus']
+        return result
+
+    updates = get_table_updates(table, spec, indexes)
+    result['changed'] = bool(updates)
+    if check_mode:
+        return result
+
+    for update in updates:
+        # DynamoDB refuses changes while the table or one of its indexes is
+        # still being created, updated or deleted
+        if not table_is_active(table):
+            table = wait_for_table_active(client, spec['name'], wait_timeout)
+        table = client.update_table(TableName=spec['name'], **update)['TableDescription']
+    if updates and wait:
+        table = wait_for_table_active(client, spec['name'], wait_timeout)
+    result['table_status'] = table['TableStatus']
+    return result
+
+
+def delete_table_boto3(client, spec, region, check_mode=False, wait=False, wait_timeout=600):
+    result = dict(region=region, table_name=spec['name'], changed=False)
+
+    if describe_table(client, spec['name']) is None:
+        return result
+    result['changed'] = True
+    if check_mode:
+        return result
+
+    try:
+        client.delete_table(TableName=spec['name'])
+    except botocore.exceptions.ClientError as e:
+        if error_code(e) != 'ResourceNotFoundException':
+            raise
+    if wait:
+        client.get_waiter('table_not_exists').wait(TableName=spec['name'], WaiterConfig=waiter_config(wait_timeout))
+    return result
+
+
+def table_specs(module):
+    """ Build the wanted state of every table from name or tables """
+
+    defaults = dict((option, module.params.get(option)) for option in TABLE_OPTIONS)
+    if not module.params.get('tables'):
+        items = [dict(name=module.params.get('name'))]
+    else:
+        items = module.params.get('tables')
+
+    specs = []
+    for item in items:
+        if not isinstance(item, dict):
+            item = dict(name=item)
+        if 'name' not in item:
+            module.fail_json(msg='Every entry of tables needs a name', table=item)
+        for key in item:
+            if key not in TABLE_OPTIONS:
+                module.fail_json(msg='%s is not a valid option for a table' % key, table=item)
+        spec = dict(defaults)
+        spec.update(item)
+        if module.params.get('state') == 'present' and not spec['hash_key_name']:
+            module.fail_json(msg='hash_key_name is required for table %s' % spec['name'])
+        for key_type in ('hash_key_type', 'range_key_type'):
+            if spec[key_type] not in ATTRIBUTE_TYPE_MAP:
+                module.fail_json(msg='%s must be one of %s' % (key_type, sorted(ATTRIBUTE_TYPE_MAP)), table=item)
+        for index in spec['indexes']:
+            validate_index(index, module)
+        specs.append(spec)
+    return specs
+
+
+def manage_tables_boto3(client, module, region):
+
+    state = module.params.get('state')
+    wait = module.params.get('wait')
+    wait_timeout = module.params.get('wait_timeout')
+    specs = table_specs(module)
+
+    def task(spec):
+        if state == 'present':
+            return lambda: ensure_table_boto3(client, spec, region, module.check_mode, wait, wait_timeout)
+        return lambda: delete_table_boto3(client, spec, region, module.check_mode, wait, wait_timeout)
+
+    tasks = dict((spec['name'], task(spec)) for spec in specs)
+    results, errors = run_concurrently(tasks, module.params.get('max_workers'))
+
+    if errors:
+        module.fail_json(msg='Failed to manage dynamo table(s) %s' % ', '.join(sorted(errors)),
+                         errors=dict((name, describe_error(e)) for name, e in errors.items()))
+
+    if not module.params.get('tables'):
+        module.exit_json(**results[specs[0]['name']])
+
+    tables = [results[spec['name']] for spec in specs]
+    module.exit_json(changed=any(table['changed'] for table in tables), tables=tables)
+
 
 def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(dict(
         state=dict(default='present', choices=['present', 'absent']),
-        name=dict(required=True, type='str'),
-        hash_key_name=dict(required=True, type='str'),
+        name=dict(type='str'),
+        tables=dict(type='list'),
+        max_workers=dict(default=MAX_TABLE_WORKERS, type='int'),
+        wait=dict(default=False, type='bool'),
+        wait_timeout=dict(default=600, type='int'),
+        hash_key_name=dict(type='str'),
         hash_key_type=dict(default='STRING', type='str', choices=['STRING', 'NUMBER', 'BINARY']),
         range_key_name=dict(type='str'),
         range_key_type=dict(default='STRING', type='str', choices=['STRING', 'NUMBER', 'BINARY']),
@@ -387,8 +804,23 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[['name', 'tables']],
+        required_one_of=[['name', 'tables']],
         supports_check_mode=True)
 
+    if HAS_BOTO3:
+        region, ec2_url, aws_connect_params = get_aws_connection_info(module, boto3=True)
+        if not region:
+            module.fail_json(msg='region must be specified')
+        try:
+            client = boto3_conn(module, conn_type='client', resource='dynamodb', region=region, endpoint=ec2_url, **aws_connect_params)
+        except (botocore.exceptions.NoCredentialsError, botocore.exceptions.ProfileNotFound) as e:
+            module.fail_json(msg='Failed to connect to DynamoDB: %s' % str(e))
+        manage_tables_boto3(client, module, region)
+
+    if module.params.get('tables') or module.params.get('wait'):
+        module.fail_json(msg='tables and wait require boto3')
+
     if not HAS_BOTO:
         module.fail_json(msg='boto required for this module')
 
@@ -403,6 +835,8 @@ def main():
 
     state = module.params.get('state')
     if state == 'present':
+        if not module.params.get('hash_key_name'):
+            module.fail_json(msg='hash_key_name is required when state=present')
         create_or_update_dynamo_table(connection, module)
     elif state == 'absent':
         delete_dynamo_table(connection, module)
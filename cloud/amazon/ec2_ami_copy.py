@@ -69,6 +69,13 @@ options:
       - a hash/dictionary of tags to add to the new copied AMI; '{"key":"value"}' and '{"key":"value","key":"value"}'
     required: false
     default: null
+  regions:
+    description:
+      - List of destination regions to copy the AMI to. The copies are started concurrently and, with wait,
+        waited for together. Defaults to the region of the connection.
+    required: false
+    default: null
+    version_added: "2.3"
 
 author: Amir Moulavi <amir.moulavi@gmail.com>
 extends_documentation_fragment:
@@ -122,8 +129,46 @@ EXAMPLES = '''
     source_image_id: ami-xxxxxxx
     encrypted: yes
     kms_key_id: arn:aws:kms:us-east-1:XXXXXXXXXXXX:key/746de6ea-50a4-4bcb-8fbc-e3b29f2d367b
+
+# Copy an AMI to several regions and wait for all copies
+- ec2_ami_copy:
+    source_region: us-east-1
+    regions:
+      - eu-west-1
+      - ap-southeast-2
+      - us-west-2
+    source_image_id: ami-xxxxxxx
+    wait: yes
+  register: copies
+'''
+
+RETURN = '''
+image_id:
+    description: AMI id of the copied image
+    returned: when regions is not given
+    type: string
+    sample: ami-e689729e
+state:
+    description: state of the copied image
+    returned: when regions is not given
+    type: string
+    sample: available
+image_ids:
+    description: AMI id of the copied image in every destination region
+    returned: when regions is given
+    type: dict
+    sample: {"eu-west-1": "ami-e689729e", "us-west-2": "ami-6f8c4a0f"}
+states:
+    description: state of the copied image in every destination region
+    returned: when regions is given
+    type: dict
+    sample: {"eu-west-1": "available", "us-west-2": "available"}
 '''
 
+import random
+import time
+import threading
+
 try:
     import boto
     import boto.ec2
@@ -131,13 +176,86 @@ try:
 except ImportError:
     HAS_BOTO = False
 
+# Regions worked on at the same time, and the longest pause between polls
+MAX_REGION_WORKERS = 12
+MAX_POLL_DELAY = 30
+
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def run_in_regions(connections, func):
+    """
+    Runs func(region, connection) for every (region, connection) pair, each
+    connection only used by the thread of its region.
+
+    Returns a (results, errors) pair of dicts keyed by region, errors
+    holding messages.
+    """
+    def task(region, connection):
+        return lambda: func(region, connection)
+
+    tasks = dict((region, task(region, connection)) for region, connection in connections)
+    results, errors = run_concurrently(tasks, MAX_REGION_WORKERS)
+    return results, dict((region, describe_error(e)) for region, e in errors.items())
 
-def copy_image(module, ec2):
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+
+def copy_image(module, connections):
     """
-    Copies an AMI
+    Copies an AMI to every destination region
 
     module : AnsibleModule object
-    ec2: authenticated ec2 connection object
+    connections: list of (region, authenticated ec2 connection object) pairs
     """
 
     source_region = module.params.get('source_region')
@@ -150,65 +268,98 @@ def copy_image(module, ec2):
     wait_timeout = int(module.params.get('wait_timeout'))
     wait = module.params.get('wait')
 
-    try:
-        params = {'source_region': source_region,
-                  'source_image_id': source_image_id,
-                  'name': name,
-                  'description': description,
-                  'encrypted': encrypted,
-                  'kms_key_id': kms_key_id
-        }
+    params = {'source_region': source_region,
+              'source_image_id': source_image_id,
+              'name': name,
+              'description': description,
+              'encrypted': encrypted,
+              'kms_key_id': kms_key_id
+    }
 
-        image_id = ec2.copy_image(**params).image_id
-    except boto.exception.BotoServerError, e:
-        module.fail_json(msg="%s: %s" % (e.error_code, e.error_message))
+    def start_copy(region, ec2):
+        return ec2.copy_image(**params).image_id
 
-    img = wait_until_image_is_recognized(module, ec2, wait_timeout, image_id, wait)
+    image_ids, errors = run_in_regions(connections, start_copy)
+    if errors:
+        module.fail_json(msg="Failed to copy %s to %s" % (source_image_id, ", ".join(sorted(errors))),
+                         errors=errors, image_ids=image_ids)
 
-    img = wait_until_image_is_copied(module, ec2, wait_timeout, img, image_id, wait)
+    states = wait_until_images_are_copied(module, connections, wait_timeout, image_ids, wait)
 
-    register_tags_if_any(module, ec2, tags, image_id)
+    register_tags_if_any(module, connections, tags, image_ids)
 
-    module.exit_json(msg="AMI copy operation complete", image_id=image_id, state=img.state, changed=True)
+    if module.params.get('regions'):
+        module.exit_json(msg="AMI copy operation complete", image_ids=image_ids, states=states, changed=True)
+    region = connections[0][0]
+    module.exit_json(msg="AMI copy operation complete", image_id=image_ids[region], state=states[region], changed=True)
 
 
-# register tags to the copied AMI
-def register_tags_if_any(module, ec2, tags, image_id):
+# register tags to the copied AMIs
+def register_tags_if_any(module, connections, tags, image_ids):
     if tags:
+        def create_tags(region, ec2):
+            ec2.create_tags([image_ids[region]], tags)
+
+        results, errors = run_in_regions(connections, create_tags)
+        if errors:
+            module.fail_json(msg="Failed to tag the copied AMI in %s" % ", ".join(sorted(errors)),
+                             errors=errors, image_ids=image_ids)
+
+
+def describe_image_states(connections, image_ids):
+    """
+    Looks up the state of the copied images with one DescribeImages call per
+    region for all of its image ids. Images EC2 does not know about yet, as
+    happens right after CopyImage, are reported as pending.
+    """
+    def describe(region, ec2):
+        ids = image_ids[region]
+        if not isinstance(ids, list):
+            ids = [ids]
         try:
-            ec2.create_tags([image_id], tags)
-        except Exception as e:
-            module.fail_json(msg=str(e))
-
-
-# wait here until the image is copied (i.e. the state becomes available
-def wait_until_image_is_copied(module, ec2, wait_timeout, img, image_id, wait):
-    wait_timeout = time.time() + wait_timeout
-    while wait and wait_timeout > time.time() and (img is None or img.state != 'available'):
-        img = ec2.get_image(image_id)
-        time.sleep(3)
-    if wait and wait_timeout <= time.time():
-        # waiting took too long
-        module.fail_json(msg="timed out waiting for image to be copied")
-    return img
-
-
-# wait until the image is recognized.
-def wait_until_image_is_recognized(module, ec2, wait_timeout, image_id, wait):
-    for i in range(wait_timeout):
-        try:
-            return ec2.get_image(image_id)
-        except boto.exception.EC2ResponseError, e:
-            # This exception we expect initially right after registering the copy with EC2 API
-            if 'InvalidAMIID.NotFound' in e.error_code and wait:
-                time.sleep(1)
-            else:
-                # On any other exception we should fail
-                module.fail_json(
-                    msg="Error while trying to find the new image. Using wait=yes and/or a longer wait_timeout may help: " + str(
-                        e))
-    else:
-        module.fail_json(msg="timed out waiting for image to be recognized")
+            images = ec2.get_all_images(image_ids=ids)
+        except boto.exception.EC2ResponseError as e:
+            if 'InvalidAMIID.NotFound' in (e.error_code or ''):
+                return 'pending'
+            raise
+        states = [img.state for img in images]
+        if len(states) < len(ids):
+            return 'pending'
+        for state in ('failed', 'pending'):
+            if state in states:
+                return state
+        return 'available'
+
+    return run_in_regions(connections, describe)
+
+
+# wait here until the images are copied (i.e. the state becomes available)
+def wait_until_images_are_copied(module, connections, wait_timeout, image_ids, wait):
+    deadline = time.time() + wait_timeout
+    pending = list(connections)
+    states = {}
+    attempt = 0
+    while pending:
+        results, errors = describe_image_states(pending, image_ids)
+        if errors:
+            module.fail_json(msg="Error while trying to find the new image in %s" % ", ".join(sorted(errors)),
+                             errors=errors, image_ids=image_ids)
+        states.update(results)
+        failed = sorted(region for region in results if results[region] == 'failed')
+        if failed:
+            module.fail_json(msg="Copying the image failed in %s" % ", ".join(failed),
+                             image_ids=image_ids, states=states)
+        # only the regions that are not done yet are polled again
+        pending = [(region, ec2) for region, ec2 in pending if states[region] != 'available']
+        if not wait or not pending:
+            break
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            # waiting took too long
+            module.fail_json(msg="timed out waiting for image to be copied", image_ids=image_ids, states=states)
+        time.sleep(min(backoff_delay(attempt, 1, MAX_POLL_DELAY), remaining))
+        attempt += 1
+    return states
 
 
 def main():
@@ -222,27 +373,36 @@ def main():
         kms_key_id=dict(type='str', required=False),
         wait=dict(type='bool', default=False),
         wait_timeout=dict(default=1200),
-        tags=dict(type='dict')))
+        tags=dict(type='dict'),
+        regions=dict(type='list')))
 
     module = AnsibleModule(argument_spec=argument_spec)
 
     if not HAS_BOTO:
         module.fail_json(msg='boto required for this module')
 
-    try:
-        ec2 = ec2_connect(module)
-    except boto.exception.NoAuthHandlerFound, e:
-        module.fail_json(msg=str(e))
-
     try:
         region, ec2_url, boto_params = get_aws_connection_info(module)
     except boto.exception.NoAuthHandlerFound, e:
         module.fail_json(msg=str(e))
 
-    if not region:
+    regions = module.params.get('regions')
+    if not regions and not region:
         module.fail_json(msg="region must be specified")
 
-    copy_image(module, ec2)
+    # One connection per destination region, created here as creating them
+    # from several threads is not safe
+    connections = []
+    try:
+        if regions:
+            for dest_region in regions:
+                connections.append((dest_region, connect_to_aws(boto.ec2, dest_region, **boto_params)))
+        else:
+            connections.append((region, ec2_connect(module)))
+    except (boto.exception.NoAuthHandlerFound, AnsibleAWSError), e:
+        module.fail_json(msg=str(e))
+
+    copy_image(module, connections)
 
 
 # import module snippets
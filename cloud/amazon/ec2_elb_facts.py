@@ -76,12 +76,105 @@ EXAMPLES = '''
 
 try:
     import boto.ec2.elb
-    from boto.ec2.tag import Tag
     from boto.exception import BotoServerError
     HAS_BOTO = True
 except ImportError:
     HAS_BOTO = False
 
+import random
+import threading
+import time
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+# DescribeTags accepts at most 20 load balancer names per call
+TAGS_BATCH_SIZE = 20
+# Number of concurrent DescribeInstanceHealth calls
+HEALTH_WORKERS = 8
+THROTTLING_RETRIES = 6
+
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+class ElbTagDescription(object):
+    """ Parses one TagDescriptions member of a DescribeTags response """
+
+    def __init__(self, connection=None):
+        self.load_balancer_name = None
+        self.tags = {}
+        self._key = None
+        self._value = None
+
+    def startElement(self, name, attrs, connection):
+        # Keep handling the nested Tags members, their end would otherwise
+        # end this node too
+        if name == 'member':
+            return self
+        return None
+
+    def endElement(self, name, value, connection):
+        # Key and Value come in either order, the pair is complete at the
+        # end of its Tags member
+        if name == 'LoadBalancerName':
+            self.load_balancer_name = value
+        elif name == 'Key':
+            self._key = value
+        elif name == 'Value':
+            self._value = value
+        elif name == 'member':
+            if self._key is not None:
+                self.tags[self._key] = self._value or ''
+            self._key = None
+            self._value = None
+
+
 class ElbInformation(object):
     """ Handles ELB information """
 
@@ -97,13 +190,58 @@ class ElbInformation(object):
         self.aws_connect_params = aws_connect_params
         self.connection = self._get_elb_connection()
 
-    def _get_tags(self, elbname):
-        params = {'LoadBalancerNames.member.1': elbname}
-        try:
-            elb_tags = self.connection.get_list('DescribeTags', params, [('member', Tag)])
-            return dict((tag.Key, tag.Value) for tag in elb_tags if hasattr(tag, 'Key'))
-        except:
-            return {}
+    def _retry_throttled(self, method, *args, **kwargs):
+        """ Call method, retrying with exponential backoff and jitter while AWS throttles requests """
+        attempt = 0
+        while True:
+            try:
+                return method(*args, **kwargs)
+            except BotoServerError as err:
+                if err.error_code not in ('Throttling', 'RequestLimitExceeded') or attempt >= THROTTLING_RETRIES:
+                    raise
+                attempt += 1
+                time.sleep(random.uniform(0, min(20, 2 ** attempt)))
+
+    def _get_tags(self, elbnames):
+        """ Fetch the tags of many ELBs, TAGS_BATCH_SIZE names per DescribeTags call """
+        tags = {}
+        for i in range(0, len(elbnames), TAGS_BATCH_SIZE):
+            params = {}
+            for j, name in enumerate(elbnames[i:i + TAGS_BATCH_SIZE]):
+                params['LoadBalancerNames.member.%d' % (j + 1)] = name
+            try:
+                descriptions = self._retry_throttled(
+                    self.connection.get_list, 'DescribeTags', params, [('member', ElbTagDescription)])
+            except BotoServerError as err:
+                self.module.fail_json(msg="DescribeTags: %s" % describe_error(err))
+            for description in descriptions:
+                tags[description.load_balancer_name] = description.tags
+        return tags
+
+    def _get_instance_health(self, elbs):
+        """ Fetch the instance health of many ELBs with a bounded pool of threads """
+        # boto connections are not thread safe, every task borrows one of
+        # these for the time of its call
+        idle = queue.Queue()
+        for i in range(min(HEALTH_WORKERS, len(elbs))):
+            idle.put(self._get_elb_connection())
+
+        def describe(name):
+            def run():
+                connection = idle.get()
+                try:
+                    return self._retry_throttled(connection.describe_instance_health, name)
+                finally:
+                    idle.put(connection)
+            return run
+
+        tasks = dict((elb.name, describe(elb.name)) for elb in elbs)
+        health, errors = run_concurrently(tasks, HEALTH_WORKERS)
+
+        if errors:
+            name = sorted(errors)[0]
+            self.module.fail_json(msg="%s: %s" % (name, describe_error(errors[name])))
+        return health
 
     def _get_elb_connection(self):
         try:
@@ -155,7 +293,7 @@ class ElbInformation(object):
             health_check_dict['ping_path'] = path
         return health_check_dict
 
-    def _get_elb_info(self, elb):
+    def _get_elb_info(self, elb, tags, instance_health):
         elb_info = {
             'name': elb.name,
             'zones': elb.availability_zones,
@@ -175,17 +313,14 @@ class ElbInformation(object):
             'instances_outofservice': [],
             'instances_outofservice_count': 0,
             'instances_inservice_percent': 0.0,
-            'tags': self._get_tags(elb.name)
+            'tags': tags.get(elb.name, {})
         }
 
         if elb.vpc_id:
             elb_info['vpc_id'] = elb.vpc_id
 
-        if elb.instances:
-            try:
-                instance_health = self.connection.describe_instance_health(elb.name)
-            except BotoServerError as err:
-                self.module.fail_json(msg=err.message)
+        if elb.instances and elb.name in instance_health:
+            instance_health = instance_health[elb.name]
             elb_info['instances_inservice'] = [inst.instance_id for inst in instance_health if inst.state == 'InService']
             elb_info['instances_inservice_count'] = len(elb_info['instances_inservice'])
             elb_info['instances_outofservice'] = [inst.instance_id for inst in instance_health if inst.state == 'OutOfService']
@@ -196,20 +331,41 @@ class ElbInformation(object):
         return elb_info
 
 
-    def list_elbs(self):
-        elb_array = []
+    def _get_load_balancers(self):
+        """ Fetch the requested load balancers, following the pagination markers """
+        if self.names:
+            try:
+                return self._retry_throttled(
+                    self.connection.get_all_load_balancers, load_balancer_names=self.names)
+            except BotoServerError as err:
+                if err.error_code != 'LoadBalancerNotFound':
+                    raise
+                # Unknown names are skipped rather than failing the whole
+                # lookup, so fall back to filtering the complete list.
+
+        all_elbs = []
+        marker = None
+        while True:
+            page = self._retry_throttled(self.connection.get_all_load_balancers, marker=marker)
+            all_elbs.extend(page)
+            marker = getattr(page, 'next_marker', None)
+            if not marker:
+                break
+
+        if self.names:
+            all_elbs = [elb for elb in all_elbs if elb.name in self.names]
+        return all_elbs
 
+    def list_elbs(self):
         try:
-            all_elbs = self.connection.get_all_load_balancers()
+            elbs = self._get_load_balancers()
         except BotoServerError as err:
             self.module.fail_json(msg = "%s: %s" % (err.error_code, err.error_message))
 
-        if all_elbs:
-            for existing_lb in all_elbs:
-                if existing_lb.name in self.names:
-                    elb_array.append(self._get_elb_info(existing_lb))
+        tags = self._get_tags([elb.name for elb in elbs])
+        instance_health = self._get_instance_health([elb for elb in elbs if elb.instances])
 
-        return elb_array
+        return [self._get_elb_info(elb, tags, instance_health) for elb in elbs]
 
 def main():
     argument_spec = ec2_argument_spec()
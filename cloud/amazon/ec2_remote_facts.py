@@ -26,6 +26,19 @@ options:
       - A dict of filters to apply. Each dict item consists of a filter key and a filter value. See U(http://docs.aws.amazon.com/AWSEC2/latest/APIReference/API_DescribeInstances.html) for possible filters.
     required: false
     default: null
+  regions:
+    description:
+      - List of regions to gather facts from concurrently. Defaults to the region of the connection.
+      - Every returned item carries its I(region).
+    required: false
+    default: null
+    version_added: "2.3"
+  fields:
+    description:
+      - Only return these keys of every instance, e.g. C([id, state, private_ip_address, tags]), to keep the result small on large accounts.
+    required: false
+    default: null
+    version_added: "2.3"
 author:
     - "Michael Schuett (@michaeljs1990)"
 extends_documentation_fragment:
@@ -56,6 +69,18 @@ EXAMPLES = '''
       vpc-id: vpc-123456
       instance-type: t2.small
 
+# Gather the id, state and tags of the running instances in two regions
+- ec2_remote_facts:
+    regions:
+      - us-east-1
+      - eu-west-1
+    filters:
+      instance-state-name: running
+    fields:
+      - id
+      - state
+      - tags
+
 '''
 
 try:
@@ -65,6 +90,12 @@ try:
 except ImportError:
     HAS_BOTO = False
 
+import threading
+
+# Items requested per Describe call and regions queried at the same time
+PAGE_SIZE = 1000
+MAX_REGION_WORKERS = 8
+
 def get_instance_info(instance):
 
     # Get groups
@@ -137,27 +168,103 @@ def get_instance_info(instance):
     return instance_info
 
 
-def list_ec2_instances(connection, module):
+def iter_instances(connection, filters):
+    """ Yield instances page by page, following the NextToken of DescribeInstances """
+    next_token = None
+    while True:
+        reservations = connection.get_all_reservations(filters=filters, max_results=PAGE_SIZE, next_token=next_token)
+        for reservation in reservations:
+            for instance in reservation.instances:
+                yield instance
+        next_token = reservations.next_token
+        if not next_token:
+            break
+
+
+def project(info, fields):
+    """ Keep only the requested keys of a fact dict.
+
+    The full dict of an item is still built, but only this trimmed copy is
+    kept in the result.
+    """
+    if not fields:
+        return info
+    return dict((key, info[key]) for key in fields if key in info)
+
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def list_ec2_instances(connections, module):
 
     filters = module.params.get("filters")
-    instance_dict_array = []
+    fields = module.params.get("fields")
 
-    try:
-        all_instances = connection.get_only_instances(filters=filters)
-    except BotoServerError as e:
-        module.fail_json(msg=e.message)
+    def collector(region, connection):
+        return lambda: [project(get_instance_info(instance), fields) for instance in iter_instances(connection, filters)]
 
-    for instance in all_instances:
-        instance_dict_array.append(get_instance_info(instance))
+    tasks = dict((region, collector(region, connection)) for region, connection in connections)
+    results, errors = run_concurrently(tasks, MAX_REGION_WORKERS)
+    if errors:
+        module.fail_json(msg="Failed to gather facts in %s" % ", ".join(sorted(errors)),
+                         errors=dict((region, describe_error(e)) for region, e in errors.items()))
 
-    module.exit_json(instances=instance_dict_array)
+    instances = []
+    for region, connection in connections:
+        instances.extend(results[region])
+    module.exit_json(instances=instances)
 
 
 def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
-            filters = dict(default=None, type='dict')
+            filters = dict(default=None, type='dict'),
+            regions = dict(default=None, type='list'),
+            fields = dict(default=None, type='list'),
         )
     )
 
@@ -167,16 +274,20 @@ def main():
         module.fail_json(msg='boto required for this module')
 
     region, ec2_url, aws_connect_params = get_aws_connection_info(module)
+    regions = module.params.get('regions') or [region]
 
-    if region:
+    if not regions[0]:
+        module.fail_json(msg="region must be specified")
+
+    # Connections are opened here, one per region, as boto is not thread safe
+    connections = []
+    for region in regions:
         try:
-            connection = connect_to_aws(boto.ec2, region, **aws_connect_params)
+            connections.append((region, connect_to_aws(boto.ec2, region, **aws_connect_params)))
         except (boto.exception.NoAuthHandlerFound, AnsibleAWSError), e:
             module.fail_json(msg=str(e))
-    else:
-        module.fail_json(msg="region must be specified")
 
-    list_ec2_instances(connection, module)
+    list_ec2_instances(connections, module)
 
 # import module snippets
 from ansible.module_utils.basic import *
@@ -47,6 +47,19 @@ options:
       names and values are case sensitive.
     required: false
     default: {}
+  regions:
+    description:
+      - List of regions to gather facts from concurrently. Defaults to the region of the connection.
+    required: false
+    default: null
+    version_added: "2.3"
+  fields:
+    description:
+      - Only return these keys of every snapshot, e.g. C([snapshot_id, start_time, volume_id, tags]), to keep the \
+      result small on accounts with many snapshots.
+    required: false
+    default: null
+    version_added: "2.3"
 notes:
   - By default, the module will return all snapshots, including public ones. To limit results to snapshots owned by \
   the account use the filter 'owner-id'.
@@ -92,6 +105,18 @@ EXAMPLES = '''
     filters:
       status: error
 
+# Gather the ids and start times of the snapshots owned by the account in two regions
+- ec2_snapshot_facts:
+    regions:
+      - us-east-1
+      - eu-west-1
+    filters:
+      owner-id: 123456789012
+    fields:
+      - snapshot_id
+      - start_time
+      - region
+
 '''
 
 RETURN = '''
@@ -163,30 +188,117 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+import threading
 
-def list_ec2_snapshots(connection, module):
+# Snapshots requested per DescribeSnapshots call and regions queried at the same time
+PAGE_SIZE = 1000
+MAX_REGION_WORKERS = 8
 
-    snapshot_ids = module.params.get("snapshot_ids")
-    owner_ids = module.params.get("owner_ids")
-    restorable_by_user_ids = module.params.get("restorable_by_user_ids")
-    filters = ansible_dict_to_boto3_filter_list(module.params.get("filters"))
 
-    try:
-        snapshots = connection.describe_snapshots(SnapshotIds=snapshot_ids, OwnerIds=owner_ids, RestorableByUserIds=restorable_by_user_ids, Filters=filters)
-    except ClientError, e:
-        module.fail_json(msg=e.message)
+def project(info, fields):
+    """ Keep only the requested keys of a fact dict.
 
+    The full dict of an item is still built, but only this trimmed copy is
+    kept in the result.
+    """
+    if not fields:
+        return info
+    return dict((key, info[key]) for key in fields if key in info)
+
+
+def get_snapshot_info(snapshot, region):
     # Turn the boto3 result in to ansible_friendly_snaked_names
-    snaked_snapshots = []
-    for snapshot in snapshots['Snapshots']:
-        snaked_snapshots.append(camel_dict_to_snake_dict(snapshot))
+    snapshot_info = camel_dict_to_snake_dict(snapshot)
 
     # Turn the boto3 result in to ansible friendly tag dictionary
-    for snapshot in snaked_snapshots:
-        if 'tags' in snapshot:
-            snapshot['tags'] = boto3_tag_list_to_ansible_dict(snapshot['tags'])
+    if 'tags' in snapshot_info:
+        snapshot_info['tags'] = boto3_tag_list_to_ansible_dict(snapshot_info['tags'])
+
+    snapshot_info['region'] = region
+    return snapshot_info
+
+
+def iter_snapshots(connection, params):
+    """ Yield snapshots page by page using the DescribeSnapshots paginator """
+    pagination_config = {}
+    # MaxResults can not be combined with SnapshotIds
+    if not params.get('SnapshotIds'):
+        pagination_config['PageSize'] = PAGE_SIZE
+    paginator = connection.get_paginator('describe_snapshots')
+    for page in paginator.paginate(PaginationConfig=pagination_config, **params):
+        for snapshot in page['Snapshots']:
+            yield snapshot
+
 
-    module.exit_json(snapshots=snaked_snapshots)
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def list_ec2_snapshots(connections, module):
+
+    params = dict(
+        SnapshotIds=module.params.get("snapshot_ids"),
+        OwnerIds=module.params.get("owner_ids"),
+        RestorableByUserIds=module.params.get("restorable_by_user_ids"),
+        Filters=ansible_dict_to_boto3_filter_list(module.params.get("filters")),
+    )
+    fields = module.params.get("fields")
+
+    def collector(region, connection):
+        return lambda: [project(get_snapshot_info(snapshot, region), fields) for snapshot in iter_snapshots(connection, params)]
+
+    tasks = dict((region, collector(region, connection)) for region, connection in connections)
+    results, errors = run_concurrently(tasks, MAX_REGION_WORKERS)
+    if errors:
+        module.fail_json(msg="Failed to gather facts in %s" % ", ".join(sorted(errors)),
+                         errors=dict((region, describe_error(e)) for region, e in errors.items()))
+
+    snapshots = []
+    for region, connection in connections:
+        snapshots.extend(results[region])
+    module.exit_json(snapshots=snapshots)
 
 
 def main():
@@ -197,7 +309,9 @@ def main():
             snapshot_ids=dict(default=[], type='list'),
             owner_ids=dict(default=[], type='list'),
             restorable_by_user_ids=dict(default=[], type='list'),
-            filters=dict(default={}, type='dict')
+            filters=dict(default={}, type='dict'),
+            regions=dict(default=None, type='list'),
+            fields=dict(default=None, type='list'),
         )
     )
 
@@ -211,13 +325,17 @@ def main():
         module.fail_json(msg='boto3 required for this module')
 
     region, ec2_url, aws_connect_params = get_aws_connection_info(module, boto3=True)
+    regions = module.params.get('regions') or [region]
 
-    if region:
-        connection = boto3_conn(module, conn_type='client', resource='ec2', region=region, endpoint=ec2_url, **aws_connect_params)
-    else:
+    if not regions[0]:
         module.fail_json(msg="region must be specified")
 
-    list_ec2_snapshots(connection, module)
+    # Clients are created here, creating them from several threads is not safe
+    connections = []
+    for region in regions:
+        connections.append((region, boto3_conn(module, conn_type='client', resource='ec2', region=region, endpoint=ec2_url, **aws_connect_params)))
+
+    list_ec2_snapshots(connections, module)
 
 from ansible.module_utils.basic import *
 from ansible.module_utils.ec2 import *
@@ -27,6 +27,19 @@ options:
       - A dict of filters to apply. Each dict item consists of a filter key and a filter value. See U(http://docs.aws.amazon.com/AWSEC2/latest/APIReference/API_DescribeVolumes.html) for possible filters.
     required: false
     default: null
+  regions:
+    description:
+      - List of regions to gather facts from concurrently. Defaults to the region of the connection.
+      - Every returned item carries its I(region).
+    required: false
+    default: null
+    version_added: "2.3"
+  fields:
+    description:
+      - Only return these keys of every volume, e.g. C([id, size, status, attachment_set]), to keep the result small on large accounts.
+    required: false
+    default: null
+    version_added: "2.3"
 extends_documentation_fragment:
     - aws
     - ec2
@@ -53,6 +66,18 @@ EXAMPLES = '''
     filters:
       attachment.status: attached
 
+# Gather the id and size of the available volumes in two regions
+- ec2_vol_facts:
+    regions:
+      - us-east-1
+      - eu-west-1
+    filters:
+      status: available
+    fields:
+      - id
+      - size
+      - region
+
 '''
 
 # TODO: Disabled the RETURN as it was breaking docs building. Someone needs to
@@ -61,11 +86,18 @@ RETURN = '''# '''
 
 try:
     import boto.ec2
+    from boto.ec2.volume import Volume
     from boto.exception import BotoServerError
     HAS_BOTO = True
 except ImportError:
     HAS_BOTO = False
 
+import threading
+
+# Items requested per Describe call and regions queried at the same time
+PAGE_SIZE = 1000
+MAX_REGION_WORKERS = 8
+
 def get_volume_info(volume):
 
     attachment = volume.attach_data
@@ -91,27 +123,108 @@ def get_volume_info(volume):
     
     return volume_info
 
-def list_ec2_volumes(connection, module):
+def iter_volumes(connection, filters):
+    """ Yield volumes page by page, following the NextToken of DescribeVolumes.
+
+    boto's get_all_volumes() does not paginate, so the request it makes is
+    built here with MaxResults and NextToken added.
+    """
+    params = {'MaxResults': PAGE_SIZE}
+    if filters:
+        connection.build_filter_params(params, filters)
+    while True:
+        volumes = connection.get_list('DescribeVolumes', params, [('item', Volume)], verb='POST')
+        for volume in volumes:
+            yield volume
+        if not volumes.next_token:
+            break
+        params['NextToken'] = volumes.next_token
+
+
+def project(info, fields):
+    """ Keep only the requested keys of a fact dict.
+
+    The full dict of an item is still built, but only this trimmed copy is
+    kept in the result.
+    """
+    if not fields:
+        return info
+    return dict((key, info[key]) for key in fields if key in info)
+
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def list_ec2_volumes(connections, module):
 
     filters = module.params.get("filters")
-    volume_dict_array = []
+    fields = module.params.get("fields")
 
-    try:
-        all_volumes = connection.get_all_volumes(filters=filters)
-    except BotoServerError as e:
-        module.fail_json(msg=e.message)
+    def collector(region, connection):
+        return lambda: [project(get_volume_info(volume), fields) for volume in iter_volumes(connection, filters)]
 
-    for volume in all_volumes:
-        volume_dict_array.append(get_volume_info(volume))
+    tasks = dict((region, collector(region, connection)) for region, connection in connections)
+    results, errors = run_concurrently(tasks, MAX_REGION_WORKERS)
+    if errors:
+        module.fail_json(msg="Failed to gather facts in %s" % ", ".join(sorted(errors)),
+                         errors=dict((region, describe_error(e)) for region, e in errors.items()))
 
-    module.exit_json(volumes=volume_dict_array)
+    volumes = []
+    for region, connection in connections:
+        volumes.extend(results[region])
+    module.exit_json(volumes=volumes)
 
 
 def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
-            filters = dict(default=None, type='dict')
+            filters = dict(default=None, type='dict'),
+            regions = dict(default=None, type='list'),
+            fields = dict(default=None, type='list'),
         )
     )
 
@@ -121,16 +234,20 @@ def main():
         module.fail_json(msg='boto required for this module')
 
     region, ec2_url, aws_connect_params = get_aws_connection_info(module)
+    regions = module.params.get('regions') or [region]
 
-    if region:
+    if not regions[0]:
+        module.fail_json(msg="region must be specified")
+
+    # Connections are opened here, one per region, as boto is not thread safe
+    connections = []
+    for region in regions:
         try:
-            connection = connect_to_aws(boto.ec2, region, **aws_connect_params)
-        except (boto.exception.NoAuthHandlerFound, StandardError), e:
+            connections.append((region, connect_to_aws(boto.ec2, region, **aws_connect_params)))
+        except (boto.exception.NoAuthHandlerFound, AnsibleAWSError), e:
             module.fail_json(msg=str(e))
-    else:
-        module.fail_json(msg="region must be specified")
 
-    list_ec2_volumes(connection, module)
+    list_ec2_volumes(connections, module)
 
 from ansible.module_utils.basic import *
 from ansible.module_utils.ec2 import *
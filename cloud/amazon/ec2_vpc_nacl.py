@@ -163,43 +163,44 @@ def load_tags(module):
     return tags
 
 
-def subnets_removed(nacl_id, subnets, client, module):
-    results = find_acl_by_id(nacl_id, client, module)
-    associations = results['NetworkAcls'][0]['Associations']
-    subnet_ids = [assoc['SubnetId'] for assoc in associations]
-    return [subnet for subnet in subnet_ids if subnet not in subnets]
+def describe_vpc_nacls(client, module):
+    """Snapshot the NACLs of the VPC with a single describe call.
 
+    Returns the NACL tagged with the requested name (or None), the id of the
+    default NACL of the VPC and a dict mapping every subnet of the VPC to its
+    current NACL association id.
+    """
+    try:
+        response = client.describe_network_acls(Filters=[
+            {'Name': 'vpc-id', 'Values': [module.params.get('vpc_id')]}])
+    except botocore.exceptions.ClientError as e:
+        module.fail_json(msg=str(e))
 
-def subnets_added(nacl_id, subnets, client, module):
-    results = find_acl_by_id(nacl_id, client, module)
-    associations = results['NetworkAcls'][0]['Associations']
-    subnet_ids = [assoc['SubnetId'] for assoc in associations]
-    return [subnet for subnet in subnets if subnet not in subnet_ids]
+    snapshot = dict(nacl=None, default_nacl_id=None, associations=dict())
+    for nacl in response['NetworkAcls']:
+        if nacl['IsDefault']:
+            snapshot['default_nacl_id'] = nacl['NetworkAclId']
+        tags = dict((t['Key'], t['Value']) for t in nacl.get('Tags', []))
+        if snapshot['nacl'] is None and tags.get('Name') == module.params.get('name'):
+            snapshot['nacl'] = nacl
+        for assoc in nacl['Associations']:
+            snapshot['associations'][assoc['SubnetId']] = assoc['NetworkAclAssociationId']
+    return snapshot
 
 
-def subnets_changed(nacl, client, module):
+def subnets_changed(snapshot, client, module):
     changed = False
-    response = {}
-    vpc_id = module.params.get('vpc_id')
-    nacl_id = nacl['NetworkAcls'][0]['NetworkAclId']
-    subnets = subnets_to_associate(nacl, client, module)
-    if not subnets:
-        default_nacl_id = find_default_vpc_nacl(vpc_id, client, module)[0]
-        subnets = find_subnet_ids_by_nacl_id(nacl_id, client, module)
-        if subnets:
-            replace_network_acl_association(default_nacl_id, subnets, client, module)
-            changed = True
-            return changed
-        changed = False
-        return changed
-    subs_added = subnets_added(nacl_id, subnets, client, module)
+    nacl_id = snapshot['nacl']['NetworkAclId']
+    current = [assoc['SubnetId'] for assoc in snapshot['nacl']['Associations']]
+    subnets = subnets_to_associate(client, module)
+    subs_added = [subnet for subnet in subnets if subnet not in current]
     if subs_added:
-        replace_network_acl_association(nacl_id, subs_added, client, module)
+        replace_network_acl_association(nacl_id, subs_added, snapshot['associations'], client, module)
         changed = True
-    subs_removed = subnets_removed(nacl_id, subnets, client, module)
+    # Subnets that are no longer listed go back to the default NACL of the VPC
+    subs_removed = [subnet for subnet in current if subnet not in subnets]
     if subs_removed:
-        default_nacl_id = find_default_vpc_nacl(vpc_id, client, module)[0]
-        replace_network_acl_association(default_nacl_id, subs_removed, client, module)
+        replace_network_acl_association(snapshot['default_nacl_id'], subs_removed, snapshot['associations'], client, module)
         changed = True
     return changed
 
@@ -210,13 +211,10 @@ def nacls_changed(nacl, client, module):
     params['egress'] = module.params.get('egress')
     params['ingress'] = module.params.get('ingress')
 
-    nacl_id = nacl['NetworkAcls'][0]['NetworkAclId']
-    nacl = describe_network_acl(client, module)
-    entries = nacl['NetworkAcls'][0]['Entries']
-    tmp_egress = [entry for entry in entries if entry['Egress'] is True and DEFAULT_EGRESS !=entry]
-    tmp_ingress = [entry for entry in entries if entry['Egress'] is False]
-    egress = [rule for rule in tmp_egress if DEFAULT_EGRESS != rule]
-    ingress = [rule for rule in tmp_ingress if DEFAULT_INGRESS != rule]
+    nacl_id = nacl['NetworkAclId']
+    entries = nacl['Entries']
+    egress = [rule for rule in entries if rule['Egress'] is True and DEFAULT_EGRESS != rule]
+    ingress = [rule for rule in entries if rule['Egress'] is False and DEFAULT_INGRESS != rule]
     if rules_changed(egress, params['egress'], True, nacl_id, client, module):
         changed = True
     if rules_changed(ingress, params['ingress'], False, nacl_id, client, module):
@@ -224,51 +222,45 @@ def nacls_changed(nacl, client, module):
     return changed
 
 
-def tags_changed(nacl_id, client, module):
-    changed = False
-    tags = dict()
-    if module.params.get('tags'):
-        tags = module.params.get('tags')
-    tags['Name'] = module.params.get('name')
-    nacl = find_acl_by_id(nacl_id, client, module)
-    if nacl['NetworkAcls']:
-        nacl_values = [t.values() for t in nacl['NetworkAcls'][0]['Tags']]
-        nacl_tags = [item for sublist in nacl_values for item in sublist]
-        tag_values = [[key, str(value)] for key, value in tags.iteritems()]
-        tags = [item for sublist in tag_values for item in sublist]
-        if sorted(nacl_tags) == sorted(tags):
-            changed = False
-            return changed
-        else:
-            delete_tags(nacl_id, client, module)
-            create_tags(nacl_id, client, module)
-            changed = True
-            return changed
-    return changed
+def tags_changed(nacl, client, module):
+    current = dict((t['Key'], t['Value']) for t in nacl.get('Tags', []))
+    tags = dict((t['Key'], t['Value']) for t in load_tags(module))
+    if current == tags:
+        return False
+    delete_tags(nacl['NetworkAclId'], client, module)
+    create_tags(nacl['NetworkAclId'], client, module)
+    return True
 
 
 def rules_changed(aws_rules, param_rules, Egress, nacl_id, client, module):
+    """Apply the minimal set of entry changes, keyed by rule number.
+
+    Rules whose number exists on both sides are replaced in place, so there
+    is no window where the rule is missing. New rules are created before
+    stale ones are deleted for the same reason.
+    """
     changed = False
-    rules = list()
+    rules = dict()
     for entry in param_rules:
-        rules.append(process_rule_entry(entry, Egress))
-    if rules == aws_rules:
-        return changed
-    else:
-        removed_rules = [x for x in aws_rules if x not in rules]
-        if removed_rules:
-            params = dict()
-            for rule in removed_rules:
-                params['NetworkAclId'] = nacl_id
-                params['RuleNumber'] = rule['RuleNumber']
-                params['Egress'] = Egress
-                delete_network_acl_entry(params, client, module)
-            changed = True
-        added_rules = [x for x in rules if x not in aws_rules]
-        if added_rules:
-            for rule in added_rules:
-                rule['NetworkAclId'] = nacl_id
-                create_network_acl_entry(rule, client, module)
+        rule = process_rule_entry(entry, Egress)
+        rules[rule['RuleNumber']] = rule
+    current = dict((rule['RuleNumber'], rule) for rule in aws_rules)
+
+    for number in sorted(rules):
+        rule = rules[number]
+        if rule == current.get(number):
+            continue
+        rule['NetworkAclId'] = nacl_id
+        if number in current:
+            replace_network_acl_entry(rule, client, module)
+        else:
+            create_network_acl_entry(rule, client, module)
+        changed = True
+
+    for number in sorted(current):
+        if number not in rules:
+            params = dict(NetworkAclId=nacl_id, RuleNumber=number, Egress=Egress)
+            delete_network_acl_entry(params, client, module)
             changed = True
     return changed
 
@@ -291,43 +283,43 @@ def process_rule_entry(entry, Egress):
 def restore_default_associations(assoc_ids, default_nacl_id, client, module):
     if assoc_ids:
         params = dict()
-        params['NetworkAclId'] = default_nacl_id[0]
+        params['NetworkAclId'] = default_nacl_id
         for assoc_id in assoc_ids:
             params['AssociationId'] = assoc_id
             restore_default_acl_association(params, client, module)
         return True
 
 
-def construct_acl_entries(nacl, client, module):
+def construct_acl_entries(nacl_id, client, module):
     for entry in module.params.get('ingress'):
         params = process_rule_entry(entry, Egress=False)
-        params['NetworkAclId'] = nacl['NetworkAcl']['NetworkAclId']
+        params['NetworkAclId'] = nacl_id
         create_network_acl_entry(params, client, module)
     for rule in module.params.get('egress'):
         params = process_rule_entry(rule, Egress=True)
-        params['NetworkAclId'] = nacl['NetworkAcl']['NetworkAclId']
+        params['NetworkAclId'] = nacl_id
         create_network_acl_entry(params, client, module)
 
 
 ## Module invocations
 def setup_network_acl(client, module):
     changed = False
-    nacl = describe_network_acl(client, module)
-    if not nacl['NetworkAcls']:
+    snapshot = describe_vpc_nacls(client, module)
+    if snapshot['nacl'] is None:
         nacl = create_network_acl(module.params.get('vpc_id'), client, module)
         nacl_id = nacl['NetworkAcl']['NetworkAclId']
         create_tags(nacl_id, client, module)
-        subnets = subnets_to_associate(nacl, client, module)
-        replace_network_acl_association(nacl_id, subnets, client, module)
-        construct_acl_entries(nacl, client, module)
+        subnets = subnets_to_associate(client, module)
+        replace_network_acl_association(nacl_id, subnets, snapshot['associations'], client, module)
+        construct_acl_entries(nacl_id, client, module)
         changed = True
-        return(changed, nacl['NetworkAcl']['NetworkAclId'])
+        return(changed, nacl_id)
     else:
         changed = False
-        nacl_id = nacl['NetworkAcls'][0]['NetworkAclId']
-        subnet_result = subnets_changed(nacl, client, module)
-        nacl_result = nacls_changed(nacl, client, module)
-        tag_result = tags_changed(nacl_id, client, module)
+        nacl_id = snapshot['nacl']['NetworkAclId']
+        subnet_result = subnets_changed(snapshot, client, module)
+        nacl_result = nacls_changed(snapshot['nacl'], client, module)
+        tag_result = tags_changed(snapshot['nacl'], client, module)
         if subnet_result is True or nacl_result is True or tag_result is True:
             changed = True
             return(changed, nacl_id)
@@ -338,25 +330,19 @@ def remove_network_acl(client, module):
     changed = False
     result = dict()
     vpc_id = module.params.get('vpc_id')
-    nacl = describe_network_acl(client, module)
-    if nacl['NetworkAcls']:
-        nacl_id = nacl['NetworkAcls'][0]['NetworkAclId']
-        associations = nacl['NetworkAcls'][0]['Associations']
+    snapshot = describe_vpc_nacls(client, module)
+    if snapshot['nacl']:
+        nacl_id = snapshot['nacl']['NetworkAclId']
+        associations = snapshot['nacl']['Associations']
         assoc_ids = [a['NetworkAclAssociationId'] for a in associations]
-        default_nacl_id = find_default_vpc_nacl(vpc_id, client, module)
+        default_nacl_id = snapshot['default_nacl_id']
         if not default_nacl_id:
             result = {vpc_id: "Default NACL ID not found - Check the VPC ID"}
             return changed, result
-        if restore_default_associations(assoc_ids, default_nacl_id, client, module):
-            delete_network_acl(nacl_id, client, module)
-            changed = True
-            result[nacl_id] = "Successfully deleted"
-            return changed, result
-        if not assoc_ids: 
-            delete_network_acl(nacl_id, client, module)
-            changed = True
-            result[nacl_id] = "Successfully deleted"
-            return changed, result            
+        restore_default_associations(assoc_ids, default_nacl_id, client, module)
+        delete_network_acl(nacl_id, client, module)
+        changed = True
+        result[nacl_id] = "Successfully deleted"
     return changed, result
 
 
@@ -379,7 +365,6 @@ def create_network_acl_entry(params, client, module):
 
 def create_tags(nacl_id, client, module):
     try:
-        delete_tags(nacl_id, client, module)
         client.create_tags(Resources=[nacl_id], Tags=load_tags(module))
     except botocore.exceptions.ClientError as e:
         module.fail_json(msg=str(e))
@@ -406,80 +391,24 @@ def delete_tags(nacl_id, client, module):
         module.fail_json(msg=str(e))
 
 
-def describe_acl_associations(subnets, client, module):
-    if not subnets:
-        return []
-    try:
-        results = client.describe_network_acls(Filters=[
-            {'Name': 'association.subnet-id', 'Values': subnets}
-        ])
-    except botocore.exceptions.ClientError as e:
-        module.fail_json(msg=str(e))
-    associations = results['NetworkAcls'][0]['Associations']
-    return [a['NetworkAclAssociationId'] for a in associations if a['SubnetId'] in subnets]
-
-
-def describe_network_acl(client, module):
-    try:
-        nacl = client.describe_network_acls(Filters=[
-            {'Name': 'tag:Name', 'Values': [module.params.get('name')]}
-        ])
-    except botocore.exceptions.ClientError as e:
-        module.fail_json(msg=str(e))
-    return nacl
-
-
-def find_acl_by_id(nacl_id, client, module):
-    try:
-        return client.describe_network_acls(NetworkAclIds=[nacl_id])
-    except botocore.exceptions.ClientError as e:
-        module.fail_json(msg=str(e))
-
-
-def find_default_vpc_nacl(vpc_id, client, module):
-    try:
-        response = client.describe_network_acls(Filters=[
-            {'Name': 'vpc-id', 'Values': [vpc_id]}])
-    except botocore.exceptions.ClientError as e:
-        module.fail_json(msg=str(e))
-    nacls = response['NetworkAcls']
-    return [n['NetworkAclId'] for n in nacls if n['IsDefault'] == True]
-
-
-def find_subnet_ids_by_nacl_id(nacl_id, client, module):
-    try:
-        results = client.describe_network_acls(Filters=[
-            {'Name': 'association.network-acl-id', 'Values': [nacl_id]}
-        ])
-    except botocore.exceptions.ClientError as e:
-        module.fail_json(msg=str(e))
-    if results['NetworkAcls']:
-        associations = results['NetworkAcls'][0]['Associations']
-        return [s['SubnetId'] for s in associations if s['SubnetId']]
-    else:
-        return []
-
-
-def replace_network_acl_association(nacl_id, subnets, client, module):
+def replace_network_acl_association(nacl_id, subnets, associations, client, module):
     params = dict()
     params['NetworkAclId'] = nacl_id
-    for association in describe_acl_associations(subnets, client, module):
-        params['AssociationId'] = association
+    for subnet in subnets:
+        if subnet not in associations:
+            continue
+        params['AssociationId'] = associations[subnet]
         try:
             client.replace_network_acl_association(**params)
         except botocore.exceptions.ClientError as e:
             module.fail_json(msg=str(e))
 
 
-def replace_network_acl_entry(entries, Egress, nacl_id, client, module):
-    params = dict()
-    for entry in entries:
-        params = entry
-        params['NetworkAclId'] = nacl_id
-        try:
-            client.replace_network_acl_entry(**params)
-        except botocore.exceptions.ClientError as e:
-            module.fail_json(msg=str(e))
+def replace_network_acl_entry(params, client, module):
+    try:
+        client.replace_network_acl_entry(**params)
+    except botocore.exceptions.ClientError as e:
+        module.fail_json(msg=str(e))
 
 
 def restore_default_acl_association(params, client, module):
@@ -489,7 +418,7 @@ def restore_default_acl_association(params, client, module):
         module.fail_json(msg=str(e))
 
 
-def subnets_to_associate(nacl, client, module):
+def subnets_to_associate(client, module):
     params = list(module.params.get('subnets'))
     if not params:
         return []
@@ -38,9 +38,19 @@ options:
   subnet_id:
     description:
       - The id of the subnet to create the NAT Gateway in. This is required
-        with the present option.
+        with the present option, unless subnet_ids is given.
     required: false
     default: None
+  subnet_ids:
+    description:
+      - List of subnets, typically one per availability zone, that should each
+        have a NAT Gateway. A new EIP is allocated and a NAT Gateway is created,
+        concurrently, in every subnet that has no pending or available NAT
+        Gateway yet. Subnets that have one are left alone.
+      - With wait, all new NAT Gateways are waited for together.
+    required: false
+    default: None
+    version_added: "2.3"
   allocation_id:
     description:
       - The id of the elastic IP allocation. If this is not passed and the
@@ -137,6 +147,17 @@ EXAMPLES = '''
     if_exist_do_not_create: true
   register: new_nat_gateway
 
+- name: Create a nat gateway in every availability zone and wait for all of them.
+  ec2_vpc_nat_gateway:
+    state: present
+    subnet_ids:
+      - subnet-12345678
+      - subnet-23456789
+      - subnet-34567890
+    wait: yes
+    region: ap-southeast-2
+  register: new_nat_gateways
+
 - name: Delete nat gateway using discovered nat gateways from facts module.
   ec2_vpc_nat_gateway:
     state: absent
@@ -203,6 +224,10 @@ nat_gateway_addresses:
           'allocation_id': 'eipalloc-12345'
       }
   ]
+nat_gateways:
+  description: The NAT Gateways of every subnet, in the order of subnet_ids, each with the keys described above.
+  returned: When subnet_ids is given.
+  type: list
 '''
 
 try:
@@ -212,9 +237,11 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+import copy
 import datetime
 import random
 import re
+import threading
 import time
 
 from dateutil.tz import tzutc
@@ -266,6 +293,12 @@ DRY_RUN_ALLOCATION_UNCONVERTED = {
 
 DRY_RUN_MSGS = 'DryRun Mode:'
 
+# Longest pause between two DescribeNatGateways calls while waiting
+MAX_POLL_DELAY = 15
+
+# Subnets in which NAT Gateways are created at the same time
+MAX_CREATE_WORKERS = 8
+
 
 def convert_to_lower(data):
     """Convert all uppercase keys in dict with lowercase_
@@ -306,6 +339,36 @@ def convert_to_lower(data):
     return results
 
 
+def describe_nat_gateways_pages(client, params):
+    """Yield every NAT Gateway matching params, following NextToken
+    Args:
+        client (botocore.client.EC2): Boto3 client
+        params (dict): Parameters of DescribeNatGateways.
+
+    Basic Usage:
+        >>> client = boto3.client('ec2')
+        >>> params = {'NatGatewayIds': ['nat-123456789']}
+        >>> list(describe_nat_gateways_pages(client, params))
+        [
+            {
+                'NatGatewayId': 'nat-123456789',
+                ...
+            }
+        ]
+
+    Returns:
+        Generator of dict
+    """
+    params = dict(params)
+    while True:
+        response = client.describe_nat_gateways(**params)
+        for gw in response['NatGateways']:
+            yield gw
+        if not response.get('NextToken'):
+            break
+        params['NextToken'] = response['NextToken']
+
+
 def get_nat_gateways(client, subnet_id=None, nat_gateway_id=None,
                      states=None, check_mode=False):
     """Retrieve a list of NAT Gateways
@@ -313,8 +376,9 @@ def get_nat_gateways(client, subnet_id=None, nat_gateway_id=None,
         client (botocore.client.EC2): Boto3 client
 
     Kwargs:
-        subnet_id (str): The subnet_id the nat resides in.
-        nat_gateway_id (str): The Amazon nat id.
+        subnet_id (str or list): The subnet_id the nat resides in, or a list
+            of subnet ids.
+        nat_gateway_id (str or list): The Amazon nat id, or a list of ids.
         states (list): States available (pending, failed, available, deleting, and deleted)
             default=None
 
@@ -351,13 +415,23 @@ def get_nat_gateways(client, subnet_id=None, nat_gateway_id=None,
     existing_gateways = list()
     if not states:
         states = ['available', 'pending']
-    if nat_gateway_id:
-        params['NatGatewayIds'] = [nat_gateway_id]
+    if isinstance(nat_gateway_id, list):
+        nat_gateway_ids = nat_gateway_id
+    elif nat_gateway_id:
+        nat_gateway_ids = [nat_gateway_id]
+    else:
+        nat_gateway_ids = []
+    if isinstance(subnet_id, list):
+        subnet_ids = subnet_id
+    else:
+        subnet_ids = [subnet_id]
+    if nat_gateway_ids:
+        params['NatGatewayIds'] = nat_gateway_ids
     else:
         params['Filter'] = [
             {
                 'Name': 'subnet-id',
-                'Values': [subnet_id]
+                'Values': subnet_ids
             },
             {
                 'Name': 'state',
@@ -367,18 +441,16 @@ def get_nat_gateways(client, subnet_id=None, nat_gateway_id=None,
 
     try:
         if not check_mode:
-            gateways = client.describe_nat_gateways(**params)['NatGateways']
-            if gateways:
-                for gw in gateways:
-                    existing_gateways.append(convert_to_lower(gw))
+            for gw in describe_nat_gateways_pages(client, params):
+                existing_gateways.append(convert_to_lower(gw))
             gateways_retrieved = True
         else:
             gateways_retrieved = True
-            if nat_gateway_id:
-                if DRY_RUN_GATEWAYS[0]['nat_gateway_id'] == nat_gateway_id:
+            if nat_gateway_ids:
+                if DRY_RUN_GATEWAYS[0]['nat_gateway_id'] in nat_gateway_ids:
                     existing_gateways = DRY_RUN_GATEWAYS
             elif subnet_id:
-                if DRY_RUN_GATEWAYS[0]['subnet_id'] == subnet_id:
+                if DRY_RUN_GATEWAYS[0]['subnet_id'] in subnet_ids:
                     existing_gateways = DRY_RUN_GATEWAYS
             err_msg = '{0} Retrieving gateways'.format(DRY_RUN_MSGS)
 
@@ -427,50 +499,100 @@ def wait_for_status(client, wait_timeout, nat_gateway_id, status,
     Returns:
         Tuple (bool, str, dict)
     """
-    polling_increment_secs = 5
-    wait_timeout = time.time() + wait_timeout
+    status_achieved, err_msg, nat_gateways = (
+        wait_for_gateways(
+            client, wait_timeout, [nat_gateway_id], status,
+            check_mode=check_mode
+        )
+    )
+    return status_achieved, err_msg, nat_gateways.get(nat_gateway_id, dict())
+
+
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+
+def wait_for_gateways(client, wait_timeout, nat_gateway_ids, status,
+                      check_mode=False):
+    """Wait for several NAT Gateways to reach a status, with one
+    DescribeNatGateways call per poll for all of them.
+    Args:
+        client (botocore.client.EC2): Boto3 client
+        wait_timeout (int): Number of seconds to wait, until this timeout is reached.
+        nat_gateway_ids (list): The Amazon nat ids.
+        status (str): The status to wait for.
+            examples. status=available, status=deleted
+
+    Basic Usage:
+        >>> client = boto3.client('ec2')
+        >>> nat_gateway_ids = ['nat-123456789', 'nat-234567891']
+        >>> wait_for_gateways(client, 300, nat_gateway_ids, 'available')
+        [
+            true,
+            "",
+            {
+                "nat-123456789": {
+                    "nat_gateway_id": "nat-123456789",
+                    "state": "available",
+                    ...
+                },
+                "nat-234567891": {
+                    "nat_gateway_id": "nat-234567891",
+                    "state": "available",
+                    ...
+                }
+            }
+        ]
+
+    Returns:
+        Tuple (bool, str, dict)
+    """
+    deadline = time.time() + wait_timeout
     status_achieved = False
-    nat_gateway = dict()
+    nat_gateways = dict()
     states = ['pending', 'failed', 'available', 'deleting', 'deleted']
     err_msg = ""
+    attempt = 0
 
-    while wait_timeout > time.time():
-        try:
-            gws_retrieved, err_msg, nat_gateways = (
-                get_nat_gateways(
-                    client, nat_gateway_id=nat_gateway_id,
-                    states=states, check_mode=check_mode
-                )
+    while True:
+        # Errors while retrieving are retried, as new gateways may not be
+        # visible yet.
+        gws_retrieved, _, gateways = (
+            get_nat_gateways(
+                client, nat_gateway_id=nat_gateway_ids,
+                states=states, check_mode=check_mode
             )
-            if gws_retrieved and nat_gateways:
-                nat_gateway = nat_gateways[0]
-                if check_mode:
-                    nat_gateway['state'] = status
+        )
+        for nat_gateway in gateways:
+            if check_mode:
+                nat_gateway['state'] = status
+            nat_gateways[nat_gateway['nat_gateway_id']] = nat_gateway
 
-                if nat_gateway.get('state') == status:
-                    status_achieved = True
-                    break
+            if nat_gateway.get('state') == 'failed':
+                err_msg = nat_gateway.get('failure_message')
 
-                elif nat_gateway.get('state') == 'failed':
+            elif nat_gateway.get('state') == 'pending':
+                if 'failure_message' in nat_gateway:
                     err_msg = nat_gateway.get('failure_message')
-                    break
 
-                elif nat_gateway.get('state') == 'pending':
-                    if 'failure_message' in nat_gateway:
-                        err_msg = nat_gateway.get('failure_message')
-                        status_achieved = False
-                        break
-
-            else:
-                time.sleep(polling_increment_secs)
+        status_achieved = all(
+            nat_gateways.get(gw_id, {}).get('state') == status
+            for gw_id in nat_gateway_ids
+        )
 
-        except botocore.exceptions.ClientError as e:
-            err_msg = str(e)
+        remaining = deadline - time.time()
+        if status_achieved or err_msg or remaining <= 0:
+            break
+        time.sleep(min(backoff_delay(attempt, 1, MAX_POLL_DELAY), remaining))
+        attempt += 1
 
-    if not status_achieved:
+    if not status_achieved and not err_msg:
         err_msg = "Wait time out reached, while waiting for results"
 
-    return status_achieved, err_msg, nat_gateway
+    return status_achieved, err_msg, nat_gateways
 
 
 def gateway_in_subnet_exists(client, subnet_id, allocation_id=None,
@@ -737,7 +859,7 @@ def create(client, subnet_id, allocation_id, client_token=None,
         if not check_mode:
             result = client.create_nat_gateway(**params)["NatGateway"]
         else:
-            result = DRY_RUN_GATEWAY_UNCONVERTED[0]
+            result = copy.deepcopy(DRY_RUN_GATEWAY_UNCONVERTED[0])
             result['CreateTime'] = datetime.datetime.utcnow()
             result['NatGatewayAddresses'][0]['AllocationId'] = allocation_id
             result['SubnetId'] = subnet_id
@@ -890,6 +1012,163 @@ def pre_create(client, subnet_id, allocation_id=None, eip_address=None,
     return success, changed, err_msg, results
 
 
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def create_in_subnets(client, subnet_ids, wait=False, wait_timeout=0,
+                      check_mode=False):
+    """Create a NAT Gateway with a new EIP in every subnet that has none.
+    EIPs are allocated and gateways created concurrently, and all new
+    gateways are waited for together.
+    Args:
+        client (botocore.client.EC2): Boto3 client
+        subnet_ids (list): The subnet ids that should have a NAT Gateway.
+
+    Kwargs:
+        wait (bool): Wait for the new nats to be available before returning.
+            default = False
+        wait_timeout (int): Number of seconds to wait, until this timeout is reached.
+            default = 0
+
+    Basic Usage:
+        >>> client = boto3.client('ec2')
+        >>> subnet_ids = ['subnet-1234567', 'subnet-2345678']
+        >>> create_in_subnets(client, subnet_ids, wait=True, wait_timeout=500)
+        [
+            true,
+            true,
+            "",
+            [
+                {
+                    "nat_gateway_id": "nat-123456789",
+                    "subnet_id": "subnet-1234567",
+                    "state": "available",
+                    ...
+                },
+                {
+                    "nat_gateway_id": "nat-234567891",
+                    "subnet_id": "subnet-2345678",
+                    "state": "available",
+                    ...
+                }
+            ]
+        ]
+
+    Returns:
+        Tuple (bool, bool, str, list)
+    """
+    gws_retrieved, err_msg, gateways = (
+        get_nat_gateways(client, subnet_ids, check_mode=check_mode)
+    )
+    if not gws_retrieved:
+        return False, False, err_msg, list()
+
+    existing = dict()
+    for gw in gateways:
+        existing.setdefault(gw['subnet_id'], gw)
+
+    def create_in_subnet(subnet_id):
+        def run():
+            success, msg, allocation_id = (
+                allocate_eip_address(client, check_mode=check_mode)
+            )
+            if not success:
+                raise Exception(msg)
+            success, _, msg, result = create(
+                client, subnet_id, allocation_id, check_mode=check_mode
+            )
+            if not success:
+                # Do not leave the new EIP behind
+                release_address(client, allocation_id, check_mode)
+                raise Exception(msg)
+            return convert_to_lower(result)
+        return run
+
+    tasks = dict(
+        (subnet_id, create_in_subnet(subnet_id))
+        for subnet_id in subnet_ids if subnet_id not in existing
+    )
+    results, errors = run_concurrently(tasks, MAX_CREATE_WORKERS)
+
+    changed = bool(results)
+    if errors:
+        err_msg = '; '.join(
+            'subnet {0}: {1}'.format(subnet_id, describe_error(errors[subnet_id]))
+            for subnet_id in sorted(errors)
+        )
+        return False, changed, err_msg, list(results.values())
+
+    err_msg = 'NAT gateways exist in all subnets'
+    if results and wait:
+        nat_gateway_ids = [gw['nat_gateway_id'] for gw in results.values()]
+        success, err_msg, available = (
+            wait_for_gateways(
+                client, wait_timeout, nat_gateway_ids, 'available',
+                check_mode=check_mode
+            )
+        )
+        if not success:
+            return False, changed, err_msg, list(results.values())
+        if not check_mode:
+            for subnet_id, gw in results.items():
+                results[subnet_id] = available.get(gw['nat_gateway_id'], gw)
+    if results:
+        err_msg = 'NAT gateways created in {0}'.format(
+            ', '.join(sorted(results))
+        )
+
+    gateways = list()
+    for subnet_id in subnet_ids:
+        if subnet_id in results:
+            gateways.append(results[subnet_id])
+        else:
+            gateways.append(existing[subnet_id])
+    return True, changed, err_msg, gateways
+
+
 def remove(client, nat_gateway_id, wait=False, wait_timeout=0,
            release_eip=False, check_mode=False):
     """Delete an Amazon NAT Gateway.
@@ -994,6 +1273,7 @@ def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(dict(
         subnet_id=dict(type='str'),
+        subnet_ids=dict(type='list'),
         eip_address=dict(type='str'),
         allocation_id=dict(type='str'),
         if_exist_do_not_create=dict(type='bool', default=False),
@@ -1009,7 +1289,11 @@ def main():
         argument_spec=argument_spec,
         supports_check_mode=True,
         mutually_exclusive=[
-            ['allocation_id', 'eip_address']
+            ['allocation_id', 'eip_address'],
+            ['subnet_id', 'subnet_ids'],
+            ['subnet_ids', 'allocation_id'],
+            ['subnet_ids', 'eip_address'],
+            ['subnet_ids', 'client_token'],
         ]
     )
 
@@ -1020,6 +1304,7 @@ def main():
     state = module.params.get('state').lower()
     check_mode = module.check_mode
     subnet_id = module.params.get('subnet_id')
+    subnet_ids = module.params.get('subnet_ids')
     allocation_id = module.params.get('allocation_id')
     eip_address = module.params.get('eip_address')
     nat_gateway_id = module.params.get('nat_gateway_id')
@@ -1045,7 +1330,15 @@ def main():
     changed = False
     err_msg = ''
 
-    if state == 'present':
+    if state == 'present' and subnet_ids:
+        success, changed, err_msg, gateways = (
+            create_in_subnets(
+                client, subnet_ids, wait, wait_timeout, check_mode=check_mode
+            )
+        )
+        results = dict(nat_gateways=gateways)
+
+    elif state == 'present':
         if not subnet_id:
             module.fail_json(msg='subnet_id is required for creation')
 
@@ -142,60 +142,68 @@ SUBNET_RE = re.compile('^subnet-[A-z0-9]+$')
 ROUTE_TABLE_RE = re.compile('^rtb-[A-z0-9]+$')
 
 
-def find_subnets(vpc_conn, vpc_id, identified_subnets):
+def get_vpc_snapshot(vpc_conn, vpc_id, include_subnets=False):
+    """
+    Describes the route tables, and optionally the subnets, of a VPC once and
+    indexes them by id, subnet association, CIDR and Name tag so that the rest
+    of the run does not have to go back to the API for lookups.
+    """
+    snapshot = {
+        'route_tables': {},
+        'associations': {},
+        'subnets': {},
+        'subnets_by_cidr': {},
+        'subnets_by_name': {},
+    }
+    for route_table in vpc_conn.get_all_route_tables(filters={'vpc_id': vpc_id}):
+        snapshot['route_tables'][route_table.id] = route_table
+        for association in route_table.associations:
+            if association.subnet_id:
+                snapshot['associations'][association.subnet_id] = association
+
+    if include_subnets:
+        for subnet in vpc_conn.get_all_subnets(filters={'vpc_id': vpc_id}):
+            snapshot['subnets'][subnet.id] = subnet
+            snapshot['subnets_by_cidr'][subnet.cidr_block] = subnet
+            name = subnet.tags.get('Name')
+            if name is not None:
+                snapshot['subnets_by_name'].setdefault(name, []).append(subnet)
+
+    return snapshot
+
+
+def find_subnets(snapshot, identified_subnets):
     """
     Finds a list of subnets, each identified either by a raw ID, a unique
-    'Name' tag, or a CIDR such as 10.0.0.0/8.
+    'Name' tag, or a CIDR such as 10.0.0.0/8, in a VPC snapshot built with
+    include_subnets=True.
 
     Note that this function is duplicated in other ec2 modules, and should
     potentially be moved into potentially be moved into a shared module_utils
     """
-    subnet_ids = []
-    subnet_names = []
-    subnet_cidrs = []
+    subnets = []
     for subnet in (identified_subnets or []):
         if re.match(SUBNET_RE, subnet):
-            subnet_ids.append(subnet)
-        elif re.match(CIDR_RE, subnet):
-            subnet_cidrs.append(subnet)
-        else:
-            subnet_names.append(subnet)
-
-    subnets_by_id = []
-    if subnet_ids:
-        subnets_by_id = vpc_conn.get_all_subnets(
-            subnet_ids, filters={'vpc_id': vpc_id})
-
-        for subnet_id in subnet_ids:
-            if not any(s.id == subnet_id for s in subnets_by_id):
+            if subnet not in snapshot['subnets']:
                 raise AnsibleSubnetSearchException(
-                    'Subnet ID "{0}" does not exist'.format(subnet_id))
-
-    subnets_by_cidr = []
-    if subnet_cidrs:
-        subnets_by_cidr = vpc_conn.get_all_subnets(
-            filters={'vpc_id': vpc_id, 'cidr': subnet_cidrs})
-
-        for cidr in subnet_cidrs:
-            if not any(s.cidr_block == cidr for s in subnets_by_cidr):
+                    'Subnet ID "{0}" does not exist'.format(subnet))
+            subnets.append(snapshot['subnets'][subnet])
+        elif re.match(CIDR_RE, subnet):
+            if subnet not in snapshot['subnets_by_cidr']:
                 raise AnsibleSubnetSearchException(
-                    'Subnet CIDR "{0}" does not exist'.format(subnet_cidr))
-
-    subnets_by_name = []
-    if subnet_names:
-        subnets_by_name = vpc_conn.get_all_subnets(
-            filters={'vpc_id': vpc_id, 'tag:Name': subnet_names})
-
-        for name in subnet_names:
-            matching = [s.tags.get('Name') == name for s in subnets_by_name]
+                    'Subnet CIDR "{0}" does not exist'.format(subnet))
+            subnets.append(snapshot['subnets_by_cidr'][subnet])
+        else:
+            matching = snapshot['subnets_by_name'].get(subnet, [])
             if len(matching) == 0:
                 raise AnsibleSubnetSearchException(
-                    'Subnet named "{0}" does not exist'.format(name))
+                    'Subnet named "{0}" does not exist'.format(subnet))
             elif len(matching) > 1:
                 raise AnsibleSubnetSearchException(
-                    'Multiple subnets named "{0}"'.format(name))
+                    'Multiple subnets named "{0}"'.format(subnet))
+            subnets.append(matching[0])
 
-    return subnets_by_id + subnets_by_cidr + subnets_by_name
+    return subnets
 
 
 def find_igw(vpc_conn, vpc_id):
@@ -231,44 +239,42 @@ def tags_match(match_tags, candidate_tags):
                 for k, v in match_tags.iteritems()))
 
 
-def ensure_tags(vpc_conn, resource_id, tags, add_only, check_mode):
+def ensure_tags(vpc_conn, resource_id, tags, add_only, check_mode, cur_tags=None):
     try:
-        cur_tags = get_resource_tags(vpc_conn, resource_id)
+        if cur_tags is None:
+            cur_tags = get_resource_tags(vpc_conn, resource_id)
         if tags == cur_tags:
             return {'changed': False, 'tags': cur_tags}
 
+        latest_tags = dict(cur_tags)
         to_delete = dict((k, cur_tags[k]) for k in cur_tags if k not in tags)
         if to_delete and not add_only:
             vpc_conn.delete_tags(resource_id, to_delete, dry_run=check_mode)
+            for k in to_delete:
+                del latest_tags[k]
 
         to_add = dict((k, tags[k]) for k in tags if k not in cur_tags)
         if to_add:
             vpc_conn.create_tags(resource_id, to_add, dry_run=check_mode)
+            latest_tags.update(to_add)
 
-        latest_tags = get_resource_tags(vpc_conn, resource_id)
-        return {'changed': True, 'tags': latest_tags}
+        return {'changed': bool(to_add or (to_delete and not add_only)), 'tags': latest_tags}
     except EC2ResponseError as e:
         raise AnsibleTagCreationException(
             'Unable to update tags for {0}, error: {1}'.format(resource_id, e))
 
 
-def get_route_table_by_id(vpc_conn, vpc_id, route_table_id):
+def get_route_table_by_id(snapshot, route_table_id):
 
-    route_table = None
-    route_tables = vpc_conn.get_all_route_tables(route_table_ids=[route_table_id], filters={'vpc_id': vpc_id})
-    if route_tables:
-        route_table = route_tables[0]
+    return snapshot['route_tables'].get(route_table_id)
 
-    return route_table
 
-def get_route_table_by_tags(vpc_conn, vpc_id, tags):
+def get_route_table_by_tags(snapshot, tags):
 
     count = 0
     route_table = None
-    route_tables = vpc_conn.get_all_route_tables(filters={'vpc_id': vpc_id})
-    for table in route_tables:
-        this_tags = get_resource_tags(vpc_conn, table.id)
-        if tags_match(tags, this_tags):
+    for table in snapshot['route_tables'].values():
+        if tags_match(tags, table.tags):
             route_table = table
             count +=1
 
@@ -310,22 +316,24 @@ def rename_key(d, old_key, new_key):
     del d[old_key]
 
 
-def index_of_matching_route(route_spec, routes_to_match):
-    for i, route in enumerate(routes_to_match):
-        if route_spec_matches_route(route_spec, route):
-            return i
-
-
 def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
                   check_mode):
-    routes_to_match = list(route_table.routes)
+    # A route table holds at most one route per destination, so routes are
+    # indexed by destination CIDR and each spec is checked against a single
+    # candidate. A spec whose destination exists with another target is
+    # replaced in place rather than deleted and created again. Routes
+    # without a destination CIDR, such as prefix list or IPv6 routes, cannot
+    # be matched or deleted by CIDR and are left alone.
+    routes_to_match = dict((r.destination_cidr_block, r) for r in route_table.routes
+                           if r.destination_cidr_block)
     route_specs_to_create = []
+    route_specs_to_replace = []
     for route_spec in route_specs:
-        i = index_of_matching_route(route_spec, routes_to_match)
-        if i is None:
+        route = routes_to_match.pop(route_spec['destination_cidr_block'], None)
+        if route is None:
             route_specs_to_create.append(route_spec)
-        else:
-            del routes_to_match[i]
+        elif not route_spec_matches_route(route_spec, route):
+            route_specs_to_replace.append(route_spec)
 
     # NOTE: As of boto==2.38.0, the origin of a route is not available
     # (for example, whether it came from a gateway with route propagation
@@ -334,7 +342,7 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
     # The current logic will leave non-propagated routes using propagating
     # VGWs in place.
     routes_to_delete = []
-    for r in routes_to_match:
+    for r in routes_to_match.values():
         if r.gateway_id:
             if r.gateway_id != 'local' and not r.gateway_id.startswith('vpce-'):
                 if not propagating_vgw_ids or r.gateway_id not in propagating_vgw_ids:
@@ -342,7 +350,7 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
         else:
             routes_to_delete.append(r)
 
-    changed = bool(routes_to_delete or route_specs_to_create)
+    changed = bool(routes_to_delete or route_specs_to_create or route_specs_to_replace)
     if changed:
         for route in routes_to_delete:
             try:
@@ -353,6 +361,15 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
                 if e.error_code == 'DryRunOperation':
                     pass
 
+        for route_spec in route_specs_to_replace:
+            try:
+                vpc_conn.replace_route(route_table.id,
+                                       dry_run=check_mode,
+                                       **route_spec)
+            except EC2ResponseError as e:
+                if e.error_code == 'DryRunOperation':
+                    pass
+
         for route_spec in route_specs_to_create:
             try:
                 vpc_conn.create_route(route_table.id,
@@ -365,35 +382,31 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
     return {'changed': bool(changed)}
 
 
-def ensure_subnet_association(vpc_conn, vpc_id, route_table_id, subnet_id,
+def ensure_subnet_association(vpc_conn, snapshot, route_table_id, subnet_id,
                               check_mode):
-    route_tables = vpc_conn.get_all_route_tables(
-        filters={'association.subnet_id': subnet_id, 'vpc_id': vpc_id}
-    )
-    for route_table in route_tables:
-        if route_table.id is None:
-            continue
-        for a in route_table.associations:
-            if a.subnet_id == subnet_id:
-                if route_table.id == route_table_id:
-                    return {'changed': False, 'association_id': a.id}
-                else:
-                    if check_mode:
-                        return {'changed': True}
-                    vpc_conn.disassociate_route_table(a.id)
-
-    association_id = vpc_conn.associate_route_table(route_table_id, subnet_id)
+    association = snapshot['associations'].get(subnet_id)
+    if association is None:
+        association_id = vpc_conn.associate_route_table(route_table_id, subnet_id)
+        return {'changed': True, 'association_id': association_id}
+
+    if association.route_table_id == route_table_id:
+        return {'changed': False, 'association_id': association.id}
+    if check_mode:
+        return {'changed': True}
+    # Move the subnet over in a single call instead of disassociating first
+    association_id = vpc_conn.replace_route_table_association_with_assoc(
+        association.id, route_table_id)
     return {'changed': True, 'association_id': association_id}
 
 
-def ensure_subnet_associations(vpc_conn, vpc_id, route_table, subnets,
+def ensure_subnet_associations(vpc_conn, snapshot, route_table, subnets,
                                check_mode):
     current_association_ids = [a.id for a in route_table.associations]
     new_association_ids = []
     changed = False
     for subnet in subnets:
         result = ensure_subnet_association(
-            vpc_conn, vpc_id, route_table.id, subnet.id, check_mode)
+            vpc_conn, snapshot, route_table.id, subnet.id, check_mode)
         changed = changed or result['changed']
         if changed and check_mode:
             return {'changed': True}
@@ -438,21 +451,21 @@ def ensure_route_table_absent(connection, module):
     tags = module.params.get('tags')
     vpc_id = module.params.get('vpc_id')
 
+    try:
+        snapshot = get_vpc_snapshot(connection, vpc_id)
+    except EC2ResponseError as e:
+        module.fail_json(msg=e.message)
+
     if lookup == 'tag':
         if tags is not None:
             try:
-                route_table = get_route_table_by_tags(connection, vpc_id, tags)
-            except EC2ResponseError as e:
-                module.fail_json(msg=e.message)
+                route_table = get_route_table_by_tags(snapshot, tags)
             except RuntimeError as e:
                 module.fail_json(msg=e.args[0])
         else:
             route_table = None
     elif lookup == 'id':
-        try:
-            route_table = get_route_table_by_id(connection, vpc_id, route_table_id)
-        except EC2ResponseError as e:
-            module.fail_json(msg=e.message)
+        route_table = get_route_table_by_id(snapshot, route_table_id)
 
     if route_table is None:
         return {'changed': False}
@@ -513,21 +526,21 @@ def ensure_route_table_present(connection, module):
     changed = False
     tags_valid = False
 
+    try:
+        snapshot = get_vpc_snapshot(connection, vpc_id, include_subnets=bool(subnets))
+    except EC2ResponseError as e:
+        module.fail_json(msg=e.message)
+
     if lookup == 'tag':
         if tags is not None:
             try:
-                route_table = get_route_table_by_tags(connection, vpc_id, tags)
-            except EC2ResponseError as e:
-                module.fail_json(msg=e.message)
+                route_table = get_route_table_by_tags(snapshot, tags)
             except RuntimeError as e:
                 module.fail_json(msg=e.args[0])
         else:
             route_table = None
     elif lookup == 'id':
-        try:
-            route_table = get_route_table_by_id(connection, vpc_id, route_table_id)
-        except EC2ResponseError as e:
-            module.fail_json(msg=e.message)
+        route_table = get_route_table_by_id(snapshot, route_table_id)
 
     # If no route table returned then create new route table
     if route_table is None:
@@ -555,21 +568,15 @@ def ensure_route_table_present(connection, module):
 
     if not tags_valid and tags is not None:
         result = ensure_tags(connection, route_table.id, tags,
-                             add_only=True, check_mode=module.check_mode)
+                             add_only=True, check_mode=module.check_mode,
+                             cur_tags=route_table.tags)
         changed = changed or result['changed']
 
     if subnets:
-        associated_subnets = []
-        try:
-            associated_subnets = find_subnets(connection, vpc_id, subnets)
-        except EC2ResponseError as e:
-            raise AnsibleRouteTableException(
-                'Unable to find subnets for route table {0}, error: {1}'
-                .format(route_table, e)
-            )
+        associated_subnets = find_subnets(snapshot, subnets)
 
         try:
-            result = ensure_subnet_associations(connection, vpc_id, route_table, associated_subnets, module.check_mode)
+            result = ensure_subnet_associations(connection, snapshot, route_table, associated_subnets, module.check_mode)
             changed = changed or result['changed']
         except EC2ResponseError as e:
             raise AnsibleRouteTableException(
@@ -38,12 +38,16 @@ options:
         required: true
     delay:
         description:
-            - Number of seconds to wait
+            - The longest time in seconds between two checks of the cluster. Checks back off
+              exponentially, with jitter, from one second up to this value.
         required: false
+        default: 10
     repeat:
         description:
-            - The number of times to wait for the cluster to have an instance
+            - The number of times to wait for the cluster to have an instance. The wait gives up after
+              I(delay) * I(repeat) seconds.
         required: false
+        default: 10
 extends_documentation_fragment:
     - aws
     - ec2
@@ -100,7 +104,14 @@ status:
     description: the status of the new cluster
     returned: ACTIVE
     type: string
+wait_timings:
+    description: How long the wait took, with the number of DescribeClusters calls (polls) and the seconds spent in
+      API calls (api_time), sleeping (sleep_time) and in total (elapsed).
+    returned: when state is has_instances
+    type: dict
+    sample: {"polls": 4, "api_time": 0.42, "sleep_time": 6.81, "elapsed": 7.23}
 '''
+import random
 import time
 
 try:
@@ -115,6 +126,39 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+def wait_until(check, delay, timeout):
+    """Call check() until it returns a true value or timeout seconds have
+    passed, sleeping backoff_delay seconds, at most delay, between calls.
+
+    Returns the last value of check() and the timings of the wait: the
+    number of polls and the seconds spent in API calls, sleeping and in total.
+    """
+    started = time.time()
+    timings = dict(polls=0, api_time=0.0, sleep_time=0.0)
+    attempt = 0
+    while True:
+        call_started = time.time()
+        result = check()
+        timings['api_time'] += time.time() - call_started
+        timings['polls'] += 1
+        remaining = timeout - (time.time() - started)
+        if result or remaining <= 0:
+            break
+        sleep = min(backoff_delay(attempt, 1, max(delay, 1)), remaining)
+        time.sleep(sleep)
+        timings['sleep_time'] += sleep
+        attempt += 1
+    timings['elapsed'] = time.time() - started
+    for key in ('api_time', 'sleep_time', 'elapsed'):
+        timings[key] = round(timings[key], 2)
+    return result, timings
+
 class EcsClusterManager:
     """Handles ECS Clusters"""
 
@@ -158,6 +202,16 @@ class EcsClusterManager:
     def delete_cluster(self, clusterName):
         return self.ecs.delete_cluster(cluster=clusterName)
 
+    def wait_for_instances(self, cluster_name, delay, timeout):
+        state = dict(cluster=None)
+
+        def check():
+            state['cluster'] = self.describe_cluster(cluster_name)
+            return state['cluster']['registeredContainerInstancesCount'] > 0
+
+        has_instances, timings = wait_until(check, delay, timeout)
+        return has_instances, state['cluster'], timings
+
 def main():
 
     argument_spec = ec2_argument_spec()
@@ -215,18 +269,12 @@ def main():
         # return info about the cluster deleted
         delay = module.params['delay']
         repeat = module.params['repeat']
-        time.sleep(delay)
-        count = 0
-        for i in range(repeat):
-            existing = cluster_mgr.describe_cluster(module.params['name'])
-            count = existing['registeredContainerInstancesCount']
-            if count > 0:
-                results['changed'] = True
-                break
-            time.sleep(delay)
-        if count == 0 and i is repeat-1:
-            module.fail_json(msg="Cluster instance count still zero after "+str(repeat)+" tries of "+str(delay)+" seconds each.")
+        has_instances, existing, timings = cluster_mgr.wait_for_instances(module.params['name'], delay, delay * repeat)
+        results['wait_timings'] = timings
+        if not has_instances:
+            module.fail_json(msg="Cluster instance count still zero after "+str(timings['elapsed'])+" seconds.")
             return
+        results['changed'] = True
 
     module.exit_json(**results)
 
@@ -67,14 +67,24 @@ options:
         required: false
     delay:
         description:
-          - The time to wait before checking that the service is available
+          - The longest time in seconds between two checks of the service when waiting. Checks back off
+            exponentially, with jitter, from one second up to this value.
         required: false
         default: 10
     repeat:
         description:
-          - The number of times to check that the service is available
+          - The number of times to check that the service is available. The wait gives up after
+            I(delay) * I(repeat) seconds.
         required: false
         default: 10
+    wait:
+        description:
+          - With C(state=present), wait for the primary deployment of the service to reach steady state,
+            i.e. for its running count to equal its desired count.
+        required: false
+        default: no
+        choices: [ 'yes', 'no' ]
+        version_added: "2.3"
 extends_documentation_fragment:
     - aws
     - ec2
@@ -95,6 +105,17 @@ EXAMPLES = '''
     state: present
     cluster: new_cluster
 
+# Roll out a new task definition and wait until it runs the desired count
+- ecs_service:
+    state: present
+    name: console-test-service
+    cluster: new_cluster
+    task_definition: console-test-task:2
+    desired_count: 2
+    wait: yes
+    delay: 15
+    repeat: 40
+
 # Simple example to delete
 - ecs_service:
     name: default
@@ -165,6 +186,31 @@ service:
             description: lost of service events
             returned: always
             type: list of complex
+events:
+    description: Service events created since the primary deployment started, oldest first, collected while waiting.
+    returned: when wait is yes
+    type: list of complex
+wait_timings:
+    description: How long the wait took.
+    returned: when wait is yes or state is deleting
+    type: complex
+    contains:
+        polls:
+            description: Number of DescribeServices calls made.
+            type: int
+        api_time:
+            description: Seconds spent in DescribeServices calls.
+            type: float
+        sleep_time:
+            description: Seconds spent sleeping between calls.
+            type: float
+        elapsed:
+            description: Seconds from the start to the end of the wait.
+            type: float
+        first_running:
+            description: Seconds until the primary deployment had a running task, null if it never had one.
+            returned: when wait is yes
+            type: float
 ansible_facts:
     description: Facts about deleted service.
     returned: when deleting a service
@@ -175,6 +221,9 @@ ansible_facts:
             returned: when service existed and was deleted
             type: complex
 '''
+import random
+import time
+
 try:
     import boto
     import botocore
@@ -188,6 +237,39 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+def wait_until(check, delay, timeout):
+    """Call check() until it returns a true value or timeout seconds have
+    passed, sleeping backoff_delay seconds, at most delay, between calls.
+
+    Returns the last value of check() and the timings of the wait: the
+    number of polls and the seconds spent in API calls, sleeping and in total.
+    """
+    started = time.time()
+    timings = dict(polls=0, api_time=0.0, sleep_time=0.0)
+    attempt = 0
+    while True:
+        call_started = time.time()
+        result = check()
+        timings['api_time'] += time.time() - call_started
+        timings['polls'] += 1
+        remaining = timeout - (time.time() - started)
+        if result or remaining <= 0:
+            break
+        sleep = min(backoff_delay(attempt, 1, max(delay, 1)), remaining)
+        time.sleep(sleep)
+        timings['sleep_time'] += sleep
+        attempt += 1
+    timings['elapsed'] = time.time() - started
+    for key in ('api_time', 'sleep_time', 'elapsed'):
+        timings[key] = round(timings[key], 2)
+    return result, timings
+
 class EcsServiceManager:
     """Handles ECS Services"""
 
@@ -288,6 +370,45 @@ class EcsServiceManager:
     def delete_service(self, service, cluster=None):
         return self.ecs.delete_service(cluster=cluster, service=service)
 
+    def wait_for_status(self, cluster_name, service_name, status, delay, timeout):
+        def check():
+            service = self.describe_service(cluster_name, service_name)
+            return service is not None and service['status'] == status
+        return wait_until(check, delay, timeout)
+
+    def wait_for_steady_state(self, cluster_name, service_name, delay, timeout):
+        """Wait for the running count of the primary deployment to reach its desired count.
+
+        Events are followed incrementally: each poll only looks at the events
+        not seen before, starting from the creation of the primary deployment.
+        Returns the last service description, the new events, oldest first,
+        and the timings of the wait.
+        """
+        started = time.time()
+        state = dict(service=None, events=[], seen=set(), first_running=None)
+
+        def check():
+            service = self.describe_service(cluster_name, service_name)
+            state['service'] = service
+            primary = [d for d in service['deployments'] if d['status'] == 'PRIMARY'][0]
+            new_events = []
+            # events are returned newest first
+            for event in service['events']:
+                if event['id'] in state['seen'] or event['createdAt'] < primary['createdAt']:
+                    break
+                new_events.append(event)
+            for event in reversed(new_events):
+                state['seen'].add(event['id'])
+                state['events'].append(event)
+            if primary['runningCount'] > 0 and state['first_running'] is None:
+                state['first_running'] = round(time.time() - started, 2)
+            return primary['runningCount'] == primary['desiredCount']
+
+        steady, timings = wait_until(check, delay, timeout)
+        timings['first_running'] = state['first_running']
+        events = self.jsonize(dict(events=state['events']))['events']
+        return steady, self.jsonize(state['service']), events, timings
+
 def main():
 
     argument_spec = ec2_argument_spec()
@@ -301,7 +422,8 @@ def main():
         client_token=dict(required=False, type='str' ),
         role=dict(required=False, type='str' ),
         delay=dict(required=False, type='int', default=10),
-        repeat=dict(required=False, type='int', default=10)
+        repeat=dict(required=False, type='int', default=10),
+        wait=dict(required=False, type='bool', default=False)
     ))
 
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
@@ -374,6 +496,15 @@ def main():
 
             results['changed'] = True
 
+        if module.params['wait'] and not module.check_mode:
+            steady, service, events, timings = service_mgr.wait_for_steady_state(
+                module.params['cluster'], module.params['name'],
+                module.params['delay'], module.params['delay'] * module.params['repeat'])
+            results.update(service=service, events=events, wait_timings=timings)
+            if not steady:
+                results['msg'] = "Service did not reach steady state after %s seconds." % timings['elapsed']
+                module.fail_json(**results)
+
     elif module.params['state'] == 'absent':
         if not existing:
             pass
@@ -404,17 +535,13 @@ def main():
         # return info about the cluster deleted
         delay = module.params['delay']
         repeat = module.params['repeat']
-        time.sleep(delay)
-        for i in range(repeat):
-            existing = service_mgr.describe_service(module.params['cluster'], module.params['name'])
-            status = existing['status']
-            if status == "INACTIVE":
-                results['changed'] = True
-                break
-            time.sleep(delay)
-        if i is repeat-1:
-            module.fail_json(msg="Service still not deleted after "+str(repeat)+" tries of "+str(delay)+" seconds each.")
+        deleted, timings = service_mgr.wait_for_status(module.params['cluster'], module.params['name'],
+                                                       "INACTIVE", delay, delay * repeat)
+        results['wait_timings'] = timings
+        if not deleted:
+            module.fail_json(msg="Service still not deleted after "+str(timings['elapsed'])+" seconds.")
             return
+        results['changed'] = True
 
     module.exit_json(**results)
 
@@ -59,6 +59,14 @@ options:
       - How many seconds to wait for an operation to complete before timing out
     required: false
     default: 300
+  summary:
+    description:
+      - "Only return the stream status, retention period and the number of open shards
+        (shards_count) instead of the details of every shard, which keeps the result small
+        and the number of DescribeStream calls low on streams with many shards."
+    required: false
+    default: false
+    version_added: "2.3"
   tags:
     description:
       - "A dictionary of resource tags of the form: { tag1: value1, tag2: value2 }."
@@ -136,6 +144,19 @@ retention_period_hours:
   returned: when state == present.
   type: int
   sample: 24
+shards_count:
+  description: Number of shards of the Kinesis Stream, only the open ones with I(summary).
+  returned: when state == present.
+  type: int
+  sample: 4
+wait_stats:
+  description: Number of DescribeStream calls made and seconds spent while waiting for the stream status.
+  returned: always
+  type: dict
+  sample: {
+      "polls": 4,
+      "elapsed": 31.27
+  }
 tags:
   description: Dictionary containing all the tags associated with the Kinesis stream.
   returned: when state == present.
@@ -155,9 +176,22 @@ except ImportError:
 
 import re
 import datetime
+import random
 import time
 from functools import reduce
 
+# Seconds between two DescribeStream calls of the boto3 waiters; Kinesis
+# allows 10 DescribeStream calls per second and account.
+WAITER_DELAY = 5
+# Longest pause between two DescribeStream calls of wait_for_status
+MAX_POLL_DELAY = 15
+
+THROTTLING_ERRORS = (
+    'LimitExceededException',
+    'ThrottlingException',
+    'RequestLimitExceeded',
+)
+
 def convert_to_lower(data):
     """Convert all uppercase keys in dict with lowercase_
     Args:
@@ -289,7 +323,50 @@ def get_tags(client, stream_name, check_mode=False):
 
     return success, err_msg, results
 
-def find_stream(client, stream_name, check_mode=False):
+def describe_stream_summary(client, stream_name):
+    """Retrieve the status, retention period and open shard count of a
+    Kinesis Stream without materializing its shards.
+    Uses DescribeStreamSummary when botocore provides it, otherwise pages
+    through DescribeStream counting the open shards.
+    Args:
+        client (botocore.client.EC2): Boto3 client.
+        stream_name (str): Name of the Kinesis stream.
+
+    Basic Usage:
+        >>> client = boto3.client('kinesis')
+        >>> describe_stream_summary(client, 'test-stream')
+
+    Returns:
+        Dict
+    """
+    if hasattr(client, 'describe_stream_summary'):
+        results = (
+            client.describe_stream_summary(StreamName=stream_name)
+            ['StreamDescriptionSummary']
+        )
+        results['ShardsCount'] = results.pop('OpenShardCount')
+        return results
+
+    params = {
+        'StreamName': stream_name,
+    }
+    has_more_shards = True
+    open_shards = 0
+    while has_more_shards:
+        results = (
+            client.describe_stream(**params)['StreamDescription']
+        )
+        shards = results.pop('Shards')
+        for shard in shards:
+            if 'EndingSequenceNumber' not in shard['SequenceNumberRange']:
+                open_shards += 1
+        has_more_shards = results.pop('HasMoreShards') and bool(shards)
+        if has_more_shards:
+            params['ExclusiveStartShardId'] = shards[-1]['ShardId']
+    results['ShardsCount'] = open_shards
+    return results
+
+def find_stream(client, stream_name, check_mode=False, summary=False):
     """Retrieve a Kinesis Stream.
     Args:
         client (botocore.client.EC2): Boto3 client.
@@ -298,6 +375,9 @@ def find_stream(client, stream_name, check_mode=False):
     Kwargs:
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
+        summary (bool): Only return the status, retention period and number
+            of open shards (ShardsCount) instead of every shard.
+            default=False
 
     Basic Usage:
         >>> client = boto3.client('kinesis')
@@ -315,13 +395,18 @@ def find_stream(client, stream_name, check_mode=False):
     has_more_shards = True
     shards = list()
     try:
-        if not check_mode:
+        if not check_mode and summary:
+            results = describe_stream_summary(client, stream_name)
+        elif not check_mode:
             while has_more_shards:
                 results = (
                     client.describe_stream(**params)['StreamDescription']
                 )
-                shards.extend(results.pop('Shards'))
-                has_more_shards = results['HasMoreShards']
+                page = results.pop('Shards')
+                shards.extend(page)
+                has_more_shards = results['HasMoreShards'] and bool(page)
+                if has_more_shards:
+                    params['ExclusiveStartShardId'] = page[-1]['ShardId']
             results['Shards'] = shards
             results['ShardsCount'] = len(shards)
         else:
@@ -338,9 +423,64 @@ def find_stream(client, stream_name, check_mode=False):
 
     return success, err_msg, results
 
+def is_throttled(error):
+    """Whether a botocore ClientError is a request rate error.
+    Args:
+        error (botocore.exceptions.ClientError): The error raised by a call.
+
+    Returns:
+        Bool
+    """
+    code = error.response.get('Error', {}).get('Code')
+    return code in THROTTLING_ERRORS
+
+def backoff_delay(attempt, base, max_delay):
+    """Seconds to sleep before the next poll: base * 2 ** attempt capped at
+    max_delay, randomized over its upper half so that waiters drift apart."""
+    delay = min(max_delay, base * 2 ** attempt)
+    return random.uniform(delay / 2.0, delay)
+
+def poll_for_status(client, stream_name, status, deadline):
+    """Poll DescribeStream with exponential backoff until the status is reached.
+    Throttling errors are retried, any other error ends the wait.
+    Args:
+        client (botocore.client.EC2): Boto3 client
+        stream_name (str): The name of the kinesis stream.
+        status (str): The status to wait for. DELETING waits until the
+            stream is gone.
+        deadline (float): Epoch time after which polling stops.
+
+    Returns:
+        Tuple (bool, str, int)
+    """
+    polls = 0
+    while True:
+        polls += 1
+        try:
+            # Only the status is needed, so skip the shard listing
+            stream = client.describe_stream(
+                StreamName=stream_name, Limit=1
+            )['StreamDescription']
+            if status != 'DELETING' and stream['StreamStatus'] == status:
+                return True, '', polls
+        except botocore.exceptions.ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if status == 'DELETING' and code == 'ResourceNotFoundException':
+                return True, '', polls
+            if not is_throttled(e):
+                return False, str(e), polls
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False, '', polls
+        time.sleep(min(remaining, backoff_delay(polls, 1, MAX_POLL_DELAY)))
+
 def wait_for_status(client, stream_name, status, wait_timeout=300,
-                    check_mode=False):
+                    check_mode=False, wait_stats=None):
     """Wait for the the status to change for a Kinesis Stream.
+    The boto3 waiters stream_exists/stream_not_exists are used when the
+    installed botocore provides them, with a fallback to polling with
+    exponential backoff and jitter.
     Args:
         client (botocore.client.EC2): Boto3 client
         stream_name (str): The name of the kinesis stream.
@@ -351,6 +491,9 @@ def wait_for_status(client, stream_name, status, wait_timeout=300,
         wait_timeout (int): Number of seconds to wait, until this timeout is reached.
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
+        wait_stats (dict): The number of DescribeStream calls made ('polls')
+            and the seconds spent ('elapsed') are added to it.
+            default=None
 
     Basic Usage:
         >>> client = boto3.client('kinesis')
@@ -360,39 +503,69 @@ def wait_for_status(client, stream_name, status, wait_timeout=300,
     Returns:
         Tuple (bool, str, dict)
     """
-    polling_increment_secs = 5
-    wait_timeout = time.time() + wait_timeout
+    start = time.time()
+    deadline = start + wait_timeout
     status_achieved = False
     stream = dict()
     err_msg = ""
+    polls = [0]
 
-    while wait_timeout > time.time():
-        try:
-            find_success, find_msg, stream = (
-                find_stream(client, stream_name, check_mode=check_mode)
-            )
-            if check_mode:
-                status_achieved = True
-                break
-
-            elif status != 'DELETING':
-                if find_success and stream:
-                    if stream.get('StreamStatus') == status:
-                        status_achieved = True
-                        break
-
-            elif status == 'DELETING' and not check_mode:
-                if not find_success:
+    if check_mode:
+        status_achieved = True
+        _, _, stream = find_stream(client, stream_name, check_mode=check_mode)
+
+    else:
+        if status == 'DELETING':
+            waiter_name = 'stream_not_exists'
+        elif status == 'ACTIVE':
+            waiter_name = 'stream_exists'
+        else:
+            waiter_name = None
+
+        if waiter_name in getattr(client, 'waiter_names', []):
+            def count_poll(**kwargs):
+                polls[0] += 1
+            event_name = 'before-parameter-build.kinesis.DescribeStream'
+            client.meta.events.register(event_name, count_poll)
+            try:
+                try:
+                    waiter = client.get_waiter(waiter_name)
+                    delay = WAITER_DELAY
+                    waiter.wait(
+                        StreamName=stream_name, Limit=1,
+                        WaiterConfig={
+                            'Delay': delay,
+                            'MaxAttempts': max(1, int(wait_timeout / delay)),
+                        }
+                    )
                     status_achieved = True
-                    break
+                except botocore.exceptions.WaiterError as e:
+                    # Throttling or another unexpected response ends a
+                    # waiter early, the poller retries those.
+                    err_msg = str(e)
+            finally:
+                client.meta.events.unregister(event_name, count_poll)
+
+        if not status_achieved and time.time() < deadline:
+            status_achieved, err_msg, fallback_polls = (
+                poll_for_status(client, stream_name, status, deadline)
+            )
+            polls[0] += fallback_polls
 
-            else:
-                time.sleep(polling_increment_secs)
-        except botocore.exceptions.ClientError as e:
-            err_msg = str(e)
+        if status_achieved and status != 'DELETING':
+            _, _, stream = find_stream(client, stream_name, summary=True)
+
+    if wait_stats is not None:
+        wait_stats['polls'] = wait_stats.get('polls', 0) + polls[0]
+        wait_stats['elapsed'] = round(
+            wait_stats.get('elapsed', 0) + time.time() - start, 2
+        )
 
     if not status_achieved:
-        err_msg = "Wait time out reached, while waiting for results"
+        if err_msg:
+            err_msg = "Wait failed, while waiting for results: {0}".format(err_msg)
+        else:
+            err_msg = "Wait time out reached, while waiting for results"
     else:
         err_msg = "Status {0} achieved successfully".format(status)
 
@@ -679,7 +852,8 @@ def retention_action(client, stream_name, retention_period=24,
     return success, err_msg
 
 def update(client, current_stream, stream_name, retention_period=None,
-           tags=None, wait=False, wait_timeout=300, check_mode=False):
+           tags=None, wait=False, wait_timeout=300, check_mode=False,
+           wait_stats=None):
     """Update an Amazon Kinesis Stream.
     Args:
         client (botocore.client.EC2): Boto3 client.
@@ -695,6 +869,8 @@ def update(client, current_stream, stream_name, retention_period=None,
             default=300
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
+        wait_stats (dict): Collects the poll count and time spent waiting.
+            default=None
 
     Basic Usage:
         >>> client = boto3.client('kinesis')
@@ -721,7 +897,7 @@ def update(client, current_stream, stream_name, retention_period=None,
             wait_success, wait_msg, current_stream = (
                 wait_for_status(
                     client, stream_name, 'ACTIVE', wait_timeout,
-                    check_mode=check_mode
+                    check_mode=check_mode, wait_stats=wait_stats
                 )
             )
             if not wait_success:
@@ -764,14 +940,14 @@ def update(client, current_stream, stream_name, retention_period=None,
                 wait_success, wait_msg, current_stream = (
                     wait_for_status(
                         client, stream_name, 'ACTIVE', wait_timeout,
-                        check_mode=check_mode
+                        check_mode=check_mode, wait_stats=wait_stats
                     )
                 )
                 if not wait_success:
                     return wait_success, False, wait_msg
             elif changed and not wait:
                 stream_found, stream_msg, current_stream = (
-                    find_stream(client, stream_name, check_mode=check_mode)
+                    find_stream(client, stream_name, check_mode=check_mode, summary=True)
                 )
                 if stream_found:
                     if current_stream['StreamStatus'] != 'ACTIVE':
@@ -795,7 +971,7 @@ def update(client, current_stream, stream_name, retention_period=None,
         success, err_msg, _ = (
             wait_for_status(
                 client, stream_name, 'ACTIVE', wait_timeout,
-                check_mode=check_mode
+                check_mode=check_mode, wait_stats=wait_stats
             )
         )
     if success and changed:
@@ -806,7 +982,8 @@ def update(client, current_stream, stream_name, retention_period=None,
     return success, changed, err_msg
 
 def create_stream(client, stream_name, number_of_shards=1, retention_period=None,
-                  tags=None, wait=False, wait_timeout=300, check_mode=False):
+                  tags=None, wait=False, wait_timeout=300, check_mode=False,
+                  wait_stats=None, summary=False):
     """Create an Amazon Kinesis Stream.
     Args:
         client (botocore.client.EC2): Boto3 client.
@@ -825,6 +1002,10 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
             default=300
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
+        wait_stats (dict): Collects the poll count and time spent waiting.
+            default=None
+        summary (bool): Only return the number of open shards instead of every shard.
+            default=False
 
     Basic Usage:
         >>> client = boto3.client('kinesis')
@@ -842,7 +1023,7 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
     results = dict()
 
     stream_found, stream_msg, current_stream = (
-        find_stream(client, stream_name, check_mode=check_mode)
+        find_stream(client, stream_name, check_mode=check_mode, summary=True)
     )
     if stream_found:
         if current_stream['ShardsCount'] != number_of_shards:
@@ -853,13 +1034,13 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
         wait_success, wait_msg, current_stream = (
             wait_for_status(
                 client, stream_name, 'ACTIVE', wait_timeout,
-                check_mode=check_mode
+                check_mode=check_mode, wait_stats=wait_stats
             )
         )
     if stream_found and current_stream['StreamStatus'] != 'DELETING':
         success, changed, err_msg = update(
             client, current_stream, stream_name, retention_period, tags,
-            wait, wait_timeout, check_mode=check_mode
+            wait, wait_timeout, check_mode=check_mode, wait_stats=wait_stats
         )
     else:
         create_success, create_msg = (
@@ -874,7 +1055,7 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
                 wait_success, wait_msg, results = (
                     wait_for_status(
                         client, stream_name, 'ACTIVE', wait_timeout,
-                        check_mode=check_mode
+                        check_mode=check_mode, wait_stats=wait_stats
                     )
                 )
                 err_msg = (
@@ -902,7 +1083,7 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
                     return success, changed, err_msg, results
 
             stream_found, stream_msg, current_stream = (
-                find_stream(client, stream_name, check_mode=check_mode)
+                find_stream(client, stream_name, check_mode=check_mode, summary=True)
             )
             if retention_period and current_stream['StreamStatus'] == 'ACTIVE':
                 changed, err_msg = (
@@ -925,7 +1106,7 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
 
     if success:
         _, _, results = (
-            find_stream(client, stream_name, check_mode=check_mode)
+            find_stream(client, stream_name, check_mode=check_mode, summary=summary)
         )
         _, _, current_tags = (
             get_tags(client, stream_name, check_mode=check_mode)
@@ -942,7 +1123,7 @@ def create_stream(client, stream_name, number_of_shards=1, retention_period=None
     return success, changed, err_msg, results
 
 def delete_stream(client, stream_name, wait=False, wait_timeout=300,
-                  check_mode=False):
+                  check_mode=False, wait_stats=None):
     """Delete an Amazon Kinesis Stream.
     Args:
         client (botocore.client.EC2): Boto3 client.
@@ -955,6 +1136,8 @@ def delete_stream(client, stream_name, wait=False, wait_timeout=300,
             default=300
         check_mode (bool): This will pass DryRun as one of the parameters to the aws api.
             default=False
+        wait_stats (dict): Collects the poll count and time spent waiting.
+            default=None
 
     Basic Usage:
         >>> client = boto3.client('kinesis')
@@ -969,7 +1152,7 @@ def delete_stream(client, stream_name, wait=False, wait_timeout=300,
     err_msg = ''
     results = dict()
     stream_found, stream_msg, current_stream = (
-        find_stream(client, stream_name, check_mode=check_mode)
+        find_stream(client, stream_name, check_mode=check_mode, summary=True)
     )
     if stream_found:
         success, err_msg = (
@@ -983,7 +1166,7 @@ def delete_stream(client, stream_name, wait=False, wait_timeout=300,
                 success, err_msg, results = (
                     wait_for_status(
                         client, stream_name, 'DELETING', wait_timeout,
-                        check_mode=check_mode
+                        check_mode=check_mode, wait_stats=wait_stats
                     )
                 )
                 err_msg = 'Stream {0} deleted successfully'.format(stream_name)
@@ -1011,6 +1194,7 @@ def main():
             tags = dict(default=None, required=False, type='dict', aliases=['resource_tags']),
             wait = dict(default=True, required=False, type='bool'),
             wait_timeout = dict(default=300, required=False, type='int'),
+            summary = dict(default=False, required=False, type='bool'),
             state = dict(default='present', choices=['present', 'absent']),
         )
     )
@@ -1026,6 +1210,7 @@ def main():
     tags = module.params.get('tags')
     wait = module.params.get('wait')
     wait_timeout = module.params.get('wait_timeout')
+    summary = module.params.get('summary')
 
     if state == 'present' and not shards:
         module.fail_json(msg='Shards is required when state == present.')
@@ -1038,6 +1223,7 @@ def main():
         module.fail_json(msg='boto3 is required.')
 
     check_mode = module.check_mode
+    wait_stats = dict(polls=0, elapsed=0)
     try:
         region, ec2_url, aws_connect_kwargs = (
             get_aws_connection_info(module, boto3=True)
@@ -1058,21 +1244,25 @@ def main():
         success, changed, err_msg, results = (
             create_stream(
                 client, stream_name, shards, retention_period, tags,
-                wait, wait_timeout, check_mode
+                wait, wait_timeout, check_mode, wait_stats, summary
             )
         )
     elif state == 'absent':
         success, changed, err_msg, results = (
-            delete_stream(client, stream_name, wait, wait_timeout, check_mode)
+            delete_stream(
+                client, stream_name, wait, wait_timeout, check_mode, wait_stats
+            )
         )
 
     if success:
         module.exit_json(
-            success=success, changed=changed, msg=err_msg, **results
+            success=success, changed=changed, msg=err_msg,
+            wait_stats=wait_stats, **results
         )
     else:
         module.fail_json(
-            success=success, changed=changed, msg=err_msg, result=results
+            success=success, changed=changed, msg=err_msg, result=results,
+            wait_stats=wait_stats
         )
 
 # import module snippets
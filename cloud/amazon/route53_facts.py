@@ -112,6 +112,30 @@ options:
         'tags',
         ]
     default: 'list'
+  all_pages:
+    description:
+      - "Follow the pagination markers and return the items of every page in one result, with the number of
+        pages read in PageCount. Used with query: hosted_zone and hosted_zone_method: list,
+        query: health_check and health_check_method: list, and query: record_sets."
+      - "With all_pages, max_items limits the total number of items returned instead of the size of a page.
+        The limit applies after the record_name and type filters, and no more pages are read once it is reached."
+    required: false
+    default: false
+    version_added: "2.3"
+  record_name:
+    description:
+      - "Only return the record sets whose name matches this shell-style pattern, e.g. '*.example.com'.
+        Used with query: record_sets and all_pages."
+    required: false
+    default: null
+    version_added: "2.3"
+  compact:
+    description:
+      - "Return only the name, type, TTL and values of every record set.
+        Used with query: record_sets and all_pages."
+    required: false
+    default: false
+    version_added: "2.3"
 author: Karen Cheng(@Etherdaemon)
 extends_documentation_fragment: aws
 '''
@@ -138,6 +162,22 @@ EXAMPLES = '''
     max_items: 20
   register: record_sets
 
+- name: List every A record of a large zone, names, TTLs and values only
+  route53_facts:
+    query: record_sets
+    hosted_zone_id: 'ZZZ1111112222'
+    all_pages: true
+    type: A
+    record_name: '*.internal.example.com'
+    compact: true
+  register: record_sets
+
+- name: List all health checks without looping over next_marker
+  route53_facts:
+    query: health_check
+    all_pages: true
+  register: health_checks
+
 - name: List first 20 health checks
   route53_facts:
     query: health_check
@@ -172,6 +212,76 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+import fnmatch
+
+
+def paginate(client, module, operation, result_key, params, keep=None, transform=None):
+    """Read every page of a list operation.
+
+    Pages are filtered (keep) and reduced (transform) as they arrive, so
+    only the matching items are held in memory. max_items counts the items
+    kept, and no more pages are read once that many have been found.
+    """
+    max_items = None
+    if module.params.get('max_items'):
+        max_items = int(module.params.get('max_items'))
+
+    items = []
+    pages = 0
+    paginator = client.get_paginator(operation)
+    for page in paginator.paginate(**params):
+        pages += 1
+        for item in page.get(result_key, []):
+            if keep is not None and not keep(item):
+                continue
+            if transform is not None:
+                item = transform(item)
+            items.append(item)
+            if max_items is not None and len(items) >= max_items:
+                break
+        if max_items is not None and len(items) >= max_items:
+            break
+
+    results = dict()
+    results[result_key] = items
+    results['PageCount'] = pages
+    return results
+
+
+def compact_record_set(record_set):
+    if record_set.get('AliasTarget'):
+        values = [record_set['AliasTarget']['DNSName']]
+    else:
+        values = [record['Value'] for record in record_set.get('ResourceRecords', [])]
+
+    return dict(
+        Name=record_set['Name'],
+        Type=record_set['Type'],
+        TTL=record_set.get('TTL'),
+        Values=values,
+    )
+
+
+def record_set_filter(module):
+    record_type = module.params.get('type')
+    record_name = module.params.get('record_name')
+    if not (record_type or record_name):
+        return None
+
+    if record_name:
+        record_name = record_name.rstrip('.').lower() + '.'
+
+    def keep(record_set):
+        if record_type and record_set['Type'] != record_type:
+            return False
+        # Route53 escapes '*' as \052 in the names it returns
+        name = record_set['Name'].replace('\\052', '*').lower()
+        if record_name and not fnmatch.fnmatchcase(name, record_name):
+            return False
+        return True
+
+    return keep
+
 
 def get_hosted_zone(client, module):
     params = dict()
@@ -214,6 +324,10 @@ def list_hosted_zones(client, module):
     if module.params.get('delegation_set_id'):
         params['DelegationSetId'] = module.params.get('delegation_set_id')
 
+    if module.params.get('all_pages'):
+        params.pop('MaxItems', None)
+        return paginate(client, module, 'list_hosted_zones', 'HostedZones', params)
+
     results = client.list_hosted_zones(**params)
     return results
 
@@ -304,6 +418,10 @@ def list_health_checks(client, module):
     if module.params.get('next_marker'):
         params['Marker'] = module.params.get('next_marker')
 
+    if module.params.get('all_pages'):
+        params.pop('MaxItems', None)
+        return paginate(client, module, 'list_health_checks', 'HealthChecks', params)
+
     results = client.list_health_checks(**params)
     return results
 
@@ -322,6 +440,17 @@ def record_sets_details(client, module):
     if module.params.get('start_record_name'):
         params['StartRecordName'] = module.params.get('start_record_name')
 
+    if module.params.get('all_pages'):
+        params.pop('MaxItems', None)
+        if module.params.get('type') and module.params.get('start_record_name'):
+            params['StartRecordType'] = module.params.get('type')
+        if module.params.get('compact'):
+            transform = compact_record_set
+        else:
+            transform = None
+        return paginate(client, module, 'list_resource_record_sets', 'ResourceRecordSets', params,
+                        keep=record_set_filter(module), transform=transform)
+
     if module.params.get('type') and not module.params.get('start_record_name'):
         module.fail_json(msg="start_record_name must be specified if type is set")
     elif module.params.get('type'):
@@ -396,6 +525,9 @@ def main():
             'count',
             'tags',
         ], default='list'),
+        all_pages=dict(type='bool', default=False),
+        record_name=dict(),
+        compact=dict(type='bool', default=False),
         )
     )
 
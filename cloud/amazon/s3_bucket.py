@@ -31,11 +31,29 @@ options:
   name:
     description:
       - Name of the s3 bucket
-    required: true
+      - Required unless I(buckets) is given.
+    required: false
     default: null
+  buckets:
+    description:
+      - List of buckets to manage in one task, each given as a bucket name or as a dict with a C(name) key and
+        any of C(policy), C(requester_pays), C(tags) and C(versioning). Values not set for a bucket are taken
+        from the module options.
+      - Buckets are processed concurrently, up to I(max_workers) at a time. Requires boto3 and AWS S3.
+    required: false
+    default: null
+    version_added: "2.3"
+  max_workers:
+    description:
+      - Maximum number of buckets processed at the same time when I(buckets) is given.
+    required: false
+    default: 16
+    version_added: "2.3"
   policy:
     description:
       - The JSON policy as a string.
+      - Policies are compared after normalising key and statement order, so an equivalent policy is not
+        written again.
     required: false
     default: null
   s3_url:
@@ -70,6 +88,10 @@ options:
     required: false
     default: no
     choices: [ 'yes', 'no' ]
+notes:
+    - When boto3 is installed, buckets on AWS S3 are managed with boto3. The versioning, requester pays,
+      policy and tag settings are read concurrently and only the settings that differ are written.
+      Ceph, Walrus and FakeS3 endpoints always use boto.
 extends_documentation_fragment:
     - aws
     - ec2
@@ -104,9 +126,21 @@ EXAMPLES = '''
       example: tag1
       another: tag2
 
+# Make sure a list of buckets exists with versioning enabled, some of them tagged
+- s3_bucket:
+    versioning: yes
+    buckets:
+      - logs-eu-1
+      - logs-eu-2
+      - name: artifacts-eu
+        requester_pays: yes
+        tags:
+          team: build
+
 '''
 
 import os
+import threading
 import xml.etree.ElementTree as ET
 import urlparse
 
@@ -115,13 +149,26 @@ from ansible.module_utils.ec2 import *
 
 try:
     import boto.ec2
-    from boto.s3.connection import OrdinaryCallingFormat, Location
+    from boto.s3.connection import OrdinaryCallingFormat, Location, S3Connection
     from boto.s3.tagging import Tags, TagSet
     from boto.exception import BotoServerError, S3CreateError, S3ResponseError
     HAS_BOTO = True
 except ImportError:
     HAS_BOTO = False
 
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+# Buckets processed at the same time in bulk mode
+MAX_BUCKET_WORKERS = 16
+
+# Bucket settings read with one call each
+BUCKET_SUBRESOURCES = ('versioning', 'request_payment', 'policy', 'tags')
+
 def get_request_payment_status(bucket):
 
     response = bucket.get_request_payment()
@@ -141,6 +188,274 @@ def create_tags_container(tags):
     tags_obj.add_tag_set(tag_set)
     return tags_obj
 
+def canonical_policy(policy):
+    """ Return a policy document in a form where equivalent policies compare equal
+
+    Dict keys are order-insensitive already; lists (statements, actions,
+    resources, ...) are sorted and single-item lists are unwrapped, as AWS
+    may return either form.
+    """
+    if isinstance(policy, basestring):
+        policy = json.loads(policy)
+    return _canonical_value(policy)
+
+def _canonical_value(value):
+    if isinstance(value, dict):
+        return dict((key, _canonical_value(item)) for key, item in value.items())
+    if isinstance(value, list):
+        items = [_canonical_value(item) for item in value]
+        if len(items) == 1:
+            return items[0]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+def error_code(e):
+    return e.response.get('Error', {}).get('Code')
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+def get_bucket_settings(client, name, concurrent=True):
+    """ Read versioning, requester pays, policy and tags of a bucket with boto3 """
+
+    def versioning():
+        status = client.get_bucket_versioning(Bucket=name)
+        # Same shape as boto's get_versioning_status()
+        result = {}
+        if 'Status' in status:
+            result['Versioning'] = status['Status']
+        if 'MFADelete' in status:
+            result['MfaDelete'] = status['MFADelete']
+        return result
+
+    def request_payment():
+        return client.get_bucket_request_payment(Bucket=name).get('Payer', 'BucketOwner') != 'BucketOwner'
+
+    def policy():
+        try:
+            return client.get_bucket_policy(Bucket=name)['Policy']
+        except ClientError as e:
+            if error_code(e) == 'NoSuchBucketPolicy':
+                return None
+            raise
+
+    def tags():
+        try:
+            tag_set = client.get_bucket_tagging(Bucket=name)['TagSet']
+        except ClientError as e:
+            if error_code(e) == 'NoSuchTagSet':
+                return {}
+            raise
+        return dict((tag['Key'], tag['Value']) for tag in tag_set)
+
+    def reading(operation, read):
+        # botocore names the operation in its own errors, add it to the others
+        def task():
+            try:
+                return read()
+            except ClientError:
+                raise
+            except Exception as e:
+                raise Exception('%s in %s' % (describe_error(e), operation))
+        return task
+
+    tasks = dict(
+        versioning=reading('GetBucketVersioning', versioning),
+        request_payment=reading('GetBucketRequestPayment', request_payment),
+        policy=reading('GetBucketPolicy', policy),
+        tags=reading('GetBucketTagging', tags),
+    )
+    if not concurrent:
+        return dict((key, tasks[key]()) for key in BUCKET_SUBRESOURCES)
+
+    results, errors = run_concurrently(tasks, len(tasks))
+    if errors:
+        raise list(errors.values())[0]
+    return results
+
+def ensure_bucket_boto3(client, bucket, region, concurrent=True):
+    """ Create a bucket if needed and write only the settings that differ
+
+    bucket is a dict with the name, policy, requester_pays, tags and
+    versioning of the wanted bucket. Returns the module result for it.
+    """
+    name = bucket['name']
+    changed = False
+
+    try:
+        client.head_bucket(Bucket=name)
+        current = get_bucket_settings(client, name, concurrent=concurrent)
+    except ClientError as e:
+        if error_code(e) not in ('404', 'NoSuchBucket'):
+            raise
+        params = dict(Bucket=name)
+        if region not in ('us-east-1', '', None):
+            params['CreateBucketConfiguration'] = {'LocationConstraint': region}
+        client.create_bucket(**params)
+        changed = True
+        # A new bucket has no settings, there is nothing to read back
+        current = dict(versioning={}, request_payment=False, policy=None, tags={})
+
+    # Versioning
+    versioning_status = current['versioning']
+    enabled = versioning_status.get('Versioning') == 'Enabled'
+    if bucket['versioning'] != enabled:
+        # Once enabled, versioning can only be suspended
+        status = bucket['versioning'] and 'Enabled' or 'Suspended'
+        client.put_bucket_versioning(Bucket=name, VersioningConfiguration={'Status': status})
+        versioning_status = dict(versioning_status, Versioning=status)
+        changed = True
+
+    # Requester pays
+    requester_pays_status = current['request_payment']
+    if requester_pays_status != bucket['requester_pays']:
+        payer = bucket['requester_pays'] and 'Requester' or 'BucketOwner'
+        client.put_bucket_request_payment(Bucket=name, RequestPaymentConfiguration={'Payer': payer})
+        requester_pays_status = bucket['requester_pays']
+        changed = True
+
+    # Policy
+    current_policy = current['policy']
+    policy = bucket['policy']
+    if policy is not None:
+        if current_policy is None or canonical_policy(current_policy) != canonical_policy(policy):
+            client.put_bucket_policy(Bucket=name, Policy=policy)
+            current_policy = policy
+            changed = True
+    elif current_policy is not None:
+        client.delete_bucket_policy(Bucket=name)
+        current_policy = None
+        changed = True
+
+    # Tags
+    current_tags_dict = current['tags']
+    tags = dict((key, str(value)) for key, value in (bucket['tags'] or {}).items())
+    if current_tags_dict != tags:
+        if tags:
+            tag_set = [{'Key': key, 'Value': value} for key, value in tags.items()]
+            client.put_bucket_tagging(Bucket=name, Tagging={'TagSet': tag_set})
+        else:
+            client.delete_bucket_tagging(Bucket=name)
+        current_tags_dict = tags
+        changed = True
+
+    return dict(changed=changed, name=name, versioning=versioning_status, requester_pays=requester_pays_status,
+                policy=current_policy, tags=current_tags_dict)
+
+def destroy_bucket_boto3(client, bucket, force):
+
+    name = bucket['name']
+    try:
+        client.head_bucket(Bucket=name)
+    except ClientError as e:
+        if error_code(e) in ('404', 'NoSuchBucket'):
+            # Bucket already absent
+            return dict(changed=False, name=name)
+        raise
+
+    if force:
+        # Empty the bucket, one DeleteObjects call per page of 1000 keys
+        paginator = client.get_paginator('list_objects')
+        for page in paginator.paginate(Bucket=name):
+            keys = [{'Key': key['Key']} for key in page.get('Contents', [])]
+            if keys:
+                client.delete_objects(Bucket=name, Delete={'Objects': keys, 'Quiet': True})
+
+    client.delete_bucket(Bucket=name)
+    return dict(changed=True, name=name)
+
+def bucket_specs(module):
+    """ Build the wanted state of every bucket from name or buckets """
+
+    defaults = dict(
+        policy=module.params.get('policy'),
+        requester_pays=module.params.get('requester_pays'),
+        tags=module.params.get('tags'),
+        versioning=module.params.get('versioning'),
+    )
+    if not module.params.get('buckets'):
+        return [dict(defaults, name=module.params.get('name'))]
+
+    specs = []
+    for item in module.params.get('buckets'):
+        if not isinstance(item, dict):
+            item = dict(name=item)
+        if 'name' not in item:
+            module.fail_json(msg='Every entry of buckets needs a name', bucket=item)
+        spec = dict(defaults)
+        spec.update(item)
+        if spec['policy'] is not None and not isinstance(spec['policy'], basestring):
+            spec['policy'] = json.dumps(spec['policy'])
+        spec['requester_pays'] = module.boolean(spec['requester_pays'])
+        spec['versioning'] = module.boolean(spec['versioning'])
+        specs.append(spec)
+    return specs
+
+def manage_buckets_boto3(client, module, region):
+
+    state = module.params.get('state')
+    force = module.params.get('force')
+    specs = bucket_specs(module)
+
+    def task(spec):
+        if state == 'present':
+            return lambda: ensure_bucket_boto3(client, spec, region, concurrent=len(specs) == 1)
+        return lambda: destroy_bucket_boto3(client, spec, force)
+
+    tasks = dict((spec['name'], task(spec)) for spec in specs)
+    results, errors = run_concurrently(tasks, module.params.get('max_workers'))
+
+    if errors:
+        module.fail_json(msg='Failed to manage bucket(s) %s' % ', '.join(sorted(errors)),
+                         errors=dict((name, describe_error(e)) for name, e in errors.items()))
+
+    if not module.params.get('buckets'):
+        module.exit_json(**results[specs[0]['name']])
+
+    buckets = [results[spec['name']] for spec in specs]
+    module.exit_json(changed=any(bucket['changed'] for bucket in buckets), buckets=buckets)
+
 def _create_or_update_bucket(connection, module, location):
 
     policy = module.params.get("policy")
@@ -150,6 +465,10 @@ def _create_or_update_bucket(connection, module, location):
     versioning = module.params.get("versioning")
     changed = False
 
+    # S3 returns tag values as strings
+    if tags is not None:
+        tags = dict((key, str(value)) for key, value in tags.items())
+
     try:
         bucket = connection.get_bucket(name)
     except S3ResponseError as e:
@@ -199,9 +518,9 @@ def _create_or_update_bucket(connection, module, location):
             module.fail_json(msg=e.message)
 
     if policy is not None:
-        compare_policy = json.loads(policy)
+        compare_policy = canonical_policy(policy)
 
-        if current_policy is None or json.loads(current_policy) != compare_policy:
+        if current_policy is None or canonical_policy(current_policy) != compare_policy:
             try:
                 bucket.set_policy(policy)
                 changed = True
@@ -341,7 +660,9 @@ def main():
         dict(
             force = dict(required=False, default='no', type='bool'),
             policy = dict(required=False, type='json'),
-            name = dict(required=True, type='str'),
+            name = dict(required=False, type='str'),
+            buckets = dict(required=False, type='list'),
+            max_workers = dict(default=MAX_BUCKET_WORKERS, type='int'),
             requester_pays = dict(default='no', type='bool'),
             s3_url = dict(aliases=['S3_URL'], type='str'),
             state = dict(default='present', type='str', choices=['present', 'absent']),
@@ -351,7 +672,29 @@ def main():
         )
     )
 
-    module = AnsibleModule(argument_spec=argument_spec)
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        mutually_exclusive=[['name', 'buckets']],
+        required_one_of=[['name', 'buckets']],
+    )
+
+    s3_url = module.params.get('s3_url')
+
+    # allow eucarc environment variables to be used if ansible vars aren't set
+    if not s3_url and 'S3_URL' in os.environ:
+        s3_url = os.environ['S3_URL']
+
+    if HAS_BOTO3 and not module.params.get('ceph') and not is_fakes3(s3_url) and not is_walrus(s3_url):
+        region, endpoint, aws_connect_params = get_aws_connection_info(module, boto3=True)
+        try:
+            client = boto3_conn(module, conn_type='client', resource='s3', region=region, endpoint=s3_url,
+                                **aws_connect_params)
+        except Exception as e:
+            module.fail_json(msg='Failed to connect to S3: %s' % str(e))
+        manage_buckets_boto3(client, module, region)
+
+    if module.params.get('buckets'):
+        module.fail_json(msg='buckets requires boto3 and AWS S3')
 
     if not HAS_BOTO:
         module.fail_json(msg='boto required for this module')
@@ -366,12 +709,6 @@ def main():
         # actually work fine for everything except us-east-1 (US Standard)
         location = region
 
-    s3_url = module.params.get('s3_url')
-
-    # allow eucarc environment variables to be used if ansible vars aren't set
-    if not s3_url and 'S3_URL' in os.environ:
-        s3_url = os.environ['S3_URL']
-
     ceph = module.params.get('ceph')
 
     if ceph and not s3_url:
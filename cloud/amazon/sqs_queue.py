@@ -37,7 +37,22 @@ options:
   name:
     description:
       - Name of the queue.
-    required: true
+      - Required unless I(queues) is given.
+    required: false
+  queues:
+    description:
+      - List of queues to manage in one task, each given as a queue name or as a dict with a C(name) key and
+        any of the queue attribute options. Attributes not set for a queue are taken from the module options.
+      - Queues are processed concurrently, up to I(max_workers) at a time.
+    required: false
+    default: null
+    version_added: "2.3"
+  max_workers:
+    description:
+      - Maximum number of queues processed at the same time when I(queues) is given.
+    required: false
+    default: 16
+    version_added: "2.3"
   default_visibility_timeout:
     description:
       - The default visibility timeout in seconds.
@@ -69,6 +84,9 @@ options:
     required: false
     default: null
     version_added: "2.1"
+notes:
+  - All attributes of an existing queue are read with one GetQueueAttributes call and the attributes that
+    differ are written with one SetQueueAttributes call. New queues are created with their attributes.
 extends_documentation_fragment:
     - aws
     - ec2
@@ -91,133 +109,267 @@ EXAMPLES = '''
     name: my-queue
     region: ap-southeast-2
     state: absent
+
+# Create a set of queues sharing the same retention, with a longer timeout for one of them
+- sqs_queue:
+    region: ap-southeast-2
+    message_retention_period: 86400
+    queues:
+      - orders
+      - invoices
+      - name: reports
+        default_visibility_timeout: 300
 '''
 
+import threading
+
+try:
+    import Queue as queue_module
+except ImportError:
+    import queue as queue_module
+
 try:
     import boto.sqs
+    from boto.sqs.queue import Queue
     from boto.exception import BotoServerError, NoAuthHandlerFound
     HAS_BOTO = True
 
 except ImportError:
     HAS_BOTO = False
 
+# Module options and the queue attributes they manage
+QUEUE_ATTRIBUTES = (
+    ('default_visibility_timeout', 'VisibilityTimeout'),
+    ('message_retention_period', 'MessageRetentionPeriod'),
+    ('maximum_message_size', 'MaximumMessageSize'),
+    ('delivery_delay', 'DelaySeconds'),
+    ('receive_message_wait_time', 'ReceiveMessageWaitTimeSeconds'),
+    ('policy', 'Policy'),
+)
+
+# Queues processed at the same time when a list of queues is given
+MAX_QUEUE_WORKERS = 16
+
+
+def attribute_params(attributes):
+    """ Build the indexed Attribute.N.Name/Value parameters of the SQS query API """
+    params = {}
+    for i, name in enumerate(sorted(attributes)):
+        params['Attribute.%d.Name' % (i + 1)] = name
+        params['Attribute.%d.Value' % (i + 1)] = attributes[name]
+    return params
+
+
+def wanted_attributes(queue_attributes):
+    """ Map the set module options to queue attribute names and string values """
+    attributes = {}
+    for option, name in QUEUE_ATTRIBUTES:
+        value = queue_attributes.get(option)
+        if value is None:
+            continue
+        if name == 'Policy':
+            # sort keys for comparing
+            value = json.dumps(value, sort_keys=True)
+        attributes[name] = str(value)
+    return attributes
+
+
+def changed_attributes(wanted, existing):
+    changed = {}
+    for name, value in wanted.items():
+        existing_value = existing.get(name, '')
+        if name == 'Policy' and existing_value:
+            existing_value = json.dumps(json.loads(existing_value), sort_keys=True)
+        if value != existing_value:
+            changed[name] = value
+    return changed
 
-def create_or_update_sqs_queue(connection, module):
-    queue_name = module.params.get('name')
-
-    queue_attributes = dict(
-        default_visibility_timeout=module.params.get('default_visibility_timeout'),
-        message_retention_period=module.params.get('message_retention_period'),
-        maximum_message_size=module.params.get('maximum_message_size'),
-        delivery_delay=module.params.get('delivery_delay'),
-        receive_message_wait_time=module.params.get('receive_message_wait_time'),
-        policy=module.params.get('policy'),
-    )
 
-    result = dict(
-        region=module.params.get('region'),
-        name=queue_name,
-    )
-    result.update(queue_attributes)
+def update_sqs_queue(connection, queue, queue_attributes, check_mode=False):
+    wanted = wanted_attributes(queue_attributes)
+    if not wanted:
+        return False
 
-    try:
-        queue = connection.get_queue(queue_name)
-        if queue:
-            # Update existing
-            result['changed'] = update_sqs_queue(queue, check_mode=module.check_mode, **queue_attributes)
-
-        else:
-            # Create new
-            if not module.check_mode:
-                queue = connection.create_queue(queue_name)
-                update_sqs_queue(queue, **queue_attributes)
-            result['changed'] = True
+    existing = queue.get_attributes('All')
+    changed = changed_attributes(wanted, existing)
+    if changed and not check_mode:
+        connection.get_status('SetQueueAttributes', attribute_params(changed), queue.id, verb='POST')
+    return bool(changed)
 
-    except BotoServerError:
-        result['msg'] = 'Failed to create/update sqs queue due to error: ' + traceback.format_exc()
-        module.fail_json(**result)
-    else:
-        module.exit_json(**result)
 
+def create_sqs_queue(connection, queue_name, queue_attributes):
+    params = attribute_params(wanted_attributes(queue_attributes))
+    params['QueueName'] = queue_name
+    return connection.get_object('CreateQueue', params, Queue)
 
-def update_sqs_queue(queue,
-                     check_mode=False,
-                     default_visibility_timeout=None,
-                     message_retention_period=None,
-                     maximum_message_size=None,
-                     delivery_delay=None,
-                     receive_message_wait_time=None,
-                     policy=None):
-    changed = False
-
-    changed = set_queue_attribute(queue, 'VisibilityTimeout', default_visibility_timeout,
-                                  check_mode=check_mode) or changed
-    changed = set_queue_attribute(queue, 'MessageRetentionPeriod', message_retention_period,
-                                  check_mode=check_mode) or changed
-    changed = set_queue_attribute(queue, 'MaximumMessageSize', maximum_message_size,
-                                  check_mode=check_mode) or changed
-    changed = set_queue_attribute(queue, 'DelaySeconds', delivery_delay,
-                                  check_mode=check_mode) or changed
-    changed = set_queue_attribute(queue, 'ReceiveMessageWaitTimeSeconds', receive_message_wait_time,
-                                  check_mode=check_mode) or changed
-    changed = set_queue_attribute(queue, 'Policy', policy,
-                                  check_mode=check_mode) or changed
-    return changed
 
+def ensure_sqs_queue(connection, spec, check_mode=False):
+    queue_attributes = dict((option, spec.get(option)) for option, name in QUEUE_ATTRIBUTES)
 
-def set_queue_attribute(queue, attribute, value, check_mode=False):
-    if not value:
-        return False
+    result = dict(
+        region=spec['region'],
+        name=spec['name'],
+    )
+    result.update(queue_attributes)
 
-    try:
-        existing_value = queue.get_attributes(attributes=attribute)[attribute]
-    except:
-        existing_value = ''
-
-    # convert dict attributes to JSON strings (sort keys for comparing)
-    if attribute is 'Policy':
-        value = json.dumps(value, sort_keys=True)
-        if existing_value:
-            existing_value = json.dumps(json.loads(existing_value), sort_keys=True)
+    queue = connection.get_queue(spec['name'])
+    if queue:
+        # Update existing
+        result['changed'] = update_sqs_queue(connection, queue, queue_attributes, check_mode=check_mode)
+    else:
+        # Create new, attributes included
+        if not check_mode:
+            create_sqs_queue(connection, spec['name'], queue_attributes)
+        result['changed'] = True
+    return result
 
-    if str(value) != existing_value:
+
+def remove_sqs_queue(connection, spec, check_mode=False):
+    result = dict(
+        region=spec['region'],
+        name=spec['name'],
+    )
+
+    queue = connection.get_queue(spec['name'])
+    if queue:
         if not check_mode:
-            queue.set_attribute(attribute, value)
-        return True
+            connection.delete_queue(queue)
+        result['changed'] = True
+    else:
+        result['changed'] = False
+    return result
 
-    return False
 
+def queue_specs(module):
+    """ Build the wanted state of every queue from name or queues """
+    defaults = dict((option, module.params.get(option)) for option, name in QUEUE_ATTRIBUTES)
+    defaults['region'] = module.params.get('region')
+    if not module.params.get('queues'):
+        return [dict(defaults, name=module.params.get('name'))]
 
-def delete_sqs_queue(connection, module):
-    queue_name = module.params.get('name')
+    specs = []
+    for item in module.params.get('queues'):
+        if not isinstance(item, dict):
+            item = dict(name=item)
+        if 'name' not in item:
+            module.fail_json(msg='Every entry of queues needs a name', queue=item)
+        spec = dict(defaults)
+        spec.update(item)
+        specs.append(spec)
+    return specs
 
-    result = dict(
-        region=module.params.get('region'),
-        name=queue_name,
-    )
 
+def create_or_update_sqs_queue(connection, module):
+    spec = queue_specs(module)[0]
     try:
-        queue = connection.get_queue(queue_name)
-        if queue:
-            if not module.check_mode:
-                connection.delete_queue(queue)
-            result['changed'] = True
+        result = ensure_sqs_queue(connection, spec, check_mode=module.check_mode)
+    except BotoServerError:
+        result = dict(region=spec['region'], name=spec['name'])
+        result['msg'] = 'Failed to create/update sqs queue due to error: ' + traceback.format_exc()
+        module.fail_json(**result)
+    else:
+        module.exit_json(**result)
 
-        else:
-            result['changed'] = False
 
+def delete_sqs_queue(connection, module):
+    spec = queue_specs(module)[0]
+    try:
+        result = remove_sqs_queue(connection, spec, check_mode=module.check_mode)
     except BotoServerError:
+        result = dict(region=spec['region'], name=spec['name'])
         result['msg'] = 'Failed to delete sqs queue due to error: ' + traceback.format_exc()
         module.fail_json(**result)
     else:
         module.exit_json(**result)
 
 
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def describe_error(e):
+    """ Describe an exception raised by a task of run_concurrently """
+    if getattr(e, 'error_code', None):
+        # BotoServerError
+        return '%s: %s' % (e.error_code, e.error_message)
+    if e.__class__ is Exception:
+        # Raised by the task with a complete message
+        return str(e)
+    return '%s: %s' % (e.__class__.__name__, e)
+
+
+def manage_sqs_queues(connections, module):
+    """ Apply the state to every queue of the queues option on a pool of threads
+
+    boto connections are not thread safe, so every task borrows one of the
+    connections, one per worker, for as long as it runs.
+    """
+    state = module.params.get('state')
+    specs = queue_specs(module)
+    idle = queue_module.Queue()
+    for connection in connections:
+        idle.put(connection)
+
+    def task(spec):
+        def run():
+            connection = idle.get()
+            try:
+                if state == 'present':
+                    return ensure_sqs_queue(connection, spec, check_mode=module.check_mode)
+                return remove_sqs_queue(connection, spec, check_mode=module.check_mode)
+            finally:
+                idle.put(connection)
+        return run
+
+    tasks = dict((spec['name'], task(spec)) for spec in specs)
+    results, errors = run_concurrently(tasks, len(connections))
+
+    if errors:
+        module.fail_json(msg='Failed to manage sqs queue(s) %s' % ', '.join(sorted(errors)),
+                         errors=dict((name, describe_error(e)) for name, e in errors.items()))
+
+    queues = [results[spec['name']] for spec in specs]
+    module.exit_json(changed=any(q['changed'] for q in queues), queues=queues)
+
+
 def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(dict(
         state=dict(default='present', choices=['present', 'absent']),
-        name=dict(required=True, type='str'),
+        name=dict(required=False, type='str'),
+        queues=dict(required=False, type='list'),
+        max_workers=dict(default=MAX_QUEUE_WORKERS, type='int'),
         default_visibility_timeout=dict(type='int'),
         message_retention_period=dict(type='int'),
         maximum_message_size=dict(type='int'),
@@ -228,6 +380,8 @@ def main():
 
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[['name', 'queues']],
+        required_one_of=[['name', 'queues']],
         supports_check_mode=True)
 
     if not HAS_BOTO:
@@ -237,12 +391,18 @@ def main():
     if not region:
         module.fail_json(msg='region must be specified')
 
+    queues = module.params.get('queues') or []
+    workers = max(1, min(module.params.get('max_workers'), len(queues)))
     try:
-        connection = connect_to_aws(boto.sqs, region, **aws_connect_params)
+        connections = [connect_to_aws(boto.sqs, region, **aws_connect_params) for i in range(workers)]
 
     except (NoAuthHandlerFound, AnsibleAWSError), e:
         module.fail_json(msg=str(e))
 
+    if queues:
+        manage_sqs_queues(connections, module)
+
+    connection = connections[0]
     state = module.params.get('state')
     if state == 'present':
         create_or_update_sqs_queue(connection, module)
@@ -28,47 +28,108 @@ options:
     name:
         description:
             - Name of the package
-        required: true
+            - Either this or I(selections) is required.
+        required: false
     selection:
         description:
             - The selection state to set the package to.
+            - Required with I(name).
         choices: [ 'install', 'hold', 'deinstall', 'purge' ]
-        required: true
+        required: false
+    selections:
+        description:
+            - A dictionary of package name to selection state. All current selections are read with a single
+              C(dpkg --get-selections) and all changes are written with a single C(dpkg --set-selections).
+            - Cannot be used together with I(name).
+        required: false
+        version_added: "2.3"
 notes:
     - This module won't cause any packages to be installed/removed/purged, use the C(apt) module for that.
 '''
 EXAMPLES = '''
 # Prevent python from being upgraded.
 - dpkg_selections: name=python selection=hold
+
+# Hold the kernel and several other packages at once
+- dpkg_selections:
+    selections:
+      linux-image-generic: hold
+      linux-headers-generic: hold
+      nginx: hold
+      apache2: deinstall
 '''
 
+selection_states = ['install', 'hold', 'deinstall', 'purge']
+
+def get_selections(module, dpkg, names):
+    """Return a dict of package name -> current selection for names, with a single dpkg call."""
+    rc, out, err = module.run_command([dpkg, '--get-selections'] + names, check_rc=True)
+
+    current = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) != 2:
+            continue
+        package, state = fields
+        current[package] = state
+        # Match unqualified names against multiarch output like "libc6:amd64"
+        current.setdefault(package.split(':')[0], state)
+
+    result = {}
+    for name in names:
+        result[name] = current.get(name, 'not present')
+    return result
+
+def set_selections(module, dpkg, selections):
+    data = "\n".join(["%s %s" % (name, selections[name]) for name in sorted(selections)])
+    module.run_command([dpkg, '--set-selections'], data=data, check_rc=True)
+
 def main():
     module = AnsibleModule(
         argument_spec = dict(
-            name = dict(required=True),
-            selection = dict(choices=['install', 'hold', 'deinstall', 'purge'])
+            name = dict(required=False),
+            selection = dict(choices=selection_states),
+            selections = dict(type='dict'),
         ),
+        required_one_of=[['name', 'selections']],
+        mutually_exclusive=[['name', 'selections']],
+        required_together=[['name', 'selection']],
         supports_check_mode=True,
     )
 
     dpkg = module.get_bin_path('dpkg', True)
 
+    if module.params['selections'] is not None:
+        wanted = module.params['selections']
+        for name, selection in wanted.items():
+            if selection not in selection_states:
+                module.fail_json(msg="selection for %s must be one of: %s" % (name, ", ".join(selection_states)))
+
+        before = get_selections(module, dpkg, list(wanted.keys()))
+        changes = {}
+        diff = {}
+        for name, selection in wanted.items():
+            if before[name] != selection:
+                changes[name] = selection
+                diff[name] = dict(before=before[name], after=selection)
+
+        changed = len(changes) > 0
+        if changed and not module.check_mode:
+            set_selections(module, dpkg, changes)
+        module.exit_json(changed=changed, changes=diff)
+
     name = module.params['name']
     selection = module.params['selection']
 
     # Get current settings.
-    rc, out, err = module.run_command([dpkg, '--get-selections', name], check_rc=True)
-    if not out:
-        current = 'not present'
-    else:
-        current = out.split()[1]
+    current = get_selections(module, dpkg, [name])[name]
 
     changed = current != selection
 
     if module.check_mode or not changed:
       module.exit_json(changed=changed, before=current, after=selection)
 
-    module.run_command([dpkg, '--set-selections'], data="%s %s" % (name, selection), check_rc=True)
+    set_selections(module, dpkg, {name: selection})
     module.exit_json(changed=changed, before=current, after=selection)
 
 
@@ -2,6 +2,10 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+import tempfile
+import threading
+import time
 
 """
 Ansible module to manage elasticsearch plugins
@@ -34,6 +38,8 @@ options:
     name:
         description:
             - Name of the plugin to install. In ES 2.x, the name can be an url or file location
+            - Since Ansible 2.3 this can be a list of plugins. The installed plugins are read once
+              for all of them.
         required: True
     state:
         description:
@@ -79,6 +85,14 @@ options:
               If plugin exists with previous version, it will NOT be updated
         required: False
         default: None
+    cache_dir:
+        description:
+            - Directory to download plugins given as http(s) URLs into before installing them.
+              Missing plugins are downloaded concurrently and then installed from the local files.
+              Archives already in the directory are not downloaded again.
+        required: False
+        default: None
+        version_added: "2.3"
 '''
 
 EXAMPLES = '''
@@ -90,6 +104,23 @@ EXAMPLES = '''
 
 # Uninstall Elasticsearch head plugin
 - elasticsearch_plugin: state=absent name="mobz/elasticsearch-head"
+
+# Install several plugins, downloading the ones given by URL concurrently
+- elasticsearch_plugin:
+    state: present
+    cache_dir: /var/cache/elasticsearch-plugins
+    name:
+      - mobz/elasticsearch-head
+      - https://example.com/plugins/analysis-custom-2.3.3.zip
+      - https://example.com/plugins/repository-custom-2.3.3.zip
+'''
+
+RETURN = '''
+plugins:
+    description: the plugins installed or removed, with the seconds spent downloading and running the plugin tool
+    returned: changed
+    type: list
+    sample: [{"name": "mobz/elasticsearch-head", "cmd": "...", "download_time": 0, "install_time": 4.2}]
 '''
 
 
@@ -116,6 +147,108 @@ def is_plugin_present(plugin_dir, working_dir):
     return os.path.isdir(os.path.join(working_dir, plugin_dir))
 
 
+def get_installed_plugins(working_dir):
+    """Read the installed plugins once from the plugin directory.
+
+    This is what `plugin list` reports, without starting a JVM for it.
+    """
+    if not os.path.isdir(working_dir):
+        return []
+    return [entry for entry in os.listdir(working_dir)
+            if os.path.isdir(os.path.join(working_dir, entry))]
+
+
+# is_url, parse_timeout and download_plugin are kept identical in
+# elasticsearch_plugin.py and kibana_plugin.py
+def is_url(name):
+    return re.match(r'^https?://', name) is not None
+
+
+def parse_timeout(timeout):
+    """Convert a plugin tool timeout like 30s, 1m or 1h into seconds."""
+    match = re.match(r'^(\d+)([smh]?)$', str(timeout))
+    if not match:
+        return 60
+    return int(match.group(1)) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[match.group(2)]
+
+
+def download_plugin(url, cache_dir, timeout):
+    path = os.path.join(cache_dir, re.sub(r'[^\w.-]', '_', url))
+    if os.path.exists(path):
+        return path
+
+    response = open_url(url, timeout=timeout)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir)
+    f = os.fdopen(fd, 'wb')
+    try:
+        while True:
+            chunk = response.read(65536)
+            if not chunk:
+                break
+            f.write(chunk)
+    finally:
+        f.close()
+    os.rename(tmp, path)
+    return path
+
+
+def run_concurrently(tasks, workers):
+    """ Call every callable of the tasks dict on at most workers threads.
+
+    Returns a (results, errors) pair of dicts keyed like tasks, with what
+    each task returned or the exception it raised.
+    """
+    results = {}
+    errors = {}
+    pending = list(tasks)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                key = pending.pop()
+            finally:
+                lock.release()
+            try:
+                results[key] = tasks[key]()
+            except Exception:
+                errors[key] = get_exception()
+
+    threads = []
+    for i in range(min(workers, len(tasks))):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def download_plugins(module, urls, cache_dir, timeout, max_workers=4):
+    """Download plugin archives concurrently into cache_dir.
+
+    Returns a dict of url -> (local path, seconds spent).
+    """
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    def fetch(url):
+        def run():
+            start = time.time()
+            return (download_plugin(url, cache_dir, timeout), time.time() - start)
+        return run
+
+    results, errors = run_concurrently(dict((url, fetch(url)) for url in urls), max_workers)
+
+    if errors:
+        module.fail_json(msg="Failed to download plugins",
+                         errors=dict((url, str(e)) for url, e in errors.items()))
+    return results
+
+
 def parse_error(string):
     reason = "reason: "
     try:
@@ -133,7 +266,7 @@ def main():
 
     module = AnsibleModule(
         argument_spec=dict(
-            name=dict(required=True),
+            name=dict(required=True, type="list"),
             state=dict(default="present", choices=package_state_map.keys()),
             url=dict(default=None),
             timeout=dict(default="1m"),
@@ -141,11 +274,12 @@ def main():
             plugin_dir=dict(default="/usr/share/elasticsearch/plugins/", type="path"),
             proxy_host=dict(default=None),
             proxy_port=dict(default=None),
-            version=dict(default=None)
+            version=dict(default=None),
+            cache_dir=dict(default=None, type="path")
         )
     )
 
-    name = module.params["name"]
+    names = module.params["name"]
     state = module.params["state"]
     url = module.params["url"]
     timeout = module.params["timeout"]
@@ -154,37 +288,66 @@ def main():
     proxy_host = module.params["proxy_host"]
     proxy_port = module.params["proxy_port"]
     version = module.params["version"]
+    cache_dir = module.params["cache_dir"]
 
-    present = is_plugin_present(parse_plugin_repo(name), plugin_dir)
+    installed = get_installed_plugins(plugin_dir)
+    pending = []
+    for name in names:
+        present = parse_plugin_repo(name) in installed
+        if (state == "present" and not present) or (state == "absent" and present):
+            pending.append(name)
 
     # skip if the state is correct
-    if (present and state == "present") or (state == "absent" and not present):
-        module.exit_json(changed=False, name=name)
+    if not pending:
+        module.exit_json(changed=False, name=",".join(names))
+
+    downloads = {}
+    if state == "present" and cache_dir:
+        downloads = download_plugins(module, [name for name in pending if is_url(name)],
+                                     cache_dir, parse_timeout(timeout))
+
+    plugins = []
+    outs = []
+    errs = []
+    for name in pending:
+        download_time = 0
+        if name in downloads:
+            source, download_time = downloads[name]
+            source = "file://" + source
+        else:
+            source = name
+            if (version):
+                source = source + '/' + version
 
-    if (version):
-       name = name + '/' + version
+        cmd_args = [plugin_bin, package_state_map[state], source]
 
-    cmd_args = [plugin_bin, package_state_map[state], name]
+        if proxy_host and proxy_port:
+            cmd_args.append("-DproxyHost=%s -DproxyPort=%s" % (proxy_host, proxy_port))
 
-    if proxy_host and proxy_port:
-        cmd_args.append("-DproxyHost=%s -DproxyPort=%s" % proxy_host, proxy_port)
+        if url:
+            cmd_args.append("--url %s" % url)
 
-    if url:
-        cmd_args.append("--url %s" % url)
+        if timeout:
+            cmd_args.append("--timeout %s" % timeout)
 
-    if timeout:
-        cmd_args.append("--timeout %s" % timeout)
+        cmd = " ".join(cmd_args)
 
-    cmd = " ".join(cmd_args)
+        start = time.time()
+        rc, out, err = module.run_command(cmd)
 
-    rc, out, err = module.run_command(cmd)
+        if rc != 0:
+            reason = parse_error(out)
+            module.fail_json(msg=reason, name=name, plugins=plugins)
 
-    if rc != 0:
-        reason = parse_error(out)
-        module.fail_json(msg=reason)
+        plugins.append(dict(name=name, cmd=cmd, download_time=download_time, install_time=time.time() - start))
+        outs.append(out)
+        errs.append(err)
 
-    module.exit_json(changed=True, cmd=cmd, name=name, state=state, url=url, timeout=timeout, stdout=out, stderr=err)
+    cmd = "; ".join([plugin["cmd"] for plugin in plugins])
+    module.exit_json(changed=True, cmd=cmd, name=",".join(pending), state=state, url=url, timeout=timeout,
+                     stdout="\n".join(outs), stderr="\n".join(errs), plugins=plugins)
 
 from ansible.module_utils.basic import *
+from ansible.module_utils.urls import open_url
 
 main()
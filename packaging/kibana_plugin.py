@@ -22,6 +22,9 @@ along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import os
+import re
+import tempfile
+import time
 
 DOCUMENTATION = '''
 ---
@@ -35,6 +38,8 @@ options:
     name:
         description:
             - Name of the plugin to install
+            - Since Ansible 2.3 this can be a list of plugins. The installed plugins are read once
+              for all of them.
         required: True
     state:
         description:
@@ -75,6 +80,15 @@ options:
         required: False
         choices: ["yes", "no"]
         default: no
+    cache_dir:
+        description:
+            - Directory to download the plugin given by an http(s) I(url) into before installing it.
+              The plugin is then installed from the local file, and an archive already in the
+              directory is not downloaded again.
+            - Together with I(url), only a single plugin can be given in I(name).
+        required: False
+        default: None
+        version_added: "2.3"
 '''
 
 EXAMPLES = '''
@@ -86,6 +100,21 @@ EXAMPLES = '''
 
 # Uninstall Elasticsearch head plugin
 - kibana_plugin: state=absent name="elasticsearch/marvel"
+
+# Install several plugins at once
+- kibana_plugin:
+    state: present
+    name:
+      - elasticsearch/marvel/2.3.3
+      - elastic/sense
+      - elastic/timelion
+
+# Install a plugin from a URL, keeping the archive for later runs
+- kibana_plugin:
+    state: present
+    name: logtrail
+    url: https://example.com/plugins/logtrail-4.x-0.1.14.tar.gz
+    cache_dir: /var/cache/kibana-plugins
 '''
 
 RETURN = '''
@@ -117,6 +146,11 @@ state:
     description: the state for the managed plugin
     returned: success
     type: string
+plugins:
+    description: the plugins installed or removed, with the seconds spent downloading and running the plugin tool
+    returned: changed
+    type: list
+    sample: [{"name": "elasticsearch/marvel", "cmd": "...", "download_time": 0, "install_time": 6.1}]
 '''
 
 PACKAGE_STATE_MAP = dict(
@@ -145,6 +179,47 @@ def parse_plugin_repo(string):
 def is_plugin_present(plugin_dir, working_dir):
     return os.path.isdir(os.path.join(working_dir, plugin_dir))
 
+def get_installed_plugins(working_dir):
+    """Read the installed plugins once from the plugin directory.
+
+    This is what `plugin list` reports, without starting a JVM for it.
+    """
+    if not os.path.isdir(working_dir):
+        return []
+    return [entry for entry in os.listdir(working_dir)
+            if os.path.isdir(os.path.join(working_dir, entry))]
+
+# is_url, parse_timeout and download_plugin are kept identical in
+# elasticsearch_plugin.py and kibana_plugin.py
+def is_url(name):
+    return re.match(r'^https?://', name) is not None
+
+def parse_timeout(timeout):
+    """Convert a plugin tool timeout like 30s, 1m or 1h into seconds."""
+    match = re.match(r'^(\d+)([smh]?)$', str(timeout))
+    if not match:
+        return 60
+    return int(match.group(1)) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[match.group(2)]
+
+def download_plugin(url, cache_dir, timeout):
+    path = os.path.join(cache_dir, re.sub(r'[^\w.-]', '_', url))
+    if os.path.exists(path):
+        return path
+
+    response = open_url(url, timeout=timeout)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir)
+    f = os.fdopen(fd, 'wb')
+    try:
+        while True:
+            chunk = response.read(65536)
+            if not chunk:
+                break
+            f.write(chunk)
+    finally:
+        f.close()
+    os.rename(tmp, path)
+    return path
+
 def parse_error(string):
     reason = "reason: "
     try:
@@ -191,19 +266,20 @@ def remove_plugin(module, plugin_bin, plugin_name):
 def main():
     module = AnsibleModule(
         argument_spec=dict(
-            name=dict(required=True),
+            name=dict(required=True, type="list"),
             state=dict(default="present", choices=PACKAGE_STATE_MAP.keys()),
             url=dict(default=None),
             timeout=dict(default="1m"),
             plugin_bin=dict(default="/opt/kibana/bin/kibana", type="path"),
             plugin_dir=dict(default="/opt/kibana/installedPlugins/", type="path"),
             version=dict(default=None),
-            force=dict(default="no", type="bool")
+            force=dict(default="no", type="bool"),
+            cache_dir=dict(default=None, type="path")
         ),
         supports_check_mode=True,
     )
 
-    name        = module.params["name"]
+    names       = module.params["name"]
     state       = module.params["state"]
     url         = module.params["url"]
     timeout     = module.params["timeout"]
@@ -211,27 +287,64 @@ def main():
     plugin_dir  = module.params["plugin_dir"]
     version     = module.params["version"]
     force       = module.params["force"]
-
-    present = is_plugin_present(parse_plugin_repo(name), plugin_dir)
-
-    # skip if the state is correct
-    if (present and state == "present" and not force) or (state == "absent" and not present and not force):
-        module.exit_json(changed=False, name=name, state=state)
-
-    if (version):
-        name = name + '/' + version
-
-    if state == "present":
-        if force:
-            remove_plugin(module, plugin_bin, name)
-        changed, cmd, out, err = install_plugin(module, plugin_bin, name, url, timeout)
-
-    elif state == "absent":
-        changed, cmd, out, err = remove_plugin(module, plugin_bin, name)
-
-    module.exit_json(changed=changed, cmd=cmd, name=name, state=state, url=url, timeout=timeout, stdout=out, stderr=err)
+    cache_dir   = module.params["cache_dir"]
+
+    if url and len(names) > 1:
+        module.fail_json(msg="url can only be used with a single plugin name")
+
+    installed = get_installed_plugins(plugin_dir)
+    pending = []
+    for name in names:
+        present = parse_plugin_repo(name) in installed
+        # skip if the state is correct
+        if force or (state == "present" and not present) or (state == "absent" and present):
+            pending.append(name)
+
+    if not pending:
+        module.exit_json(changed=False, name=",".join(names), state=state)
+
+    downloads = {}
+    if state == "present" and cache_dir and url and is_url(url) and not module.check_mode:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        start = time.time()
+        try:
+            downloads[url] = (download_plugin(url, cache_dir, parse_timeout(timeout)), time.time() - start)
+        except Exception:
+            module.fail_json(msg="Failed to download plugin from %s: %s" % (url, str(get_exception())))
+
+    plugins = []
+    outs = []
+    errs = []
+    for name in pending:
+        if (version):
+            name = name + '/' + version
+
+        download_time = 0
+        plugin_url = url
+        if url in downloads:
+            plugin_url, download_time = downloads[url]
+            plugin_url = "file://" + plugin_url
+
+        start = time.time()
+        if state == "present":
+            if force:
+                remove_plugin(module, plugin_bin, name)
+            changed, cmd, out, err = install_plugin(module, plugin_bin, name, plugin_url, timeout)
+
+        elif state == "absent":
+            changed, cmd, out, err = remove_plugin(module, plugin_bin, name)
+
+        plugins.append(dict(name=name, cmd=cmd, download_time=download_time, install_time=time.time() - start))
+        outs.append(out)
+        errs.append(err)
+
+    cmd = "; ".join([plugin["cmd"] for plugin in plugins])
+    module.exit_json(changed=True, cmd=cmd, name=",".join([plugin["name"] for plugin in plugins]), state=state,
+                     url=url, timeout=timeout, stdout="\n".join(outs), stderr="\n".join(errs), plugins=plugins)
 
 from ansible.module_utils.basic import *
+from ansible.module_utils.urls import open_url
 
 if __name__ == '__main__':
     main()
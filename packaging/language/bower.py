@@ -64,6 +64,16 @@ options:
     description:
       - The version to be installed
     required: false
+  check_outdated:
+    description:
+      - With C(state=latest), let C(bower list) query the registries for newer versions.
+      - If C(no), the package list is read with C(--offline) and only missing or
+        incompatible packages are updated, which avoids the network query when
+        versions are pinned.
+    required: false
+    default: yes
+    choices: [ "yes", "no" ]
+    version_added: "2.3"
 '''
 
 EXAMPLES = '''
@@ -82,6 +92,9 @@ description: Install packages based on bower.json.
 description: Update packages based on bower.json to their latest version.
 - bower: path=/app/location state=latest
 
+description: Fix missing or incompatible packages without querying the registries.
+- bower: path=/app/location state=latest check_outdated=no
+
 description: install bower locally and run from there
 - npm: path=/app/location name=bower global=no
 - bower: path=/app/location relative_execpath=node_modules/.bin
@@ -97,6 +110,8 @@ class Bower(object):
         self.path = kwargs['path']
         self.relative_execpath = kwargs['relative_execpath']
         self.version = kwargs['version']
+        self.check_outdated = kwargs['check_outdated']
+        self._state = None
 
         if kwargs['version']:
             self.name_version = self.name + '#' + self.version
@@ -139,13 +154,20 @@ class Bower(object):
             return out
         return ''
 
-    def list(self):
-        cmd = ['list', '--json']
+    def state(self):
+        """Return the parsed `bower list --json` output, read once per run."""
+        if self._state is None:
+            cmd = ['list', '--json']
+            if not self.check_outdated and not self.offline:
+                cmd.append('--offline')
+            self._state = json.loads(self._exec(cmd, True, False))
+        return self._state
 
+    def list(self):
         installed = list()
         missing = list()
         outdated = list()
-        data = json.loads(self._exec(cmd, True, False))
+        data = self.state()
         if 'dependencies' in data:
             for dep in data['dependencies']:
                 dep_data = data['dependencies'][dep]
@@ -166,12 +188,15 @@ class Bower(object):
         return installed, missing, outdated
 
     def install(self):
+        self._state = None
         return self._exec(['install'])
 
     def update(self):
+        self._state = None
         return self._exec(['update'])
 
     def uninstall(self):
+        self._state = None
         return self._exec(['uninstall'])
 
 
@@ -184,6 +209,7 @@ def main():
         relative_execpath=dict(default=None, required=False, type='path'),
         state=dict(default='present', choices=['present', 'absent', 'latest', ]),
         version=dict(default=None),
+        check_outdated=dict(default='yes', type='bool'),
     )
     module = AnsibleModule(
         argument_spec=arg_spec
@@ -196,11 +222,12 @@ def main():
     relative_execpath = module.params['relative_execpath']
     state = module.params['state']
     version = module.params['version']
+    check_outdated = module.params['check_outdated']
 
     if state == 'absent' and not name:
         module.fail_json(msg='uninstalling a package is only available for named packages')
 
-    bower = Bower(module, name=name, offline=offline, production=production, path=path, relative_execpath=relative_execpath, version=version)
+    bower = Bower(module, name=name, offline=offline, production=production, path=path, relative_execpath=relative_execpath, version=version, check_outdated=check_outdated)
 
     changed = False
     if state == 'present':
@@ -98,6 +98,16 @@ options:
         default: "no"
         choices: [ "yes", "no" ]
         aliases: [ "ignore-platform-reqs" ]
+    check_lock:
+        version_added: "2.3"
+        description:
+            - For the C(install) command, compare composer.lock with the installed packages recorded in
+              vendor/composer/installed.json and do not run composer at all when every locked package is
+              already installed at its locked version.
+            - Scripts and the autoloader dump are skipped as well in that case.
+        required: false
+        default: "no"
+        choices: [ "yes", "no" ]
 requirements:
     - php
     - composer installed in bin path (recommended /usr/local/bin)
@@ -114,6 +124,9 @@ EXAMPLES = '''
     arguments: "my/package"
     working_dir: "/path/to/project"
 
+# Only run composer when composer.lock and the vendor directory differ
+- composer: command=install working_dir=/path/to/project check_lock=yes
+
 # Clone project and install with all dependencies
 - composer:
     command: "create-project"
@@ -151,6 +164,52 @@ def get_available_options(module, command='install'):
     command_help_json = json.loads(out)
     return command_help_json['definition']['options']
 
+def read_json(path):
+    f = open(path)
+    try:
+        return json.load(f)
+    finally:
+        f.close()
+
+def package_versions(packages):
+    versions = {}
+    for package in packages:
+        reference = None
+        if package.get('source'):
+            reference = package['source'].get('reference')
+        versions[package['name']] = (package.get('version'), reference)
+    return versions
+
+def lock_satisfied(working_dir, no_dev):
+    """Check composer.lock against vendor/composer/installed.json, reading each file once."""
+    lock_path = os.path.join(working_dir, 'composer.lock')
+    if not os.path.exists(lock_path):
+        return False
+
+    vendor_dir = 'vendor'
+    composer_json = os.path.join(working_dir, 'composer.json')
+    if os.path.exists(composer_json):
+        vendor_dir = read_json(composer_json).get('config', {}).get('vendor-dir', vendor_dir)
+    installed_path = os.path.join(working_dir, vendor_dir, 'composer', 'installed.json')
+    if not os.path.exists(installed_path):
+        return False
+
+    lock = read_json(lock_path)
+    locked = lock.get('packages', [])
+    if not no_dev:
+        locked = locked + lock.get('packages-dev', [])
+
+    installed = read_json(installed_path)
+    # Composer 2 wraps the list of installed packages in an object
+    if isinstance(installed, dict):
+        installed = installed.get('packages', [])
+
+    installed = package_versions(installed)
+    for name, version in package_versions(locked).items():
+        if installed.get(name) != version:
+            return False
+    return True
+
 def composer_command(module, command, arguments = "", options=[]):
     php_path      = module.get_bin_path("php", True, ["/usr/local/bin"])
     composer_path = module.get_bin_path("composer", True, ["/usr/local/bin"])
@@ -170,6 +229,7 @@ def main():
             no_plugins           = dict(default="no", type="bool", aliases=["no-plugins"]),
             optimize_autoloader  = dict(default="yes", type="bool", aliases=["optimize-autoloader"]),
             ignore_platform_reqs = dict(default="no", type="bool", aliases=["ignore-platform-reqs"]),
+            check_lock           = dict(default="no", type="bool"),
         ),
         supports_check_mode=True
     )
@@ -180,6 +240,11 @@ def main():
         module.fail_json(msg="Use the 'arguments' param for passing arguments with the 'command'")
 
     arguments = module.params['arguments']
+
+    if command == 'install' and module.params['check_lock'] and \
+            lock_satisfied(os.path.abspath(module.params['working_dir']), module.params['no_dev']):
+        module.exit_json(changed=False, msg="All packages in composer.lock are already installed")
+
     available_options = get_available_options(module=module, command=command)
 
     options = []
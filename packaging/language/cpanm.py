@@ -30,6 +30,8 @@ options:
   name:
     description:
       - The name of the Perl library to install. You may use the "full distribution path", e.g.  MIYAGAWA/Plack-0.99_05.tar.gz
+      - Since Ansible 2.3 this may also be a list of libraries. Their installed state is checked with a
+        single perl process and the missing ones are installed with a single cpanm run.
     required: false
     default: null
     aliases: ["pkg"]
@@ -114,22 +116,64 @@ EXAMPLES = '''
 # install Dancer if it's not already installed
 # OR the installed version is older than version 1.0
 - cpanm: name=Dancer version=1.0
+
+# install a whole application stack into a locallib with one cpanm run
+- cpanm:
+    name:
+      - Dancer
+      - Plack
+      - Template
+      - DBD::Pg
+    locallib: /srv/webapps/my_app/extlib
 '''
 
-def _is_package_installed(module, name, locallib, cpanm, version):
-    cmd = ""
+import re
+
+# Locates each module in @INC and reads its $VERSION without loading it,
+# so a single perl process can check any number of modules.
+_INSTALLED_SCRIPT = r"""
+use strict;
+use ExtUtils::MakeMaker ();
+my $want = shift @ARGV;
+for my $name (@ARGV) {
+    (my $file = "$name.pm") =~ s{::}{/}g;
+    my ($dir) = grep { !ref($_) && -f "$_/$file" } @INC;
+    if (!defined $dir) {
+        print "$name\tmissing\n";
+        next;
+    }
+    my $have = MM->parse_version("$dir/$file");
+    my $ok = 1;
+    if (length $want) {
+        require version;
+        $ok = eval { version->parse($have) >= version->parse($want) } ? 1 : 0;
+    }
+    print "$name\t" . ($ok ? "installed" : "outdated") . "\n";
+}
+"""
+
+def _get_installed_packages(module, names, locallib, version):
+    """Return the subset of names that are installed (at version or newer)."""
     if locallib:
         os.environ["PERL5LIB"] = "%s/lib/perl5" % locallib
-    cmd = "%s perl -e ' use %s" % (cmd, name)
-    if version:
-       cmd = "%s %s;'" % (cmd, version)
-    else:
-       cmd = "%s;'" % cmd
+
+    # Only plain module names can be looked up, distribution paths and
+    # URLs are always handed to cpanm.
+    modules = [name for name in names if re.match(r'^\w+(::\w+)*$', name)]
+    if not modules:
+        return []
+
+    cmd = ['perl', '-e', _INSTALLED_SCRIPT, version or ''] + modules
     res, stdout, stderr = module.run_command(cmd, check_rc=False)
-    if res == 0:
-       return True
-    else:
-       return False
+    if res != 0:
+        module.fail_json(msg="could not check installed modules: %s" % stderr, cmd=cmd)
+
+    installed = []
+    for line in stdout.splitlines():
+        fields = line.split('\t')
+        if len(fields) == 2 and fields[1] == 'installed':
+            installed.append(fields[0])
+    return installed
 
 def _build_cmd_line(name, from_path, notest, locallib, mirror, mirror_only, installdeps, cpanm, use_sudo):
     # this code should use "%s" like everything else and just return early but not fixing all of it now.
@@ -137,7 +181,7 @@ def _build_cmd_line(name, from_path, notest, locallib, mirror, mirror_only, inst
     if from_path:
         cmd = cpanm + " " + from_path
     else:
-        cmd = cpanm + " " + name
+        cmd = cpanm + " " + " ".join(name)
 
     if notest is True:
         cmd = cmd + " -n"
@@ -169,7 +213,7 @@ def _get_cpanm_path(module):
 
 def main():
     arg_spec = dict(
-        name=dict(default=None, required=False, aliases=['pkg']),
+        name=dict(default=None, required=False, aliases=['pkg'], type='list'),
         from_path=dict(default=None, required=False, type='path'),
         notest=dict(default=False, type='bool'),
         locallib=dict(default=None, required=False, type='path'),
@@ -199,10 +243,13 @@ def main():
 
     changed   = False
 
-    installed = _is_package_installed(module, name, locallib, cpanm, version)
+    missing = []
+    if name:
+        installed = _get_installed_packages(module, name, locallib, version)
+        missing = [pkg for pkg in name if pkg not in installed]
 
-    if not installed:
-        cmd       = _build_cmd_line(name, from_path, notest, locallib, mirror, mirror_only, installdeps, cpanm, use_sudo)
+    if missing or (from_path and not name):
+        cmd       = _build_cmd_line(missing, from_path, notest, locallib, mirror, mirror_only, installdeps, cpanm, use_sudo)
 
         rc_cpanm, out_cpanm, err_cpanm = module.run_command(cmd, check_rc=False)
 
@@ -24,7 +24,9 @@ __author__ = 'cschmidt'
 from lxml import etree
 import os
 import hashlib
+import shutil
 import sys
+import tempfile
 import posixpath
 import urlparse
 from ansible.module_utils.basic import *
@@ -109,6 +111,33 @@ options:
         default: 'yes'
         choices: ['yes', 'no']
         version_added: "1.9.3"
+    checksum_algorithm:
+        description:
+            - The checksum published next to the artifact in the repository (C(.md5), C(.sha1) or C(.sha256))
+              that is used to verify the download and to decide whether I(dest) is already up to date.
+            - The artifact is hashed while it is being downloaded, so it is never read back from disk.
+        required: false
+        default: md5
+        choices: ['md5', 'sha1', 'sha256']
+        version_added: "2.3"
+    cache_dir:
+        description:
+            - A local directory used as a content-addressed cache of downloaded artifacts, keyed by checksum.
+              Deploying the same artifact to several destinations on one host downloads it only once.
+            - C(maven-metadata.xml) files are cached here as well and only downloaded again when the
+              repository reports that they have changed.
+        required: false
+        default: null
+        version_added: "2.3"
+    resume:
+        description:
+            - If C(yes), an interrupted download left in C(<dest>.part) is resumed with an HTTP range request
+              instead of being started over. Downloads are only resumed when the repository publishes a
+              checksum to verify the result against.
+        required: false
+        default: 'yes'
+        choices: ['yes', 'no']
+        version_added: "2.3"
 '''
 
 EXAMPLES = '''
@@ -123,6 +152,9 @@ EXAMPLES = '''
 
 # Download a WAR File to the Tomcat webapps directory to be deployed
 - maven_artifact: group_id=com.company artifact_id=web-app extension=war repository_url=https://repo.company.com/maven dest=/var/lib/tomcat7/webapps/web-app.war
+
+# Verify with SHA-1 and share downloads between applications on the same host
+- maven_artifact: group_id=com.company artifact_id=library-name checksum_algorithm=sha1 cache_dir=/var/cache/maven_artifact dest=/opt/app1/lib/
 '''
 
 class Artifact(object):
@@ -193,16 +225,21 @@ class Artifact(object):
 
 
 class MavenDownloader:
-    def __init__(self, module, base="http://repo1.maven.org/maven2"):
+    def __init__(self, module, base="http://repo1.maven.org/maven2", checksum_algorithm="md5", cache_dir=None, resume=True):
         self.module = module
         if base.endswith("/"):
             base = base.rstrip("/")
         self.base = base
         self.user_agent = "Maven Artifact Downloader/1.0"
+        self.checksum_algorithm = checksum_algorithm
+        self.cache_dir = cache_dir
+        self.resume = resume
+        self._metadata = {}
+        self._checksums = {}
 
     def _find_latest_version_available(self, artifact):
         path = "/%s/maven-metadata.xml" % (artifact.path(False))
-        xml = self._request(self.base + path, "Failed to download maven-metadata.xml", lambda r: etree.parse(r))
+        xml = self._metadata_xml(self.base + path)
         v = xml.xpath("/metadata/versioning/versions/version[last()]/text()")
         if v:
             return v[0]
@@ -213,7 +250,7 @@ class MavenDownloader:
 
         if artifact.is_snapshot():
             path = "/%s/maven-metadata.xml" % (artifact.path())
-            xml = self._request(self.base + path, "Failed to download maven-metadata.xml", lambda r: etree.parse(r))
+            xml = self._metadata_xml(self.base + path)
             timestamp = xml.xpath("/metadata/versioning/snapshot/timestamp/text()")[0]
             buildNumber = xml.xpath("/metadata/versioning/snapshot/buildNumber/text()")[0]
             return self._uri_for_artifact(artifact, artifact.version.replace("SNAPSHOT", timestamp + "-" + buildNumber))
@@ -230,7 +267,7 @@ class MavenDownloader:
 
         return posixpath.join(self.base, artifact.path(), artifact.artifact_id + "-" + version + "." + artifact.extension)
 
-    def _request(self, url, failmsg, f):
+    def _request(self, url, failmsg, f, headers=None, accept=(200,)):
         url_to_use = url
         parsed_url = urlparse(url)
         if parsed_url.scheme=='s3':
@@ -245,33 +282,154 @@ class MavenDownloader:
         self.module.params['url_password'] = self.module.params.get('password', '')
         self.module.params['http_agent'] = self.module.params.get('user_agent', None)
 
-        response, info = fetch_url(self.module, url_to_use)
-        if info['status'] != 200:
+        response, info = fetch_url(self.module, url_to_use, headers=headers)
+        if info['status'] not in accept:
             raise ValueError(failmsg + " because of " + info['msg'] + "for URL " + url_to_use)
         else:
-            return f(response)
-
+            return f(response, info)
+
+    def _metadata_xml(self, url):
+        """Fetch and parse a maven-metadata.xml once per run.
+
+        With a cache_dir, the file is stored along with its ETag and
+        Last-Modified headers and revalidated with a conditional GET.
+        """
+        if url in self._metadata:
+            return self._metadata[url]
+
+        if not self.cache_dir:
+            xml = self._request(url, "Failed to download maven-metadata.xml", lambda r, i: etree.parse(r))
+            self._metadata[url] = xml
+            return xml
+
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        cached = os.path.join(self.cache_dir, 'metadata', key + '.xml')
+        validators = os.path.join(self.cache_dir, 'metadata', key + '.headers')
+
+        headers = {}
+        if os.path.exists(cached) and os.path.exists(validators):
+            f = open(validators)
+            for line in f:
+                name, _, value = line.strip().partition(': ')
+                if name == 'etag':
+                    headers['If-None-Match'] = value
+                elif name == 'last-modified':
+                    headers['If-Modified-Since'] = value
+            f.close()
+
+        def store(response, info):
+            if info['status'] == 304:
+                return
+            self._write_atomic(cached, response.read())
+            lines = []
+            for name in ('etag', 'last-modified'):
+                if info.get(name):
+                    lines.append("%s: %s\n" % (name, info[name]))
+            self._write_atomic(validators, ''.join(lines))
+
+        self._request(url, "Failed to download maven-metadata.xml", store, headers=headers, accept=(200, 304))
+        xml = etree.parse(cached)
+        self._metadata[url] = xml
+        return xml
+
+    def _write_atomic(self, path, content):
+        directory = os.path.dirname(path)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        f = os.fdopen(fd, 'wb')
+        f.write(content)
+        f.close()
+        os.rename(tmp, path)
+
+    def remote_checksum(self, url):
+        """Return the published checksum of an artifact URL, or None if the repository has none."""
+        if url not in self._checksums:
+            checksum_url = url + "." + self.checksum_algorithm
+            try:
+                content = self._request(checksum_url, "Failed to download checksum", lambda r, i: r.read())
+                # Some repositories publish "<digest>  <filename>"
+                self._checksums[url] = content.split()[0].strip().lower()
+            except ValueError:
+                self._checksums[url] = None
+        return self._checksums[url]
+
+    def _cache_path(self, digest):
+        return os.path.join(self.cache_dir, self.checksum_algorithm, digest[:2], digest)
 
     def download(self, artifact, filename=None):
+        """Make filename match the artifact. Returns True if it was changed."""
         filename = artifact.get_filename(filename)
         if not artifact.version or artifact.version == "latest":
             artifact = Artifact(artifact.group_id, artifact.artifact_id, self._find_latest_version_available(artifact),
                                 artifact.classifier, artifact.extension)
 
         url = self.find_uri_for_artifact(artifact)
-        if not self.verify_md5(filename, url + ".md5"):
-            response = self._request(url, "Failed to download artifact " + str(artifact), lambda r: r)
-            if response:
-                f = open(filename, 'w')
-                # f.write(response.read())
-                self._write_chunks(response, f, report_hook=self.chunk_report)
-                f.close()
-                return True
-            else:
-                return False
-        else:
+        remote = self.remote_checksum(url)
+        if remote is not None and os.path.exists(filename) and self._local_checksum(filename) == remote:
+            return False
+
+        partial = filename + ".part"
+        if remote is not None and self.cache_dir and os.path.exists(self._cache_path(remote)):
+            self._copy_atomic(self._cache_path(remote), filename)
+            if os.path.exists(partial):
+                os.remove(partial)
             return True
 
+        # Only resume when the result can be verified
+        digest = self._fetch(artifact, url, partial, resume=remote is not None)
+        if remote is not None and digest != remote:
+            # A stale partial file from an older build of the artifact, start over once
+            os.remove(partial)
+            digest = self._fetch(artifact, url, partial)
+            if digest != remote:
+                os.remove(partial)
+                raise ValueError("Checksum mismatch for artifact %s: expected %s, got %s" % (artifact, remote, digest))
+
+        if self.cache_dir:
+            self._copy_atomic(partial, self._cache_path(digest))
+        self.module.atomic_move(partial, filename)
+        return True
+
+    def _fetch(self, artifact, url, partial, resume=True):
+        """Stream url into partial, resuming it if allowed and possible, and return its checksum."""
+        digest = hashlib.new(self.checksum_algorithm)
+        offset = 0
+        headers = None
+        if resume and self.resume and os.path.exists(partial):
+            offset = os.path.getsize(partial)
+            headers = {'Range': 'bytes=%d-' % offset}
+
+        response, status = self._request(url, "Failed to download artifact " + str(artifact),
+                                         lambda r, i: (r, i['status']), headers=headers, accept=(200, 206, 416))
+        if status == 416:
+            # Nothing past the end of the partial file: it is complete, or
+            # longer than the artifact and fails the checksum
+            return self._local_checksum(partial)
+        if status == 206:
+            # Seed the hash with what is already on disk, then append
+            f = open(partial, 'rb')
+            for chunk in iter(lambda: f.read(8192), b''):
+                digest.update(chunk)
+            f.close()
+            f = open(partial, 'ab')
+        else:
+            f = open(partial, 'wb')
+        try:
+            self._write_chunks(response, f, report_hook=self.chunk_report, digest=digest)
+        finally:
+            f.close()
+        return digest.hexdigest()
+
+    def _copy_atomic(self, src, dest):
+        directory = os.path.dirname(dest)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        fd, tmp = tempfile.mkstemp(dir=directory)
+        os.close(fd)
+        shutil.copyfile(src, tmp)
+        os.rename(tmp, dest)
+
     def chunk_report(self, bytes_so_far, chunk_size, total_size):
         percent = float(bytes_so_far) / total_size
         percent = round(percent * 100, 2)
@@ -281,9 +439,12 @@ class MavenDownloader:
         if bytes_so_far >= total_size:
             sys.stdout.write('\n')
 
-    def _write_chunks(self, response, file, chunk_size=8192, report_hook=None):
-        total_size = response.info().getheader('Content-Length').strip()
-        total_size = int(total_size)
+    def _write_chunks(self, response, file, chunk_size=8192, report_hook=None, digest=None):
+        total_size = response.info().getheader('Content-Length')
+        if total_size is None:
+            report_hook = None
+        else:
+            total_size = int(total_size.strip())
         bytes_so_far = 0
 
         while 1:
@@ -294,26 +455,20 @@ class MavenDownloader:
                 break
 
             file.write(chunk)
+            if digest:
+                digest.update(chunk)
             if report_hook:
                 report_hook(bytes_so_far, chunk_size, total_size)
 
         return bytes_so_far
 
-    def verify_md5(self, file, remote_md5):
-        if not os.path.exists(file):
-            return False
-        else:
-            local_md5 = self._local_md5(file)
-            remote = self._request(remote_md5, "Failed to download MD5", lambda r: r.read())
-            return local_md5 == remote
-
-    def _local_md5(self, file):
-        md5 = hashlib.md5()
+    def _local_checksum(self, file):
+        digest = hashlib.new(self.checksum_algorithm)
         f = open(file, 'rb')
-        for chunk in iter(lambda: f.read(8192), ''):
-            md5.update(chunk)
+        for chunk in iter(lambda: f.read(8192), b''):
+            digest.update(chunk)
         f.close()
-        return md5.hexdigest()
+        return digest.hexdigest()
 
 
 def main():
@@ -330,6 +485,9 @@ def main():
             state = dict(default="present", choices=["present","absent"]), # TODO - Implement a "latest" state
             dest = dict(type="path", default=None),
             validate_certs = dict(required=False, default=True, type='bool'),
+            checksum_algorithm = dict(default='md5', choices=['md5', 'sha1', 'sha256']),
+            cache_dir = dict(type="path", default=None),
+            resume = dict(default=True, type='bool'),
         )
     )
 
@@ -356,31 +514,23 @@ def main():
         repository_url = "http://repo1.maven.org/maven2"
 
     #downloader = MavenDownloader(module, repository_url, repository_username, repository_password)
-    downloader = MavenDownloader(module, repository_url)
+    downloader = MavenDownloader(module, repository_url, module.params["checksum_algorithm"],
+                                 module.params["cache_dir"], module.params["resume"])
 
     try:
         artifact = Artifact(group_id, artifact_id, version, classifier, extension)
     except ValueError as e:
         module.fail_json(msg=e.args[0])
 
-    prev_state = "absent"
     if os.path.isdir(dest):
         dest = posixpath.join(dest, artifact_id + "-" + version + "." + extension)
-    if os.path.lexists(dest) and downloader.verify_md5(dest, downloader.find_uri_for_artifact(artifact) + '.md5'):
-        prev_state = "present"
-    else:
-        path = os.path.dirname(dest)
-        if not os.path.exists(path):
-            os.makedirs(path)
-
-    if prev_state == "present":
-        module.exit_json(dest=dest, state=state, changed=False)
+    path = os.path.dirname(dest)
+    if not os.path.exists(path):
+        os.makedirs(path)
 
     try:
-        if downloader.download(artifact, dest):
-            module.exit_json(state=state, dest=dest, group_id=group_id, artifact_id=artifact_id, version=version, classifier=classifier, extension=extension, repository_url=repository_url, changed=True)
-        else:
-            module.fail_json(msg="Unable to download the artifact")
+        changed = downloader.download(artifact, dest)
+        module.exit_json(state=state, dest=dest, group_id=group_id, artifact_id=artifact_id, version=version, classifier=classifier, extension=extension, repository_url=repository_url, changed=changed)
     except ValueError as e:
         module.fail_json(msg=e.args[0])
 
@@ -74,6 +74,18 @@ options:
     required: false
     default: present
     choices: [ "present", "absent", "latest" ]
+  check_outdated:
+    description:
+      - With C(state=latest), query the registry with C(npm outdated) to find
+        packages with newer versions available.
+      - If C(no), only packages that are missing or do not match the version
+        in package.json are updated, which avoids the network query when
+        versions are pinned. A pinned I(version) of a named package is always
+        compared locally.
+    required: false
+    choices: [ "yes", "no" ]
+    default: yes
+    version_added: "2.3"
 '''
 
 EXAMPLES = '''
@@ -100,9 +112,13 @@ description: Update packages based on package.json to their latest version.
 
 description: Install packages based on package.json using the npm installed with nvm v0.10.1.
 - npm: path=/app/location executable=/opt/nvm/v0.10.1/bin/npm state=present
+
+description: Bring packages in line with the pinned versions in package.json without querying the registry.
+- npm: path=/app/location state=latest check_outdated=no
 '''
 
 import os
+import re
 
 try:
     import json
@@ -124,6 +140,8 @@ class Npm(object):
         self.registry = kwargs['registry']
         self.production = kwargs['production']
         self.ignore_scripts = kwargs['ignore_scripts']
+        self.check_outdated = kwargs['check_outdated']
+        self._state = None
 
         if kwargs['executable']:
             self.executable = kwargs['executable'].split(' ')
@@ -164,12 +182,16 @@ class Npm(object):
             return out
         return ''
 
-    def list(self):
-        cmd = ['list', '--json']
+    def state(self):
+        """Return the parsed `npm list --json` output, read once per run."""
+        if self._state is None:
+            self._state = json.loads(self._exec(['list', '--json'], True, False) or '{}')
+        return self._state
 
+    def list(self):
         installed = list()
         missing = list()
-        data = json.loads(self._exec(cmd, True, False))
+        data = self.state()
         if 'dependencies' in data:
             for dep in data['dependencies']:
                 if 'missing' in data['dependencies'][dep] and data['dependencies'][dep]['missing']:
@@ -187,16 +209,31 @@ class Npm(object):
         return installed, missing
 
     def install(self):
+        self._state = None
         return self._exec(['install'])
 
     def update(self):
+        self._state = None
         return self._exec(['update'])
 
     def uninstall(self):
+        self._state = None
         return self._exec(['uninstall'])
 
+    def is_pinned(self):
+        return self.version is not None and re.match(r'^v?\d+\.\d+\.\d+(-[\w.]+)?$', str(self.version)) is not None
+
     def list_outdated(self):
         outdated = list()
+        if self.name and self.is_pinned():
+            # Compare the pinned version with the installed one, no need to ask the registry
+            dep = self.state().get('dependencies', {}).get(self.name, {})
+            if dep.get('version') != str(self.version).lstrip('v'):
+                outdated.append(self.name)
+            return outdated
+        if not self.check_outdated:
+            return outdated
+
         data = self._exec(['outdated'], True, False)
         for dep in data.splitlines():
             if dep:
@@ -218,6 +255,7 @@ def main():
         registry=dict(default=None),
         state=dict(default='present', choices=['present', 'absent', 'latest']),
         ignore_scripts=dict(default=False, type='bool'),
+        check_outdated=dict(default=True, type='bool'),
     )
     arg_spec['global'] = dict(default='no', type='bool')
     module = AnsibleModule(
@@ -234,6 +272,7 @@ def main():
     registry = module.params['registry']
     state = module.params['state']
     ignore_scripts = module.params['ignore_scripts']
+    check_outdated = module.params['check_outdated']
 
     if not path and not glbl:
         module.fail_json(msg='path must be specified when not using global')
@@ -241,7 +280,8 @@ def main():
         module.fail_json(msg='uninstalling a package is only available for named packages')
 
     npm = Npm(module, name=name, path=path, version=version, glbl=glbl, production=production, \
-              executable=executable, registry=registry, ignore_scripts=ignore_scripts)
+              executable=executable, registry=registry, ignore_scripts=ignore_scripts, \
+              check_outdated=check_outdated)
 
     changed = False
     if state == 'present':
@@ -82,7 +82,31 @@ options:
     choices: ["yes", "no"]
     aliases: []
 
-notes: []
+  cacheonly:
+    description:
+      - Run entirely from the metadata cache. Cached repository metadata is
+        used even if it has expired and is never downloaded again, which makes
+        back-to-back tasks against the same repositories cheap.
+    required: false
+    default: "no"
+    choices: ["yes", "no"]
+    version_added: "2.3"
+
+  metadata_expire:
+    description:
+      - Override the C(metadata_expire) of all enabled repositories, in
+        seconds, for this transaction. Cached metadata younger than this is
+        not checked for updates.
+    required: false
+    default: null
+    version_added: "2.3"
+
+notes:
+  - Listing installed packages, listing repositories and removing packages
+    (but not groups) only load the system repository, so remote repository
+    metadata is neither downloaded nor loaded for them.
+  - The result contains a C(timing) dictionary with the seconds spent filling
+    the sack, resolving and running the transaction.
 # informational: requirements for nodes
 requirements:
   - "python >= 2.6"
@@ -114,8 +138,12 @@ EXAMPLES = '''
 - name: install the 'Development tools' package group
   dnf: name="@Development tools" state=present
 
+- name: install from the metadata already cached by a previous task
+  dnf: name=httpd state=present cacheonly=yes
+
 '''
 import os
+import time
 
 try:
     import dnf
@@ -132,10 +160,13 @@ def _fail_if_no_dnf(module):
             msg="`python2-dnf` is not installed, but it is required for the Ansible dnf module.")
 
 
-def _configure_base(module, base, conf_file, disable_gpg_check):
+def _configure_base(module, base, conf_file, disable_gpg_check, cacheonly=False):
     """Configure the dnf Base object."""
     conf = base.conf
 
+    # Use the metadata cache as-is, without checking for expiry
+    conf.cacheonly = cacheonly
+
     # Turn off debug messages in the output
     conf.debuglevel = 0
 
@@ -158,7 +189,7 @@ def _configure_base(module, base, conf_file, disable_gpg_check):
     conf.read()
 
 
-def _specify_repositories(base, disablerepo, enablerepo):
+def _specify_repositories(base, disablerepo, enablerepo, metadata_expire=None):
     """Enable and disable repositories matching the provided patterns."""
     base.read_all_repos()
     repos = base.repos
@@ -173,16 +204,45 @@ def _specify_repositories(base, disablerepo, enablerepo):
         for repo in repos.get_matching(repo_pattern):
             repo.enable()
 
+    if metadata_expire is not None:
+        for repo in repos.iter_enabled():
+            repo.metadata_expire = metadata_expire
+
+
+def _base(module, conf_file, disable_gpg_check, disablerepo, enablerepo,
+          timing, cacheonly=False, metadata_expire=None,
+          load_available_repos=True, fill_sack=True):
+    """Return a fully configured dnf Base object.
 
-def _base(module, conf_file, disable_gpg_check, disablerepo, enablerepo):
-    """Return a fully configured dnf Base object."""
+    Repositories are only read, and their metadata only loaded into the
+    sack, when the operation needs them.
+    """
     base = dnf.Base()
-    _configure_base(module, base, conf_file, disable_gpg_check)
-    _specify_repositories(base, disablerepo, enablerepo)
-    base.fill_sack()
+    _configure_base(module, base, conf_file, disable_gpg_check, cacheonly)
+    if load_available_repos:
+        _specify_repositories(base, disablerepo, enablerepo, metadata_expire)
+    if fill_sack:
+        start = time.time()
+        base.fill_sack(load_system_repo=True,
+                       load_available_repos=load_available_repos)
+        timing['sack_fill'] = time.time() - start
     return base
 
 
+def _needs_available_repos(params):
+    """Whether the operation needs metadata of the enabled repositories."""
+    if params['list']:
+        return params['list'] != 'installed'
+    if params['state'] in ['absent', 'removed']:
+        # Removing packages only needs the system repository, but paths and
+        # groups (comps) can only be resolved against the repositories.
+        for name in params['name']:
+            if name.startswith('@') or name.endswith('.rpm') or '://' in name:
+                return True
+        return False
+    return True
+
+
 def _package_dict(package):
     """Return a dictionary of information for the package."""
     # NOTE: This no longer contains the 'dnfstate' field because it is
@@ -200,7 +260,7 @@ def _package_dict(package):
     return result
 
 
-def list_items(module, base, command):
+def list_items(module, base, command, timing):
     """List package info based on the command."""
     # Rename updates to upgrades
     if command == 'updates':
@@ -221,7 +281,7 @@ def list_items(module, base, command):
         packages = subject.Subject(command).get_best_query(base.sack)
         results = [_package_dict(package) for package in packages]
 
-    module.exit_json(results=results)
+    module.exit_json(results=results, timing=timing)
 
 
 def _mark_package_install(module, base, pkg_spec):
@@ -232,7 +292,7 @@ def _mark_package_install(module, base, pkg_spec):
         module.fail_json(msg="No package {} available.".format(pkg_spec))
 
 
-def ensure(module, base, state, names):
+def ensure(module, base, state, names, timing):
     allow_erasing = False
     if names == ['*'] and state == 'latest':
         base.upgrade_all()
@@ -295,14 +355,21 @@ def ensure(module, base, state, names):
             # packages
             allow_erasing = True
 
-    if not base.resolve(allow_erasing=allow_erasing):
-        module.exit_json(msg="Nothing to do")
+    start = time.time()
+    resolved = base.resolve(allow_erasing=allow_erasing)
+    timing['resolve'] = time.time() - start
+    if not resolved:
+        module.exit_json(msg="Nothing to do", timing=timing)
     else:
         if module.check_mode:
-            module.exit_json(changed=True)
+            module.exit_json(changed=True, timing=timing)
+        start = time.time()
         base.download_packages(base.transaction.install_set)
+        timing['download'] = time.time() - start
+        start = time.time()
         base.do_transaction()
-        response = {'changed': True, 'results': []}
+        timing['transaction'] = time.time() - start
+        response = {'changed': True, 'results': [], 'timing': timing}
         for package in base.transaction.install_set:
             response['results'].append("Installed: {}".format(package))
         for package in base.transaction.remove_set:
@@ -325,6 +392,8 @@ def main():
             list=dict(),
             conf_file=dict(default=None, type='path'),
             disable_gpg_check=dict(default=False, type='bool'),
+            cacheonly=dict(default=False, type='bool'),
+            metadata_expire=dict(default=None, type='int'),
         ),
         required_one_of=[['name', 'list']],
         mutually_exclusive=[['name', 'list']],
@@ -332,11 +401,17 @@ def main():
     params = module.params
 
     _fail_if_no_dnf(module)
+    timing = {}
+    load_available_repos = _needs_available_repos(params)
     if params['list']:
+        # Listing repositories does not need a sack at all
+        fill_sack = params['list'] not in ['repos', 'repositories']
         base = _base(
             module, params['conf_file'], params['disable_gpg_check'],
-            params['disablerepo'], params['enablerepo'])
-        list_items(module, base, params['list'])
+            params['disablerepo'], params['enablerepo'], timing,
+            params['cacheonly'], params['metadata_expire'],
+            load_available_repos, fill_sack)
+        list_items(module, base, params['list'], timing)
     else:
         # Note: base takes a long time to run so we want to check for failure
         # before running it.
@@ -344,9 +419,11 @@ def main():
             module.fail_json(msg="This command has to be run under the root user.")
         base = _base(
             module, params['conf_file'], params['disable_gpg_check'],
-            params['disablerepo'], params['enablerepo'])
+            params['disablerepo'], params['enablerepo'], timing,
+            params['cacheonly'], params['metadata_expire'],
+            load_available_repos)
 
-        ensure(module, base, params['state'], params['name'])
+        ensure(module, base, params['state'], params['name'], timing)
 
 
 # import module snippets
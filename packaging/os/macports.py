@@ -53,8 +53,6 @@ EXAMPLES = '''
 - macports: name=foo state=inactive
 '''
 
-import pipes
-
 def update_package_db(module, port_path):
     """ Updates packages list. """
 
@@ -64,121 +62,123 @@ def update_package_db(module, port_path):
         module.fail_json(msg="could not update package db")
 
 
-def query_package(module, port_path, name, state="present"):
-    """ Returns whether a package is installed or not. """
-
-    if state == "present":
+def parse_port_installed(out):
+    """Parse the output of 'port installed'.
 
-        rc, out, err = module.run_command("%s installed | grep -q ^.*%s" % (pipes.quote(port_path), pipes.quote(name)), use_unsafe_shell=True)
-        if rc == 0:
-            return True
+    Every installed version of a port is listed on its own indented line,
+    e.g. '  curl @7.51.0_0+ssl (active)'.
 
-        return False
-
-    elif state == "active":
+    Returns a dict mapping port names to lists of (version, active) tuples.
+    """
+    ports = {}
+    for line in out.splitlines():
+        if not line[:1].isspace():
+            continue
+        fields = line.split()
+        if len(fields) < 2 or not fields[1].startswith('@'):
+            continue
+        active = '(active)' in fields[2:]
+        ports.setdefault(fields[0], []).append((fields[1][1:], active))
+    return ports
 
-        rc, out, err = module.run_command("%s installed %s | grep -q active" % (pipes.quote(port_path), pipes.quote(name)), use_unsafe_shell=True)
 
-        if rc == 0:
+def is_active(versions):
+    for version, active in versions:
+        if active:
             return True
+    return False
+
 
-        return False
+def get_installed_packages(module, port_path):
+    """Read every installed port and its activation state in one call."""
+    rc, out, err = module.run_command("%s installed" % port_path)
+    if rc != 0:
+        module.fail_json(msg="could not list installed ports: %s" % err)
+    return parse_port_installed(out)
 
 
 def remove_packages(module, port_path, packages):
     """ Uninstalls one or more packages if installed. """
 
-    remove_c = 0
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, port_path, package):
-            continue
-
-        rc, out, err = module.run_command("%s uninstall %s" % (port_path, package))
+    installed = get_installed_packages(module, port_path)
+    to_remove = [package for package in packages if package in installed]
 
-        if query_package(module, port_path, package):
-            module.fail_json(msg="failed to remove %s: %s" % (package, out))
+    if not to_remove:
+        module.exit_json(changed=False, msg="package(s) already absent")
 
-        remove_c += 1
+    rc, out, err = module.run_command("%s uninstall %s" % (port_path, " ".join(to_remove)))
 
-    if remove_c > 0:
+    installed = get_installed_packages(module, port_path)
+    failed = [package for package in to_remove if package in installed]
+    if failed:
+        module.fail_json(msg="failed to remove %s: %s" % (", ".join(failed), out))
 
-        module.exit_json(changed=True, msg="removed %s package(s)" % remove_c)
-
-    module.exit_json(changed=False, msg="package(s) already absent")
+    module.exit_json(changed=True, msg="removed %s package(s)" % len(to_remove))
 
 
 def install_packages(module, port_path, packages):
     """ Installs one or more packages if not already installed. """
 
-    install_c = 0
-
-    for package in packages:
-        if query_package(module, port_path, package):
-            continue
+    installed = get_installed_packages(module, port_path)
+    to_install = [package for package in packages if package not in installed]
 
-        rc, out, err = module.run_command("%s install %s" % (port_path, package))
+    if not to_install:
+        module.exit_json(changed=False, msg="package(s) already present")
 
-        if not query_package(module, port_path, package):
-            module.fail_json(msg="failed to install %s: %s" % (package, out))
+    rc, out, err = module.run_command("%s install %s" % (port_path, " ".join(to_install)))
 
-        install_c += 1
+    installed = get_installed_packages(module, port_path)
+    failed = [package for package in to_install if package not in installed]
+    if failed:
+        module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out))
 
-    if install_c > 0:
-        module.exit_json(changed=True, msg="installed %s package(s)" % (install_c))
-
-    module.exit_json(changed=False, msg="package(s) already present")
+    module.exit_json(changed=True, msg="installed %s package(s)" % len(to_install))
 
 
 def activate_packages(module, port_path, packages):
     """ Activate a package if it's inactive. """
 
-    activate_c = 0
-
-    for package in packages:
-        if not query_package(module, port_path, package):
-            module.fail_json(msg="failed to activate %s, package(s) not present" % (package))
+    installed = get_installed_packages(module, port_path)
+    missing = [package for package in packages if package not in installed]
+    if missing:
+        module.fail_json(msg="failed to activate %s, package(s) not present" % ", ".join(missing))
 
-        if query_package(module, port_path, package, state="active"):
-            continue
-
-        rc, out, err = module.run_command("%s activate %s" % (port_path, package))
+    to_activate = [package for package in packages if not is_active(installed[package])]
 
-        if not query_package(module, port_path, package, state="active"):
-            module.fail_json(msg="failed to activate %s: %s" % (package, out))
+    if not to_activate:
+        module.exit_json(changed=False, msg="package(s) already active")
 
-        activate_c += 1
+    rc, out, err = module.run_command("%s activate %s" % (port_path, " ".join(to_activate)))
 
-    if activate_c > 0:
-        module.exit_json(changed=True, msg="activated %s package(s)" % (activate_c))
+    installed = get_installed_packages(module, port_path)
+    failed = [package for package in to_activate if not is_active(installed.get(package, []))]
+    if failed:
+        module.fail_json(msg="failed to activate %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already active")
+    module.exit_json(changed=True, msg="activated %s package(s)" % len(to_activate))
 
 
 def deactivate_packages(module, port_path, packages):
     """ Deactivate a package if it's active. """
 
-    deactivated_c = 0
-
-    for package in packages:
-        if not query_package(module, port_path, package):
-            module.fail_json(msg="failed to activate %s, package(s) not present" % (package))
-
-        if not query_package(module, port_path, package, state="active"):
-            continue
+    installed = get_installed_packages(module, port_path)
+    missing = [package for package in packages if package not in installed]
+    if missing:
+        module.fail_json(msg="failed to activate %s, package(s) not present" % ", ".join(missing))
 
-        rc, out, err = module.run_command("%s deactivate %s" % (port_path, package))
+    to_deactivate = [package for package in packages if is_active(installed[package])]
 
-        if query_package(module, port_path, package, state="active"):
-            module.fail_json(msg="failed to deactivated %s: %s" % (package, out))
+    if not to_deactivate:
+        module.exit_json(changed=False, msg="package(s) already inactive")
 
-        deactivated_c += 1
+    rc, out, err = module.run_command("%s deactivate %s" % (port_path, " ".join(to_deactivate)))
 
-    if deactivated_c > 0:
-        module.exit_json(changed=True, msg="deactivated %s package(s)" % (deactivated_c))
+    installed = get_installed_packages(module, port_path)
+    failed = [package for package in to_deactivate if is_active(installed.get(package, []))]
+    if failed:
+        module.fail_json(msg="failed to deactivated %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already inactive")
+    module.exit_json(changed=True, msg="deactivated %s package(s)" % len(to_deactivate))
 
 
 def main():
@@ -214,4 +214,5 @@ def main():
 # import module snippets
 from ansible.module_utils.basic import *
 
-main()
+if __name__ == '__main__':
+    main()
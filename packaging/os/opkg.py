@@ -59,7 +59,6 @@ EXAMPLES = '''
 - opkg: name=foo state=present force=overwrite
 '''
 
-import pipes
 
 def update_package_db(module, opkg_path):
     """ Updates packages list. """
@@ -70,16 +69,32 @@ def update_package_db(module, opkg_path):
         module.fail_json(msg="could not update package db")
 
 
-def query_package(module, opkg_path, name, state="present"):
-    """ Returns whether a package is installed or not. """
+def parse_opkg_list(out):
+    """Parse the output of 'opkg list-installed' or 'opkg list'.
 
-    if state == "present":
+    Lines look like 'name - version' or 'name - version - description'.
+
+    Returns a dict mapping package names to versions.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split(' - ', 2)
+        if len(fields) < 2 or not fields[0] or line[0].isspace():
+            continue
+        packages[fields[0]] = fields[1].strip()
+    return packages
+
+
+def get_package_index(module, opkg_path, command):
+    """Read the installed ('list-installed') or available ('list') index in one call."""
+    rc, out, err = module.run_command("%s %s" % (opkg_path, command))
+    if rc != 0:
+        module.fail_json(msg="could not list packages: %s" % err)
+    return parse_opkg_list(out)
 
-        rc, out, err = module.run_command("%s list-installed | grep -q \"^%s \"" % (pipes.quote(opkg_path), pipes.quote(name)), use_unsafe_shell=True)
-        if rc == 0:
-            return True
 
-        return False
+def get_installed_packages(module, opkg_path):
+    return get_package_index(module, opkg_path, "list-installed")
 
 
 def remove_packages(module, opkg_path, packages):
@@ -90,25 +105,20 @@ def remove_packages(module, opkg_path, packages):
     if force:
         force = "--force-%s" % force
 
-    remove_c = 0
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, opkg_path, package):
-            continue
-
-        rc, out, err = module.run_command("%s remove %s %s" % (opkg_path, force, package))
-
-        if query_package(module, opkg_path, package):
-            module.fail_json(msg="failed to remove %s: %s" % (package, out))
+    installed = get_installed_packages(module, opkg_path)
+    to_remove = [package for package in packages if package in installed]
 
-        remove_c += 1
+    if not to_remove:
+        module.exit_json(changed=False, msg="package(s) already absent")
 
-    if remove_c > 0:
+    rc, out, err = module.run_command("%s remove %s %s" % (opkg_path, force, " ".join(to_remove)))
 
-        module.exit_json(changed=True, msg="removed %s package(s)" % remove_c)
+    installed = get_installed_packages(module, opkg_path)
+    failed = [package for package in to_remove if package in installed]
+    if failed:
+        module.fail_json(msg="failed to remove %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already absent")
+    module.exit_json(changed=True, msg="removed %s package(s)" % len(to_remove))
 
 
 def install_packages(module, opkg_path, packages):
@@ -119,23 +129,26 @@ def install_packages(module, opkg_path, packages):
     if force:
         force = "--force-%s" % force
 
-    install_c = 0
-
-    for package in packages:
-        if query_package(module, opkg_path, package):
-            continue
+    installed = get_installed_packages(module, opkg_path)
+    to_install = [package for package in packages if package not in installed]
 
-        rc, out, err = module.run_command("%s install %s %s" % (opkg_path, force, package))
+    if not to_install:
+        module.exit_json(changed=False, msg="package(s) already present")
 
-        if not query_package(module, opkg_path, package):
-            module.fail_json(msg="failed to install %s: %s" % (package, out))
+    # Report unknown names up front instead of after a partial install
+    available = get_package_index(module, opkg_path, "list")
+    unknown = [package for package in to_install if package not in available]
+    if unknown:
+        module.fail_json(msg="unknown package(s) %s" % ", ".join(unknown))
 
-        install_c += 1
+    rc, out, err = module.run_command("%s install %s %s" % (opkg_path, force, " ".join(to_install)))
 
-    if install_c > 0:
-        module.exit_json(changed=True, msg="installed %s package(s)" % (install_c))
+    installed = get_installed_packages(module, opkg_path)
+    failed = [package for package in to_install if package not in installed]
+    if failed:
+        module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already present")
+    module.exit_json(changed=True, msg="installed %s package(s)" % len(to_install))
 
 
 def main():
@@ -166,4 +179,5 @@ def main():
 # import module snippets
 from ansible.module_utils.basic import *
 
-main()
+if __name__ == '__main__':
+    main()
@@ -113,31 +113,31 @@ def ensure(module, state, packages, params):
         'results': [],
         'msg': '',
     }
-    behaviour = {
-        'present': {
-            'filter': lambda p: not is_installed(module, p),
-            'subcommand': 'install',
-        },
-        'latest': {
-            'filter': lambda p: not is_latest(module, p),
-            'subcommand': 'install',
-        },
-        'absent': {
-            'filter': lambda p: is_installed(module, p),
-            'subcommand': 'uninstall',
-        },
-    }
+    installed = installed_packages(module, packages)
+    if state == 'latest':
+        outdated = outdated_packages(module, installed)
+        to_modify = [
+            p for p in packages if p not in installed or p in outdated
+        ]
+    elif state == 'present':
+        to_modify = [p for p in packages if p not in installed]
+    else:
+        to_modify = [p for p in packages if p in installed]
+    subcommand = {
+        'present': 'install',
+        'latest': 'install',
+        'absent': 'uninstall',
+    }[state]
 
     if params['accept_licenses']:
         accept_licenses = ['--accept']
     else:
         accept_licenses = []
 
-    to_modify = filter(behaviour[state]['filter'], packages)
     if to_modify:
         rc, out, err = module.run_command(
             [
-                'pkg', behaviour[state]['subcommand']
+                'pkg', subcommand
             ]
             + accept_licenses
             + [
@@ -154,6 +154,80 @@ def ensure(module, state, packages, params):
     module.exit_json(**response)
 
 
+def parse_pkg_list(out):
+    """Parse the output of 'pkg list -H'.
+
+    Lines hold the package name, an optional publisher in parentheses, the
+    version and the IFO flags, e.g.
+    'web/server/nginx (omnios)   1.10.1-0.151018   i--'.
+
+    Returns a dict mapping package names to versions.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        name = re.sub('^pkg:/', '', fields[0])
+        if fields[1].startswith('('):
+            fields.pop(1)
+        packages[name] = fields[1]
+    return packages
+
+
+def package_matches(pattern, name):
+    """Whether a package name as listed by pkg matches a plain pattern.
+
+    pkg(5) accepts any trailing component sequence of an FMRI as its name,
+    so 'nginx' matches 'web/server/nginx'.
+    """
+    pattern = re.sub('^pkg:/+', '', pattern)
+    return name == pattern or name.endswith('/' + pattern)
+
+
+def list_matching(module, packages, options, single_check):
+    """Return the subset of packages listed by 'pkg list <options>'.
+
+    Plain names are looked up with a single 'pkg list' call; FMRIs with a
+    version, publisher or wildcard are left to pkg itself to match, one
+    call each.
+    """
+    matching = []
+    plain = []
+    for package in packages:
+        if re.search('[@*?]|^pkg://', package):
+            if single_check(module, package):
+                matching.append(package)
+        else:
+            plain.append(package)
+
+    if plain:
+        # pkg list exits 1 when one of the patterns matches nothing, but
+        # still lists the others.
+        rc, out, err = module.run_command(
+            ['pkg', 'list', '-H'] + options + ['--'] + plain
+        )
+        listed = parse_pkg_list(out).keys()
+        for package in plain:
+            for name in listed:
+                if package_matches(package, name):
+                    matching.append(package)
+                    break
+
+    return matching
+
+
+def installed_packages(module, packages):
+    return list_matching(module, packages, [], is_installed)
+
+
+def outdated_packages(module, packages):
+    """Return the subset of installed packages with a newer version available."""
+    return list_matching(
+        module, packages, ['-u'], lambda m, p: not is_latest(m, p)
+    )
+
+
 def is_installed(module, package):
     rc, out, err = module.run_command(['pkg', 'list', '--', package])
     return not bool(int(rc))
@@ -165,4 +239,6 @@ def is_latest(module, package):
 
 
 from ansible.module_utils.basic import *
-main()
+
+if __name__ == '__main__':
+    main()
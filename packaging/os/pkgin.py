@@ -121,72 +121,58 @@ EXAMPLES = '''
 
 import re
 
-def query_package(module, name):
-    """Search for the package by name.
+PKGIN_PFLAG = None
 
-    Possible return values:
-    * "present"  - installed, no upgrade needed
-    * "outdated" - installed, but can be upgraded
-    * False      - not installed or not found
-    """
-
-    # test whether '-p' (parsable) flag is supported.
-    rc, out, err = module.run_command("%s -p -v" % PKGIN_PATH)
-
-    if rc == 0:
-        pflag = '-p'
-        splitchar = ';'
-    else:
-        pflag = ''
-        splitchar = ' '
 
-    # Use "pkgin search" to find the package. The regular expression will
-    # only match on the complete name.
-    rc, out, err = module.run_command("%s %s search \"^%s$\"" % (PKGIN_PATH, pflag, name))
+def parsable_flag(module):
+    """Return the flag and field separator for machine readable output.
 
-    # rc will not be 0 unless the search was a success
-    if rc == 0:
-
-        # Search results may contain more than one line (e.g., 'emacs'), so iterate
-        # through each line to see if we have a match.
-        packages = out.split('\n')
+    The '-p' (parsable) flag is only supported by newer pkgin releases, so
+    it is probed once per run.
+    """
+    global PKGIN_PFLAG
+    if PKGIN_PFLAG is None:
+        rc, out, err = module.run_command("%s -p -v" % PKGIN_PATH)
+        if rc == 0:
+            PKGIN_PFLAG = ('-p', ';')
+        else:
+            PKGIN_PFLAG = ('', ' ')
+    return PKGIN_PFLAG
 
-        for package in packages:
 
-            # Break up line at spaces.  The first part will be the package with its
-            # version (e.g. 'gcc47-libs-4.7.2nb4'), and the second will be the state
-            # of the package:
-            #     ''  - not installed
-            #     '<' - installed but out of date
-            #     '=' - installed and up to date
-            #     '>' - installed but newer than the repository version
-            pkgname_with_version, raw_state = package.split(splitchar)[0:2]
+def parse_pkgin_list(out, splitchar=';'):
+    """Parse the output of 'pkgin list' or 'pkgin avail'.
 
-            # Search for package, stripping version
-            # (results in sth like 'gcc47-libs' or 'emacs24-nox11')
-            pkg_search_obj = re.search(r'^(.*?)\-[0-9][0-9.]*(nb[0-9]+)*', pkgname_with_version, re.M)
+    Every line holds the package with its version (e.g. 'gcc47-libs-4.7.2nb4')
+    followed by the separator and a comment.  pkgsrc versions never contain a
+    dash, so the name is everything before the last one.
 
-            # Do not proceed unless we have a match
-            if not pkg_search_obj:
-                continue
+    Returns a dict mapping package names to versions.
+    """
+    packages = {}
+    for line in out.splitlines():
+        pkgname_with_version = line.split(splitchar, 1)[0].strip()
+        if '-' not in pkgname_with_version:
+            continue
+        name, version = pkgname_with_version.rsplit('-', 1)
+        if not name or not version[:1].isdigit():
+            continue
+        packages[name] = version
+    return packages
 
-            # Grab matched string
-            pkgname_without_version = pkg_search_obj.group(1)
 
-            if name != pkgname_without_version:
-                continue
+def get_package_index(module, command):
+    """Read the whole local ('list') or remote ('avail') index in one call."""
+    pflag, splitchar = parsable_flag(module)
+    rc, out, err = module.run_command("%s %s %s" % (PKGIN_PATH, pflag, command))
+    # pkgin exits non-zero when the index is empty, which is not an error here
+    if rc != 0 and out.strip():
+        module.fail_json(msg="could not list packages: %s" % err)
+    return parse_pkgin_list(out, splitchar)
 
-            # The package was found; now return its state
-            if raw_state == '<':
-                return 'outdated'
-            elif raw_state == '=' or raw_state == '>':
-                return 'present'
-            else:
-                return False
-            # no fall-through
 
-        # No packages were matched, so return False
-        return False
+def get_installed_packages(module):
+    return get_package_index(module, "list")
 
 
 def format_action_message(module, action, count):
@@ -229,48 +215,49 @@ def format_pkgin_command(module, command, package=None):
 
 def remove_packages(module, packages):
 
-    remove_c = 0
-
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, package):
-            continue
-
-        rc, out, err = module.run_command(
-            format_pkgin_command(module, "remove", package))
+    installed = get_installed_packages(module)
+    to_remove = [package for package in packages if package in installed]
 
-        if not module.check_mode and query_package(module, package):
-            module.fail_json(msg="failed to remove %s: %s" % (package, out))
+    if not to_remove:
+        module.exit_json(changed=False, msg="package(s) already absent")
 
-        remove_c += 1
+    rc, out, err = module.run_command(
+        format_pkgin_command(module, "remove", " ".join(to_remove)))
 
-    if remove_c > 0:
-        module.exit_json(changed=True, msg=format_action_message(module, "removed", remove_c))
+    if not module.check_mode:
+        installed = get_installed_packages(module)
+        failed = [package for package in to_remove if package in installed]
+        if failed:
+            module.fail_json(msg="failed to remove %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already absent")
+    module.exit_json(changed=True, msg=format_action_message(module, "removed", len(to_remove)))
 
 
 def install_packages(module, packages):
 
-    install_c = 0
-
-    for package in packages:
-        if query_package(module, package):
-            continue
+    installed = get_installed_packages(module)
+    to_install = [package for package in packages if package not in installed]
 
-        rc, out, err = module.run_command(
-            format_pkgin_command(module, "install", package))
+    if not to_install:
+        module.exit_json(changed=False, msg="package(s) already present")
 
-        if not module.check_mode and not query_package(module, package):
-            module.fail_json(msg="failed to install %s: %s" % (package, out))
+    # A single unknown name makes pkgin refuse the whole transaction, so
+    # report those against the repository index before running it.
+    available = get_package_index(module, "avail")
+    unknown = [package for package in to_install if package not in available]
+    if unknown:
+        module.fail_json(msg="no package matching %s found" % ", ".join(unknown))
 
-        install_c += 1
+    rc, out, err = module.run_command(
+        format_pkgin_command(module, "install", " ".join(to_install)))
 
-    if install_c > 0:
-        module.exit_json(changed=True, msg=format_action_message(module, "installed", install_c))
+    if not module.check_mode:
+        installed = get_installed_packages(module)
+        failed = [package for package in to_install if package not in installed]
+        if failed:
+            module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out))
 
-    module.exit_json(changed=False, msg="package(s) already present")
+    module.exit_json(changed=True, msg=format_action_message(module, "installed", len(to_install)))
 
 def update_package_db(module):
     rc, out, err = module.run_command(
@@ -100,6 +100,7 @@ EXAMPLES = '''
 
 
 import re
+from fnmatch import fnmatch
 from ansible.module_utils.basic import AnsibleModule
 
 def query_package(module, pkgng_path, name, dir_arg):
@@ -111,6 +112,63 @@ def query_package(module, pkgng_path, name, dir_arg):
 
     return False
 
+def query_package_names(module, pkgng_path, origin, dir_arg):
+    """Return the names of the installed packages matching an origin (category/name)."""
+
+    rc, out, err = module.run_command("%s %s query -g '%%n' %s" % (pkgng_path, dir_arg, origin))
+
+    if rc != 0:
+        return []
+
+    return out.split()
+
+def get_installed_packages(module, pkgng_path, dir_arg):
+    """Return a dict of installed package name -> version from a single pkg query."""
+
+    rc, out, err = module.run_command("%s %s query -a '%%n %%v'" % (pkgng_path, dir_arg))
+    if rc != 0:
+        module.fail_json(msg="could not list installed packages: %s" % out, stderr=err)
+
+    installed = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) == 2:
+            installed[fields[0]] = fields[1]
+    return installed
+
+def get_annotations(module, pkgng_path, dir_arg):
+    """Return a dict of package name -> {tag: value} from a single pkg query."""
+
+    rc, out, err = module.run_command("%s %s query -a '%%n %%At %%Av'" % (pkgng_path, dir_arg))
+    if rc != 0:
+        module.fail_json(msg="could not list package annotations: %s" % out, stderr=err)
+
+    annotations = {}
+    for line in out.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            continue
+        value = ''
+        if len(fields) == 3:
+            value = fields[2]
+        annotations.setdefault(fields[0], {})[fields[1]] = value
+    return annotations
+
+def match_installed(module, pkgng_path, name, installed, dir_arg):
+    """Check a requested name against the installed snapshot.
+
+    Origins (category/name) are not part of the snapshot, so those fall
+    back to a per-package query."""
+
+    if '/' in name:
+        return query_package(module, pkgng_path, name, dir_arg)
+    if name in installed:
+        return True
+    for pkg in installed:
+        if fnmatch(pkg, name):
+            return True
+    return False
+
 def pkgng_older_than(module, pkgng_path, compare_version):
 
     rc, out, err = module.run_command("%s -v" % pkgng_path)
@@ -130,32 +188,27 @@ def pkgng_older_than(module, pkgng_path, compare_version):
 
 def remove_packages(module, pkgng_path, packages, dir_arg):
 
-    remove_c = 0
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, pkgng_path, package, dir_arg):
-            continue
-
-        if not module.check_mode:
-            rc, out, err = module.run_command("%s %s delete -y %s" % (pkgng_path, dir_arg, package))
+    installed = get_installed_packages(module, pkgng_path, dir_arg)
+    to_remove = [package for package in packages
+                 if match_installed(module, pkgng_path, package, installed, dir_arg)]
 
-        if not module.check_mode and query_package(module, pkgng_path, package, dir_arg):
-            module.fail_json(msg="failed to remove %s: %s" % (package, out))
+    if not to_remove:
+        return (False, "package(s) already absent")
 
-        remove_c += 1
-
-    if remove_c > 0:
+    if not module.check_mode:
+        rc, out, err = module.run_command("%s %s delete -y %s" % (pkgng_path, dir_arg, " ".join(to_remove)))
 
-        return (True, "removed %s package(s)" % remove_c)
+        installed = get_installed_packages(module, pkgng_path, dir_arg)
+        failed = [package for package in to_remove
+                  if match_installed(module, pkgng_path, package, installed, dir_arg)]
+        if failed:
+            module.fail_json(msg="failed to remove %s: %s" % (", ".join(failed), out), stderr=err)
 
-    return (False, "package(s) already absent")
+    return (True, "removed %s package(s)" % len(to_remove))
 
 
 def install_packages(module, pkgng_path, packages, cached, pkgsite, dir_arg):
 
-    install_c = 0
-
     # as of pkg-1.1.4, PACKAGESITE is deprecated in favor of repository definitions
     # in /usr/local/etc/pkg/repos
     old_pkgng = pkgng_older_than(module, pkgng_path, [1, 1, 4])
@@ -168,89 +221,57 @@ def install_packages(module, pkgng_path, packages, cached, pkgsite, dir_arg):
     batch_var = 'env BATCH=yes' # This environment variable skips mid-install prompts,
                                 # setting them to their default values.
 
-    if not module.check_mode and not cached:
-        if old_pkgng:
-            rc, out, err = module.run_command("%s %s update" % (pkgsite, pkgng_path))
-        else:
-            rc, out, err = module.run_command("%s %s update" % (pkgng_path, dir_arg))
-        if rc != 0:
-            module.fail_json(msg="Could not update catalogue")
+    installed = get_installed_packages(module, pkgng_path, dir_arg)
+    to_install = [package for package in packages
+                  if not match_installed(module, pkgng_path, package, installed, dir_arg)]
 
-    for package in packages:
-        if query_package(module, pkgng_path, package, dir_arg):
-            continue
+    if not to_install:
+        return (False, "package(s) already present")
 
-        if not module.check_mode:
+    if not module.check_mode:
+        if not cached:
             if old_pkgng:
-                rc, out, err = module.run_command("%s %s %s install -g -U -y %s" % (batch_var, pkgsite, pkgng_path, package))
+                rc, out, err = module.run_command("%s %s update" % (pkgsite, pkgng_path))
             else:
-                rc, out, err = module.run_command("%s %s %s install %s -g -U -y %s" % (batch_var, pkgng_path, dir_arg, pkgsite, package))
+                rc, out, err = module.run_command("%s %s update" % (pkgng_path, dir_arg))
+            if rc != 0:
+                module.fail_json(msg="Could not update catalogue")
 
-        if not module.check_mode and not query_package(module, pkgng_path, package, dir_arg):
-            module.fail_json(msg="failed to install %s: %s" % (package, out), stderr=err)
+        if old_pkgng:
+            rc, out, err = module.run_command("%s %s %s install -g -U -y %s" % (batch_var, pkgsite, pkgng_path, " ".join(to_install)))
+        else:
+            rc, out, err = module.run_command("%s %s %s install %s -g -U -y %s" % (batch_var, pkgng_path, dir_arg, pkgsite, " ".join(to_install)))
 
-        install_c += 1
+        installed = get_installed_packages(module, pkgng_path, dir_arg)
+        failed = [package for package in to_install
+                  if not match_installed(module, pkgng_path, package, installed, dir_arg)]
+        if failed:
+            module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out), stderr=err)
 
-    if install_c > 0:
-        return (True, "added %s package(s)" % (install_c))
+    return (True, "added %s package(s)" % len(to_install))
 
-    return (False, "package(s) already present")
+def annotation_pattern(packages):
+    """Build a pkg -x regular expression matching exactly the given package names."""
 
-def annotation_query(module, pkgng_path, package, tag, dir_arg):
-    rc, out, err = module.run_command("%s %s info -g -A %s" % (pkgng_path, dir_arg, package))
-    match = re.search(r'^\s*(?P<tag>%s)\s*:\s*(?P<value>\w+)' % tag, out, flags=re.MULTILINE)
-    if match:
-        return match.group('value')
-    return False
+    escaped = [re.sub(r'([.^$*+?()\[\]{}|\\])', r'\\\1', package) for package in packages]
+    return "'^(%s)$'" % "|".join(escaped)
 
+def annotation_apply(module, pkgng_path, operation, tag, value, packages, dir_arg):
+    """Apply one annotation operation to a group of packages with a single pkg annotate."""
 
-def annotation_add(module, pkgng_path, package, tag, value, dir_arg):
-    _value = annotation_query(module, pkgng_path, package, tag, dir_arg)
-    if not _value:
-        # Annotation does not exist, add it.
-        rc, out, err = module.run_command('%s %s annotate -y -A %s %s "%s"'
-            % (pkgng_path, dir_arg, package, tag, value))
-        if rc != 0:
-            module.fail_json("could not annotate %s: %s"
-                % (package, out), stderr=err)
-        return True
-    elif _value != value:
-        # Annotation exists, but value differs
-        module.fail_json(
-            mgs="failed to annotate %s, because %s is already set to %s, but should be set to %s"
-            % (package, tag, _value, value))
-        return False
+    flag = {'+': '-A', '-': '-D', ':': '-M'}[operation]
+    if len(packages) == 1:
+        target = packages[0]
     else:
-        # Annotation exists, nothing to do
-        return False
-
-def annotation_delete(module, pkgng_path, package, tag, value, dir_arg):
-    _value = annotation_query(module, pkgng_path, package, tag, dir_arg)
-    if _value:
-        rc, out, err = module.run_command('%s %s annotate -y -D %s %s'
-            % (pkgng_path, dir_arg, package, tag))
-        if rc != 0:
-            module.fail_json("could not delete annotation to %s: %s"
-                % (package, out), stderr=err)
-        return True
-    return False
+        target = "-x %s" % annotation_pattern(packages)
 
-def annotation_modify(module, pkgng_path, package, tag, value, dir_arg):
-    _value = annotation_query(module, pkgng_path, package, tag, dir_arg)
-    if not value:
-        # No such tag
-        module.fail_json("could not change annotation to %s: tag %s does not exist"
-            % (package, tag))
-    elif _value == value:
-        # No change in value
-        return False
-    else:
-        rc,out,err = module.run_command('%s %s annotate -y -M %s %s "%s"'
-            % (pkgng_path, dir_arg, package, tag, value))
-        if rc != 0:
-            module.fail_json("could not change annotation annotation to %s: %s"
-                % (package, out), stderr=err)
-        return True
+    cmd = '%s %s annotate -y %s %s %s' % (pkgng_path, dir_arg, flag, target, tag)
+    if operation != '-':
+        cmd += ' "%s"' % value
+
+    rc, out, err = module.run_command(cmd)
+    if rc != 0:
+        module.fail_json(msg="could not annotate %s: %s" % (", ".join(packages), out), stderr=err)
 
 
 def annotate_packages(module, pkgng_path, packages, annotation, dir_arg):
@@ -260,16 +281,52 @@ def annotate_packages(module, pkgng_path, packages, annotation, dir_arg):
             _annotation).groupdict(),
         re.split(r',', annotation))
 
-    operation = {
-        '+': annotation_add,
-        '-': annotation_delete,
-        ':': annotation_modify
-    }
+    installed = get_installed_packages(module, pkgng_path, dir_arg)
+    current = get_annotations(module, pkgng_path, dir_arg)
 
+    # Expand globs against the snapshot so changes can be grouped per tag.
+    # Origins are not part of the snapshot, like in match_installed they are
+    # resolved with a query.
+    names = []
     for package in packages:
-        for _annotation in annotations:
-            if operation[_annotation['operation']](module, pkgng_path, package, _annotation['tag'], _annotation['value']):
-                annotate_c += 1
+        if '/' in package:
+            matches = query_package_names(module, pkgng_path, package, dir_arg)
+        else:
+            matches = [pkg for pkg in installed if fnmatch(pkg, package)]
+        if not matches:
+            module.fail_json(msg="could not annotate %s: package is not installed" % package)
+        for pkg in matches:
+            if pkg not in names:
+                names.append(pkg)
+
+    for _annotation in annotations:
+        operation = _annotation['operation']
+        tag = _annotation['tag']
+        value = _annotation['value']
+        pending = []
+        for package in names:
+            _value = current.get(package, {}).get(tag)
+            if operation == '+':
+                if _value is None:
+                    # Annotation does not exist, add it.
+                    pending.append(package)
+                elif _value != value:
+                    module.fail_json(
+                        msg="failed to annotate %s, because %s is already set to %s, but should be set to %s"
+                        % (package, tag, _value, value))
+            elif operation == '-':
+                if _value is not None:
+                    pending.append(package)
+            elif operation == ':':
+                if _value is None:
+                    module.fail_json(msg="could not change annotation to %s: tag %s does not exist"
+                        % (package, tag))
+                elif _value != value:
+                    pending.append(package)
+
+        if pending and not module.check_mode:
+            annotation_apply(module, pkgng_path, operation, tag, value, pending, dir_arg)
+        annotate_c += len(pending)
 
     if annotate_c > 0:
         return (True, "added %s annotations." % annotate_c)
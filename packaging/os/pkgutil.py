@@ -37,6 +37,7 @@ options:
   name:
     description:
       - Package name, e.g. (C(CSWnrpe))
+      - Since Ansible 2.3 a list of packages may be given; they are handled with a single C(pkgutil) run per operation.
     required: true
   site:
     description:
@@ -47,7 +48,6 @@ options:
     description:
       - Whether to install (C(present)), or remove (C(absent)) a package.
       - The upgrade (C(latest)) operation will update/install the package to the latest version available.
-      - "Note: The module has a limitation that (C(latest)) only works for one package, not lists of them."
     required: true
     choices: ["present", "absent", "latest"]
   update_catalog:
@@ -62,6 +62,9 @@ EXAMPLES = '''
 # Install a package
 pkgutil: name=CSWcommon state=present
 
+# Install several packages at once
+pkgutil: name=CSWcommon,CSWwget,CSWcurl state=present
+
 # Install a package from a specific repository
 pkgutil: name=CSWnrpe site='ftp://myinternal.repo/opencsw/kiel state=latest'
 '''
@@ -69,34 +72,60 @@ pkgutil: name=CSWnrpe site='ftp://myinternal.repo/opencsw/kiel state=latest'
 import os
 import pipes
 
-def package_installed(module, name):
-    cmd = ['pkginfo']
-    cmd.append('-q')
-    cmd.append(name)
-    rc, out, err = run_command(module, cmd)
-    if rc == 0:
-        return True
-    else:
-        return False
-
-def package_latest(module, name, site):
-    # Only supports one package
+def parse_pkginfo(out):
+    """Parse the output of 'pkginfo' run without arguments.
+
+    Every line holds the category, the package instance and its
+    description, e.g. 'application CSWcommon      common - common files and dirs for CSW packages'.
+
+    Returns a dict mapping package instances to their category.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            continue
+        packages[fields[1]] = fields[0]
+    return packages
+
+def parse_pkgutil_compare(out):
+    """Parse the output of 'pkgutil -c'.
+
+    After a header line, every line holds the package name, the installed
+    version (or 'notinst') and the catalog version (or 'SAME').
+
+    Returns a dict mapping package names to (installed, catalog) tuples.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) != 3 or fields[0] == 'package':
+            continue
+        packages[fields[0]] = (fields[1], fields[2])
+    return packages
+
+def installed_packages(module, names):
+    """Return the subset of names that is installed, from a single pkginfo listing."""
+    rc, out, err = run_command(module, ['pkginfo'])
+    installed = parse_pkginfo(out)
+    return [name for name in names if name in installed]
+
+def outdated_packages(module, names, site):
+    """Return the subset of names the catalog has a newer version of, from a single pkgutil call."""
     cmd = [ 'pkgutil', '-U', '--single', '-c' ]
     if site is not None:
         cmd += [ '-t', site]
-    cmd.append(name)
+    cmd += names
     rc, out, err = run_command(module, cmd)
-    # replace | tail -1 |grep -v SAME
-    # use -2, because splitting on \n create a empty line
-    # at the end of the list
-    return 'SAME' in out.split('\n')[-2]
+    packages = parse_pkgutil_compare(out)
+    return [name for name in names if name in packages and packages[name][1] != 'SAME']
 
 def run_command(module, cmd, **kwargs):
     progname = cmd[0]
     cmd[0] = module.get_bin_path(progname, True, ['/opt/csw/bin'])
     return module.run_command(cmd, **kwargs)
 
-def package_install(module, state, name, site, update_catalog):
+def package_install(module, state, names, site, update_catalog):
     cmd = [ 'pkgutil', '-iy' ]
     if update_catalog:
         cmd += [ '-U' ]
@@ -104,29 +133,29 @@ def package_install(module, state, name, site, update_catalog):
         cmd += [ '-t', site ]
     if state == 'latest':
         cmd += [ '-f' ] 
-    cmd.append(name)
+    cmd += names
     (rc, out, err) = run_command(module, cmd)
     return (rc, out, err)
 
-def package_upgrade(module, name, site, update_catalog):
+def package_upgrade(module, names, site, update_catalog):
     cmd = [ 'pkgutil', '-ufy' ]
     if update_catalog:
         cmd += [ '-U' ]
     if site is not None:
         cmd += [ '-t', site ]
-    cmd.append(name)
+    cmd += names
     (rc, out, err) = run_command(module, cmd)
     return (rc, out, err)
 
-def package_uninstall(module, name):
-    cmd = [ 'pkgutil', '-ry', name]
+def package_uninstall(module, names):
+    cmd = [ 'pkgutil', '-ry' ] + names
     (rc, out, err) = run_command(module, cmd)
     return (rc, out, err)
 
 def main():
     module = AnsibleModule(
         argument_spec = dict(
-            name = dict(required = True),
+            name = dict(required = True, type = 'list'),
             state = dict(required = True, choices=['present', 'absent','latest']),
             site = dict(default = None),
             update_catalog = dict(required = False, default = False, type='bool'),
@@ -144,63 +173,35 @@ def main():
     result['name'] = name
     result['state'] = state
 
-    if state == 'present':
-        if not package_installed(module, name):
-            if module.check_mode:
-                module.exit_json(changed=True)
-            (rc, out, err) = package_install(module, state, name, site, update_catalog)
-            # Stdout is normally empty but for some packages can be
-            # very long and is not often useful
-            if len(out) > 75:
-                out = out[:75] + '...'
-            if rc != 0:
-                if err:
-                    msg = err
-                else:
-                    msg = out
-                module.fail_json(msg=msg)
-
-    elif state == 'latest':
-        if not package_installed(module, name):
-            if module.check_mode:
-                module.exit_json(changed=True)
-            (rc, out, err) = package_install(module, state, name, site, update_catalog)
-            if len(out) > 75:
-                out = out[:75] + '...'
-            if rc != 0:
-                if err:
-                    msg = err
-                else:
-                    msg = out
-                module.fail_json(msg=msg)
-
-        else:
-            if not package_latest(module, name, site):
-                if module.check_mode:
-                    module.exit_json(changed=True) 
-                (rc, out, err) = package_upgrade(module, name, site, update_catalog)
-                if len(out) > 75:
-                    out = out[:75] + '...'
-                if rc != 0:
-                    if err:
-                        msg = err
-                    else:
-                        msg = out
-                    module.fail_json(msg=msg)
-
-    elif state == 'absent':
-        if package_installed(module, name):
-            if module.check_mode:
-                module.exit_json(changed=True)
-            (rc, out, err) = package_uninstall(module, name)
-            if len(out) > 75:
-                out = out[:75] + '...'
-            if rc != 0:
-                if err:
-                    msg = err
-                else:
-                    msg = out
-                module.fail_json(msg=msg)
+    installed = installed_packages(module, name)
+    missing = [n for n in name if n not in installed]
+
+    # Every entry is one pkgutil run for all the packages it applies to
+    actions = []
+    if state in ('present', 'latest') and missing:
+        actions.append((package_install, (module, state, missing, site, update_catalog)))
+    if state == 'latest' and installed:
+        outdated = outdated_packages(module, installed, site)
+        if outdated:
+            actions.append((package_upgrade, (module, outdated, site, update_catalog)))
+    if state == 'absent' and installed:
+        actions.append((package_uninstall, (module, installed)))
+
+    if actions and module.check_mode:
+        module.exit_json(changed=True)
+
+    for action, args in actions:
+        (rc, out, err) = action(*args)
+        # Stdout is normally empty but for some packages can be
+        # very long and is not often useful
+        if len(out) > 75:
+            out = out[:75] + '...'
+        if rc != 0:
+            if err:
+                msg = err
+            else:
+                msg = out
+            module.fail_json(msg=msg)
 
     if rc is None:
         # pkgutil was not executed because the package was already present/absent
@@ -220,4 +221,6 @@ def main():
 
 # import module snippets
 from ansible.module_utils.basic import *
-main()
+
+if __name__ == '__main__':
+    main()
@@ -146,6 +146,20 @@ options:
     default: False
     choices: [ "yes", "no" ]
 
+  batch_query:
+    description:
+      - Check unversioned atoms directly against C(/var/db/pkg) and sets
+        against the world_sets file, and resolve all versioned atoms with a
+        single C(emerge --pretend --columns) call, instead of running
+        C(equery) once per atom. The results are cached for the duration
+        of the task.
+      - Atoms with a version operator still fall back to C(equery) when
+        removing packages.
+    required: false
+    default: False
+    choices: [ "yes", "no" ]
+    version_added: 2.3
+
 requirements: [ gentoolkit ]
 author: 
     - "Yap Sok Ann (@sayap)"
@@ -177,6 +191,9 @@ EXAMPLES = '''
 
 # Remove package foo if it is not explicitly needed
 - portage: package=foo state=absent depclean=yes
+
+# Check a large list of atoms in one emerge call instead of one equery per atom
+- portage: package=@desktop,app-editors/vim,dev-vcs/git,=dev-lang/python-2.7* batch_query=yes
 '''
 
 
@@ -188,6 +205,8 @@ import re
 def query_package(module, package, action):
     if package.startswith('@'):
         return query_set(module, package, action)
+    if module.params['batch_query'] and is_plain_atom(package):
+        return query_vdb(module, package)
     return query_atom(module, package, action)
 
 
@@ -198,23 +217,31 @@ def query_atom(module, atom, action):
     return rc == 0
 
 
+system_sets = [
+    '@live-rebuild',
+    '@module-rebuild',
+    '@preserved-rebuild',
+    '@security',
+    '@selected',
+    '@system',
+    '@world',
+    '@x11-module-rebuild',
+]
+
+
+def is_system_set(set):
+    return set in system_sets
+
+
 def query_set(module, set, action):
-    system_sets = [
-        '@live-rebuild',
-        '@module-rebuild',
-        '@preserved-rebuild',
-        '@security',
-        '@selected',
-        '@system',
-        '@world',
-        '@x11-module-rebuild',
-    ]
-
-    if set in system_sets:
+    if is_system_set(set):
         if action == 'unmerge':
             module.fail_json(msg='set %s cannot be removed' % set)
         return False
 
+    if module.params['batch_query']:
+        return set in read_world_sets(module)
+
     world_sets_path = '/var/lib/portage/world_sets'
     if not os.path.exists(world_sets_path):
         return False
@@ -225,6 +252,133 @@ def query_set(module, set, action):
     return rc == 0
 
 
+def read_world_sets(module):
+    """Return the sets recorded in the world_sets file, read once per run."""
+    if module.world_sets is None:
+        module.world_sets = []
+        world_sets_path = '/var/lib/portage/world_sets'
+        if os.path.exists(world_sets_path):
+            f = open(world_sets_path)
+            try:
+                module.world_sets = [line.strip() for line in f if line.strip()]
+            finally:
+                f.close()
+    return module.world_sets
+
+
+vdb_path = '/var/db/pkg'
+atom_version_re = re.compile(r'^(?P<pn>.+?)-(?P<version>\d[^-]*(?:-r\d+)?)$')
+
+
+def is_plain_atom(atom):
+    """An atom without version operators, e.g. C(foo), C(cat/foo) or C(cat/foo:2)."""
+    return not re.match(r'^[<>=~!]', atom)
+
+
+def atom_key(atom):
+    """Reduce an unversioned atom to its vdb index key, C(cat/foo) or C(cat/foo:SLOT).
+
+    Repository qualifiers and sub-slots are dropped, and so are the slot
+    operators C(:*) and C(:=) that match any slot.
+    """
+    atom = atom.split('::', 1)[0]
+    if ':' not in atom:
+        return atom
+    name, slot = atom.split(':', 1)
+    slot = slot.split('/', 1)[0].rstrip('=')
+    if slot in ('', '*'):
+        return name
+    return '%s:%s' % (name, slot)
+
+
+def read_slot(entry_path):
+    """Return the slot recorded for an installed package, without its sub-slot."""
+    slot_path = os.path.join(entry_path, 'SLOT')
+    if not os.path.exists(slot_path):
+        return None
+    f = open(slot_path)
+    try:
+        return f.read().strip().split('/', 1)[0] or None
+    finally:
+        f.close()
+
+
+def read_vdb(module):
+    """Index /var/db/pkg by category/name and by bare name, with and without
+    the slot, read once per run."""
+    if module.vdb is None:
+        installed = {}
+        if os.path.isdir(vdb_path):
+            for category in os.listdir(vdb_path):
+                category_path = os.path.join(vdb_path, category)
+                if not os.path.isdir(category_path):
+                    continue
+                for entry in os.listdir(category_path):
+                    match = atom_version_re.match(entry)
+                    if not match:
+                        continue
+                    pn = match.group('pn')
+                    version = match.group('version')
+                    slot = read_slot(os.path.join(category_path, entry))
+                    for key in ('%s/%s' % (category, pn), pn):
+                        installed.setdefault(key, []).append(version)
+                        if slot:
+                            installed.setdefault('%s:%s' % (key, slot), []).append(version)
+        module.vdb = installed
+    return module.vdb
+
+
+def query_vdb(module, atom):
+    return atom_key(atom) in read_vdb(module)
+
+
+def parse_emerge_plan(out):
+    """Parse the merge list printed by C(emerge --pretend --columns)."""
+    plan = []
+    for line in out.splitlines():
+        match = re.match(r'^\[(?P<type>ebuild|binary)\s*(?P<flags>[^\]]*)\]\s+(?P<cpv>\S+)', line)
+        if match:
+            plan.append(match.groupdict())
+    return plan
+
+
+def resolve_plan(module, packages):
+    """Resolve all given atoms in a single emerge --pretend call.
+
+    The resulting merge list is cached on the module for the rest of the run.
+    """
+    key = tuple(packages)
+    if key not in module.emerge_plans:
+        cmd = [module.emerge_path, '--pretend', '--verbose', '--columns',
+               '--noreplace', '--color=n', '--ask=n'] + packages
+        rc, out, err = module.run_command(cmd)
+        if rc != 0:
+            module.fail_json(
+                cmd=cmd, rc=rc, stdout=out, stderr=err,
+                msg='Could not resolve packages.',
+            )
+        module.emerge_plans[key] = parse_emerge_plan(out)
+    return module.emerge_plans[key]
+
+
+def batch_query_present(module, packages):
+    """Return True if every requested atom and set is already satisfied."""
+    versioned = []
+    for package in packages:
+        if package.startswith('@'):
+            if not query_set(module, package, 'emerge'):
+                return False
+        elif is_plain_atom(package):
+            if not query_vdb(module, package):
+                return False
+        else:
+            versioned.append(package)
+
+    if not versioned:
+        return True
+    return not resolve_plan(module, versioned)
+
+
 def sync_repositories(module, webrsync=False):
     if module.check_mode:
         module.exit_json(msg='check mode not supported by sync')
@@ -242,18 +396,23 @@ def sync_repositories(module, webrsync=False):
 
 # Note: In the 3 functions below, equery is done one-by-one, but emerge is done
 # in one go. If that is not desirable, split the packages into multiple tasks
-# instead of joining them together with comma.
+# instead of joining them together with comma. With batch_query, the queries
+# are answered from /var/db/pkg and a single emerge --pretend instead.
 
 
 def emerge_packages(module, packages):
     p = module.params
 
     if not (p['update'] or p['noreplace']):
-        for package in packages:
-            if not query_package(module, package, 'emerge'):
-                break
+        if p['batch_query']:
+            if batch_query_present(module, packages):
+                module.exit_json(changed=False, msg='Packages already present.')
         else:
-            module.exit_json(changed=False, msg='Packages already present.')
+            for package in packages:
+                if not query_package(module, package, 'emerge'):
+                    break
+            else:
+                module.exit_json(changed=False, msg='Packages already present.')
         if module.check_mode:
             module.exit_json(changed=True, msg='Packages would be installed.')
 
@@ -416,6 +575,7 @@ def main():
             getbinpkg=dict(default=False, type='bool'),
             usepkgonly=dict(default=False, type='bool'),
             usepkg=dict(default=False, type='bool'),
+            batch_query=dict(default=False, type='bool'),
         ),
         required_one_of=[['package', 'sync', 'depclean']],
         mutually_exclusive=[['nodeps', 'onlydeps'], ['quiet', 'verbose']],
@@ -424,6 +584,9 @@ def main():
 
     module.emerge_path = module.get_bin_path('emerge', required=True)
     module.equery_path = module.get_bin_path('equery', required=True)
+    module.vdb = None
+    module.world_sets = None
+    module.emerge_plans = {}
 
     p = module.params
 
@@ -454,4 +617,5 @@ def main():
 # import module snippets
 from ansible.module_utils.basic import *
 
-main()
+if __name__ == '__main__':
+    main()
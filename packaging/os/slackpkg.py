@@ -66,97 +66,93 @@ EXAMPLES = '''
 
 '''
 
+import os
 
-def query_package(module, slackpkg_path, name):
+PACKAGE_LOG_DIR = '/var/log/packages'
 
-    import glob
-    import platform
 
-    machine = platform.machine()
-    packages = glob.glob("/var/log/packages/%s-*-[%s|noarch]*" % (name,
-                                                                  machine))
+def parse_package_log(entries):
+    """Parse the entries of /var/log/packages.
 
-    if len(packages) > 0:
-        return True
+    Each installed package leaves a file named name-version-arch-build
+    (e.g. 'glibc-solibs-2.23-x86_64-1'); only the name may contain dashes.
 
-    return False
+    Returns a dict mapping package names to (version, arch, build) tuples.
+    """
+    packages = {}
+    for entry in entries:
+        fields = entry.strip().rsplit('-', 3)
+        if len(fields) != 4 or not fields[0]:
+            continue
+        packages[fields[0]] = tuple(fields[1:])
+    return packages
 
 
-def remove_packages(module, slackpkg_path, packages):
+def get_installed_packages(module):
+    try:
+        entries = os.listdir(PACKAGE_LOG_DIR)
+    except OSError:
+        e = get_exception()
+        module.fail_json(msg="could not read %s: %s" % (PACKAGE_LOG_DIR, str(e)))
+    return parse_package_log(entries)
 
-    remove_c = 0
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, slackpkg_path, package):
-            continue
 
-        if not module.check_mode:
-            rc, out, err = module.run_command("%s -default_answer=y -batch=on \
-                                              remove %s" % (slackpkg_path,
-                                              package))
+def slackpkg_command(module, slackpkg_path, command, packages):
+    return module.run_command("%s -default_answer=y -batch=on %s %s" % (
+        slackpkg_path, command, " ".join(packages)))
 
-        if not module.check_mode and query_package(module, slackpkg_path,
-                                                   package):
-            module.fail_json(msg="failed to remove %s: %s" % (package, out))
 
-        remove_c += 1
+def remove_packages(module, slackpkg_path, packages):
 
-    if remove_c > 0:
+    installed = get_installed_packages(module)
+    to_remove = [package for package in packages if package in installed]
 
-        module.exit_json(changed=True, msg="removed %s package(s)" % remove_c)
+    if not to_remove:
+        module.exit_json(changed=False, msg="package(s) already absent")
 
-    module.exit_json(changed=False, msg="package(s) already absent")
+    if not module.check_mode:
+        rc, out, err = slackpkg_command(module, slackpkg_path, "remove", to_remove)
 
+        installed = get_installed_packages(module)
+        failed = [package for package in to_remove if package in installed]
+        if failed:
+            module.fail_json(msg="failed to remove %s: %s" % (", ".join(failed), out))
 
-def install_packages(module, slackpkg_path, packages):
+    module.exit_json(changed=True, msg="removed %s package(s)" % len(to_remove))
 
-    install_c = 0
 
-    for package in packages:
-        if query_package(module, slackpkg_path, package):
-            continue
+def install_packages(module, slackpkg_path, packages):
 
-        if not module.check_mode:
-            rc, out, err = module.run_command("%s -default_answer=y -batch=on \
-                                              install %s" % (slackpkg_path,
-                                              package))
+    installed = get_installed_packages(module)
+    to_install = [package for package in packages if package not in installed]
 
-        if not module.check_mode and not query_package(module, slackpkg_path,
-                                                       package):
-            module.fail_json(msg="failed to install %s: %s" % (package, out),
-                             stderr=err)
+    if not to_install:
+        module.exit_json(changed=False, msg="package(s) already present")
 
-        install_c += 1
+    if not module.check_mode:
+        rc, out, err = slackpkg_command(module, slackpkg_path, "install", to_install)
 
-    if install_c > 0:
-        module.exit_json(changed=True, msg="present %s package(s)"
-                         % (install_c))
+        installed = get_installed_packages(module)
+        failed = [package for package in to_install if package not in installed]
+        if failed:
+            module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out),
+                             stderr=err)
 
-    module.exit_json(changed=False, msg="package(s) already present")
+    module.exit_json(changed=True, msg="present %s package(s)" % len(to_install))
 
 
 def upgrade_packages(module, slackpkg_path, packages):
-    install_c = 0
 
-    for package in packages:
-        if not module.check_mode:
-            rc, out, err = module.run_command("%s -default_answer=y -batch=on \
-                                              upgrade %s" % (slackpkg_path,
-                                              package))
+    if not module.check_mode:
+        rc, out, err = slackpkg_command(module, slackpkg_path, "upgrade", packages)
 
-        if not module.check_mode and not query_package(module, slackpkg_path,
-                                                       package):
-            module.fail_json(msg="failed to install %s: %s" % (package, out),
+        installed = get_installed_packages(module)
+        failed = [package for package in packages if package not in installed]
+        if failed:
+            module.fail_json(msg="failed to install %s: %s" % (", ".join(failed), out),
                              stderr=err)
 
-        install_c += 1
-
-    if install_c > 0:
-        module.exit_json(changed=True, msg="present %s package(s)"
-                         % (install_c))
-
-    module.exit_json(changed=False, msg="package(s) already present")
+    module.exit_json(changed=True, msg="present %s package(s)" % len(packages))
 
 
 def update_cache(module, slackpkg_path):
@@ -196,4 +192,5 @@ def main():
 # import module snippets
 from ansible.module_utils.basic import *
 
-main()
+if __name__ == '__main__':
+    main()
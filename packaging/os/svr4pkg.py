@@ -35,6 +35,7 @@ options:
   name:
     description:
       - Package name, e.g. C(SUNWcsr)
+      - Since Ansible 2.3 a list of packages may be given; they are installed or removed with a single C(pkgadd)/C(pkgrm) run.
     required: true
 
   state:
@@ -77,6 +78,9 @@ EXAMPLES = '''
 # Install a package from an already copied file
 - svr4pkg: name=CSWcommon src=/tmp/cswpkgs.pkg state=present
 
+# Install several packages from the same datastream in one pkgadd run
+- svr4pkg: name=CSWcommon,CSWwget,CSWcurl src=/tmp/cswpkgs.pkg state=present
+
 # Install a package directly from an http site
 - svr4pkg: name=CSWpkgutil src=http://get.opencsw.org/now state=present zone=current
 
@@ -94,6 +98,34 @@ EXAMPLES = '''
 import os
 import tempfile
 
+def parse_pkginfo(out):
+    """Parse the output of 'pkginfo' run without arguments.
+
+    Every line holds the category, the package instance and its
+    description, e.g. 'system      SUNWcsr        Core Solaris, (Root)'.
+
+    Returns a dict mapping package instances to their category.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split(None, 2)
+        if len(fields) < 2:
+            continue
+        packages[fields[1]] = fields[0]
+    return packages
+
+def installed_packages(module, names, category):
+    """Return the subset of names that is installed.
+
+    Packages are looked up in a single listing of the package database,
+    categories still need one query each.
+    """
+    if category:
+        return [name for name in names if package_installed(module, name, category)]
+    rc, out, err = module.run_command(module.get_bin_path('pkginfo', True))
+    installed = parse_pkginfo(out)
+    return [name for name in names if name in installed]
+
 def package_installed(module, name, category):
     cmd = [module.get_bin_path('pkginfo', True)]
     cmd.append('-q')
@@ -135,8 +167,7 @@ def run_command(module, cmd):
     cmd[0] = module.get_bin_path(progname, True)
     return module.run_command(cmd)
 
-def package_install(module, name, src, proxy, response_file, zone, category):
-    adminfile = create_admin_file()
+def package_install(module, names, src, proxy, response_file, zone, category, adminfile):
     cmd = [ 'pkgadd', '-n'] 
     if zone == 'current':
         cmd += [ '-G' ]
@@ -147,25 +178,20 @@ def package_install(module, name, src, proxy, response_file, zone, category):
         cmd += [ '-r', response_file ]
     if category:
         cmd += [ '-Y' ]
-    cmd.append(name)
-    (rc, out, err) = run_command(module, cmd)
-    os.unlink(adminfile)
-    return (rc, out, err)
+    cmd += names
+    return run_command(module, cmd)
 
-def package_uninstall(module, name, src, category):
-    adminfile = create_admin_file()
+def package_uninstall(module, names, src, category, adminfile):
     if category:
-        cmd = [ 'pkgrm', '-na', adminfile, '-Y', name ]
+        cmd = [ 'pkgrm', '-na', adminfile, '-Y' ] + names
     else:
-        cmd = [ 'pkgrm', '-na', adminfile, name]
-    (rc, out, err) = run_command(module, cmd)
-    os.unlink(adminfile)
-    return (rc, out, err)
+        cmd = [ 'pkgrm', '-na', adminfile ] + names
+    return run_command(module, cmd)
 
 def main():
     module = AnsibleModule(
         argument_spec = dict(
-            name = dict(required = True),
+            name = dict(required = True, type = 'list'),
             state = dict(required = True, choices=['present', 'absent']),
             src = dict(default = None),
             proxy = dict(default = None),
@@ -189,25 +215,33 @@ def main():
     result['name'] = name
     result['state'] = state
 
+    if state == 'present' and src is None:
+        module.fail_json(name=name,
+                         msg="src is required when state=present")
+
+    installed = installed_packages(module, name, category)
     if state == 'present':
-        if src is None:
-            module.fail_json(name=name,
-                             msg="src is required when state=present")
-        if not package_installed(module, name, category):
-            if module.check_mode:
-                module.exit_json(changed=True)
-            (rc, out, err) = package_install(module, name, src, proxy, response_file, zone, category)
-            # Stdout is normally empty but for some packages can be
-            # very long and is not often useful
-            if len(out) > 75:
-                out = out[:75] + '...'
-
-    elif state == 'absent':
-        if package_installed(module, name, category):
-            if module.check_mode:
-                module.exit_json(changed=True)
-            (rc, out, err) = package_uninstall(module, name, src, category)
-            out = out[:75]
+        pending = [n for n in name if n not in installed]
+    else:
+        pending = [n for n in name if n in installed]
+
+    if pending:
+        if module.check_mode:
+            module.exit_json(changed=True)
+        # A single admin file and a single pkgadd/pkgrm run for all packages
+        adminfile = create_admin_file()
+        try:
+            if state == 'present':
+                (rc, out, err) = package_install(module, pending, src, proxy, response_file, zone, category, adminfile)
+                # Stdout is normally empty but for some packages can be
+                # very long and is not often useful
+                if len(out) > 75:
+                    out = out[:75] + '...'
+            else:
+                (rc, out, err) = package_uninstall(module, pending, src, category, adminfile)
+                out = out[:75]
+        finally:
+            os.unlink(adminfile)
 
     # Returncodes as per pkgadd(1m)
     #    0 Successful completion
@@ -242,4 +276,6 @@ def main():
 
 # import module snippets
 from ansible.module_utils.basic import *
-main()
+
+if __name__ == '__main__':
+    main()
@@ -34,6 +34,8 @@ options:
     name:
         description:
             - package name.
+            - A revision may be appended to the name, e.g. C(unzip-6.0); the package is then only considered installed at that revision.
+            - Since Ansible 2.3 a list of packages may be given; installed and depot revisions are read once and all packages are installed or removed in one run.
         required: true
         default: null
         choices: []
@@ -58,9 +60,10 @@ options:
 '''
 
 EXAMPLES = '''
-- swdepot: name=unzip-6.0 state=installed depot=repository:/path
+- swdepot: name=unzip-6.0 state=present depot=repository:/path
 - swdepot: name=unzip state=latest depot=repository:/path
 - swdepot: name=unzip state=absent
+- swdepot: name=unzip,gzip,wget state=latest depot=repository:/path
 '''
 
 def compare_package(version1, version2):
@@ -71,40 +74,78 @@ def compare_package(version1, version2):
         1 fisrt greater """
 
     def normalize(v):
-        return [int(x) for x in re.sub(r'(\.0+)*$', '', v).split(".")]
-    return cmp(normalize(version1), normalize(version2))
-
-def query_package(module, name, depot=None):
-    """ Returns whether a package is installed or not and version. """
+        # HP-UX revisions mix numbers and letters (e.g. B.11.31.1405)
+        parts = []
+        for x in re.sub(r'(\.0+)*$', '', v).split("."):
+            if x.isdigit():
+                parts.append((0, int(x), ''))
+            else:
+                parts.append((1, 0, x))
+        return parts
+    v1 = normalize(version1)
+    v2 = normalize(version2)
+    return (v1 > v2) - (v1 < v2)
+
+def parse_swlist(out):
+    """ Parse the output of 'swlist -a revision -l product'.
+        Comment lines start with '#', every other line holds the
+        product name and its revision.
+        Returns a dict mapping product names to revisions. """
+
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) < 2 or fields[0].startswith('#'):
+            continue
+        packages[fields[0]] = fields[1]
+    return packages
+
+def split_name(name, products):
+    """ Split a 'product-revision' name such as unzip-6.0 into the product
+        and its revision. Names of known products are never split.
+        Returns a (product, revision) tuple, revision is None when the
+        name holds no revision. """
+
+    if name not in products:
+        match = re.match(r'^(.+)-([\w.]*\d[\w.]*)$', name)
+        if match:
+            return match.group(1), match.group(2)
+    return name, None
+
+def selection(product, revision):
+    """ Returns the software selection swinstall expects for a product. """
+
+    if revision:
+        return "%s,r=%s" % (product, revision)
+    return product
+
+def query_packages(module, depot=None):
+    """ Returns all installed (or, with depot, available) products and their revision. """
 
     cmd_list = '/usr/sbin/swlist -a revision -l product'
     if depot:
-        rc, stdout, stderr = module.run_command("%s -s %s %s | grep %s" % (cmd_list, pipes.quote(depot), pipes.quote(name), pipes.quote(name)), use_unsafe_shell=True)
-    else:
-        rc, stdout, stderr = module.run_command("%s %s | grep %s" % (cmd_list, pipes.quote(name), pipes.quote(name)), use_unsafe_shell=True)
-    if rc == 0:
-        version = re.sub("\s\s+|\t" , " ", stdout).strip().split()[1]
-    else:
-        version = None
-
-    return rc, version
+        cmd_list += ' -s %s' % pipes.quote(depot)
+    rc, stdout, stderr = module.run_command(cmd_list)
+    if rc != 0:
+        module.fail_json(msg="could not list products: %s" % stderr, rc=rc)
+    return parse_swlist(stdout)
 
-def remove_package(module, name):
-    """ Uninstall package if installed. """
+def remove_package(module, names):
+    """ Uninstall packages if installed. """
 
     cmd_remove = '/usr/sbin/swremove'
-    rc, stdout, stderr = module.run_command("%s %s" % (cmd_remove, name))
+    rc, stdout, stderr = module.run_command("%s %s" % (cmd_remove, " ".join(names)))
 
     if rc == 0:
         return rc, stdout
     else:
         return rc, stderr
 
-def install_package(module, depot, name):
-    """ Install package if not already installed """
+def install_package(module, depot, names):
+    """ Install packages if not already installed """
 
     cmd_install = '/usr/sbin/swinstall -x mount_all_filesystems=false'
-    rc, stdout, stderr = module.run_command("%s -s %s %s" % (cmd_install, depot, name))
+    rc, stdout, stderr = module.run_command("%s -s %s %s" % (cmd_install, depot, " ".join(names)))
     if rc == 0:
         return rc, stdout
     else:
@@ -113,7 +154,7 @@ def install_package(module, depot, name):
 def main():
     module = AnsibleModule(
         argument_spec = dict(
-            name = dict(aliases=['pkg'], required=True),
+            name = dict(aliases=['pkg'], required=True, type='list'),
             state = dict(choices=['present', 'absent', 'latest'], required=True),
             depot = dict(default=None, required=False)
         ),
@@ -131,53 +172,60 @@ def main():
         module.fail_json(name=name, msg=output, rc=rc)
 
 
-    #Check local version
-    rc, version_installed = query_package(module, name)
-    if not rc:
-        installed = True
+    #Check local versions of all products at once
+    installed = query_packages(module)
+    specs = dict((n, split_name(n, installed)) for n in name)
+
+    def is_installed(n):
+        product, revision = specs[n]
+        if product not in installed:
+            return False
+        return revision is None or compare_package(installed[product], revision) == 0
+
+    missing = [n for n in name if not is_installed(n)]
+    if not missing:
         msg = "Already installed"
 
-    else:
-        installed = False
+    to_install = []
+    upgraded = []
+    if state == 'present' or state == 'latest':
+        to_install = [selection(*specs[n]) for n in missing]
 
-    if ( state == 'present' or state == 'latest' ) and installed == False:
+    if state == 'latest':
+        #Check depot versions of all products at once
+        available = query_packages(module, depot)
+        unknown = [n for n in name if specs[n][0] not in available]
+        if unknown:
+            output = "Software package not in repository " + depot
+            module.fail_json(name=unknown, msg=output, rc=rc)
+        for n in name:
+            product = specs[n][0]
+            if n in missing:
+                continue
+            if compare_package(installed[product], available[product]) == -1:
+                to_install.append(product)
+                upgraded.append("%s (before %s now %s)" % (product, installed[product], available[product]))
+
+    if to_install:
         if module.check_mode:
             module.exit_json(changed=True)
-        rc, output = install_package(module, depot, name)
+        rc, output = install_package(module, depot, to_install)
 
         if not rc:
             changed = True
-            msg = "Package installed"
+            if upgraded:
+                msg = "Package upgraded: " + ", ".join(upgraded)
+            else:
+                msg = "Package installed"
 
         else:
             module.fail_json(name=name, msg=output, rc=rc)
 
-    elif state == 'latest' and installed == True:
-        #Check depot version
-        rc, version_depot = query_package(module, name, depot)
-
-        if not rc:
-            if compare_package(version_installed,version_depot) == -1:
-                if module.check_mode:
-                    module.exit_json(changed=True)
-                #Install new version
-                rc, output = install_package(module, depot, name)
-
-                if not rc:
-                    msg = "Packge upgraded, Before " + version_installed + " Now " + version_depot
-                    changed = True
-
-                else:
-                    module.fail_json(name=name, msg=output, rc=rc)
-
-        else:
-            output = "Software package not in repository " + depot
-            module.fail_json(name=name, msg=output, rc=rc)
-
-    elif state == 'absent' and installed == True:
+    to_remove = [specs[n][0] for n in name if is_installed(n)]
+    if state == 'absent' and to_remove:
         if module.check_mode:
             module.exit_json(changed=True)
-        rc, output = remove_package(module, name)
+        rc, output = remove_package(module, to_remove)
         if not rc:
             changed = True
             msg = "Package removed"
@@ -192,5 +240,5 @@ def main():
 # import module snippets
 from ansible.module_utils.basic import *
 
-main()
-
+if __name__ == '__main__':
+    main()
@@ -80,22 +80,44 @@ import sys
 URPMI_PATH = '/usr/sbin/urpmi'
 URPME_PATH = '/usr/sbin/urpme'
 
-def query_package(module, name):
-    # rpm -q returns 0 if the package is installed,
-    # 1 if it is not installed
-    cmd = "rpm -q %s" % (name)
-    rc, stdout, stderr = module.run_command(cmd, check_rc=False)
-    if rc == 0:
-        return True
-    else:
-        return False
+def parse_rpm_list(out):
+    """Parse 'rpm -qa --qf "%{NAME} %{VERSION}-%{RELEASE}\\n"' output.
+
+    Returns a dict mapping package names to their installed versions; all
+    installed versions are kept when a package is installed more than once.
+    """
+    packages = {}
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) != 2:
+            continue
+        packages.setdefault(fields[0], []).append(fields[1])
+    return packages
+
 
-def query_package_provides(module, name):
-    # rpm -q returns 0 if the package is installed,
-    # 1 if it is not installed
-    cmd = "rpm -q --provides %s" % (name)
+def get_installed_packages(module):
+    # a single query of the rpm database instead of one 'rpm -q' per package
+    cmd = "rpm -qa --qf '%{NAME} %{VERSION}-%{RELEASE}\\n'"
     rc, stdout, stderr = module.run_command(cmd, check_rc=False)
-    return rc == 0
+    if rc != 0:
+        module.fail_json(msg="could not list installed packages: %s" % stderr)
+    return parse_rpm_list(stdout)
+
+
+def is_installed(installed, package):
+    """Tell whether package matches an entry of installed, the way
+    'rpm -q' would: by name, name-version or name-version-release.
+    """
+    if package in installed:
+        return True
+    parts = package.split('-')
+    for i in range(len(parts) - 1, 0, -1):
+        name = '-'.join(parts[:i])
+        version = '-'.join(parts[i:])
+        for installed_version in installed.get(name, []):
+            if version in (installed_version, installed_version.split('-')[0]):
+                return True
+    return False
 
 
 def update_package_db(module):
@@ -106,63 +128,54 @@ def update_package_db(module):
          
 
 def remove_packages(module, packages):
-    
-    remove_c = 0
-    # Using a for loop incase of error, we can report the package that failed
-    for package in packages:
-        # Query the package first, to see if we even need to remove
-        if not query_package(module, package):
-            continue
 
-        cmd = "%s --auto %s" % (URPME_PATH, package)
-        rc, stdout, stderr = module.run_command(cmd, check_rc=False)
+    installed = get_installed_packages(module)
+    to_remove = [package for package in packages if is_installed(installed, package)]
 
-        if rc != 0:
-            module.fail_json(msg="failed to remove %s" % (package))
-    
-        remove_c += 1
+    if not to_remove:
+        module.exit_json(changed=False, msg="package(s) already absent")
 
-    if remove_c > 0:
+    cmd = "%s --auto %s" % (URPME_PATH, " ".join(["'%s'" % package for package in to_remove]))
+    rc, stdout, stderr = module.run_command(cmd, check_rc=False)
 
-        module.exit_json(changed=True, msg="removed %s package(s)" % remove_c)
+    if rc != 0:
+        module.fail_json(msg="failed to remove %s" % ", ".join(to_remove), stderr=stderr)
 
-    module.exit_json(changed=False, msg="package(s) already absent")
+    module.exit_json(changed=True, msg="removed %s package(s)" % len(to_remove))
 
 
 def install_packages(module, pkgspec, force=True, no_recommends=True):
 
-    packages = ""
-    for package in pkgspec:
-        if not query_package_provides(module, package):
-            packages += "'%s' " % package
+    installed = get_installed_packages(module)
+    to_install = [package for package in pkgspec if not is_installed(installed, package)]
 
-    if len(packages) != 0:
-        if no_recommends:
-            no_recommends_yes = '--no-recommends'
-        else:
-            no_recommends_yes = ''
+    if not to_install:
+        module.exit_json(changed=False)
 
-        if force:
-            force_yes = '--force'
-        else:
-            force_yes = ''
+    packages = " ".join(["'%s'" % package for package in to_install])
 
-        cmd = ("%s --auto %s --quiet %s %s" % (URPMI_PATH, force_yes, no_recommends_yes, packages))
+    if no_recommends:
+        no_recommends_yes = '--no-recommends'
+    else:
+        no_recommends_yes = ''
 
-        rc, out, err = module.run_command(cmd)
+    if force:
+        force_yes = '--force'
+    else:
+        force_yes = ''
 
-        installed = True
-        for packages in pkgspec:
-            if not query_package_provides(module, package):
-                installed = False
+    cmd = ("%s --auto %s --quiet %s %s" % (URPMI_PATH, force_yes, no_recommends_yes, packages))
 
-        # urpmi always have 0 for exit code if --force is used
-        if rc or not installed:
-            module.fail_json(msg="'urpmi %s' failed: %s" % (packages, err))
-        else:
-            module.exit_json(changed=True, msg="%s present(s)" % packages)
+    rc, out, err = module.run_command(cmd)
+
+    installed = get_installed_packages(module)
+    missing = [package for package in to_install if not is_installed(installed, package)]
+
+    # urpmi always have 0 for exit code if --force is used
+    if rc or missing:
+        module.fail_json(msg="'urpmi %s' failed: %s" % (packages, err), missing=missing)
     else:
-        module.exit_json(changed=False)
+        module.exit_json(changed=True, msg="%s present(s)" % packages)
 
 
 def main():
@@ -196,5 +209,6 @@ def main():
 
 # import module snippets
 from ansible.module_utils.basic import *
-    
-main()        
+
+if __name__ == '__main__':
+    main()        
@@ -240,11 +240,12 @@ options:
         expire.
       - Default value is 6 hours.
   name:
-    required: true
+    required: false
     description:
       - Unique repository ID.
       - This parameter is only required if I(state) is set to C(present) or
         C(absent).
+      - Either this or I(repos) is required.
   params:
     required: false
     default: null
@@ -269,6 +270,14 @@ options:
     default: 'no'
     description:
       - Protect packages from updates from other repositories.
+  purge:
+    required: false
+    choices: ['yes', 'no']
+    default: 'no'
+    version_added: '2.3'
+    description:
+      - Only used with I(repos). Remove all repositories found in the C(.repo)
+        files of I(reposdir) which are not listed in I(repos).
   proxy:
     required: false
     default: null
@@ -292,6 +301,18 @@ options:
     description:
       - This tells yum whether or not it should perform a GPG signature check
         on the repodata from this repository.
+  repos:
+    required: false
+    default: null
+    version_added: '2.3'
+    description:
+      - List of repositories to reconcile in one pass. Each item is a
+        dictionary taking the same options as this module (I(name),
+        I(description), I(baseurl), I(file), I(state), ...).
+      - All C(.repo) files in I(reposdir) are parsed once, the changes are
+        computed in memory and only files whose rendered content changes are
+        written.
+      - Cannot be used together with I(name).
   reposdir:
     required: false
     default: /etc/yum.repos.d
@@ -447,6 +468,22 @@ EXAMPLES = '''
     gpgkey: http://server.com/keys/somerepo.pub
     gpgcheck: yes
     params: "{{ my_role_somerepo_params }}"
+
+- name: Define all repositories of the image and remove any others
+  yum_repository:
+    repos:
+      - name: base
+        description: Base repo
+        baseurl: http://mirror.example.com/centos/$releasever/os/$basearch/
+        file: company
+      - name: updates
+        description: Updates repo
+        baseurl: http://mirror.example.com/centos/$releasever/updates/$basearch/
+        file: company
+      - name: epel
+        description: EPEL YUM repo
+        baseurl: http://download.fedoraproject.org/pub/epel/$releasever/$basearch/
+    purge: yes
 '''
 
 RETURN = '''
@@ -460,6 +497,16 @@ state:
     returned: success
     type: string
     sample: "present"
+changed_files:
+    description: repo files written or removed when using I(repos)
+    returned: success
+    type: list
+    sample: ["/etc/yum.repos.d/company.repo"]
+repos:
+    description: per repository change (added, changed, removed) when using I(repos)
+    returned: success
+    type: dict
+    sample: {"epel": "added", "rpmforge": "removed"}
 '''
 
 
@@ -623,6 +670,215 @@ class YumRepo(object):
         return repo_string
 
 
+class YumRepoDir(object):
+    """Reconcile a full set of repositories against all files of reposdir."""
+
+    def __init__(self, module):
+        self.module = module
+        self.params = self.module.params
+        self.repos_dir = self.params['reposdir']
+        # Items of repos are not type checked by AnsibleModule
+        self.bool_params = [
+            key for key, spec in self.module.argument_spec.items()
+            if spec.get('type') == 'bool']
+
+        if not os.path.isdir(self.repos_dir):
+            self.module.fail_json(
+                msg="Repo directory '%s' does not exist." % self.repos_dir)
+
+        # Parse every repo file only once
+        self.files = {}
+        for filename in sorted(os.listdir(self.repos_dir)):
+            if not filename.endswith('.repo'):
+                continue
+            path = os.path.join(self.repos_dir, filename)
+            if not os.path.isfile(path):
+                continue
+            repofile = ConfigParser.RawConfigParser()
+            try:
+                repofile.read(path)
+            except ConfigParser.Error:
+                e = get_exception()
+                self.module.fail_json(
+                    msg="Cannot parse repo file %s." % path, details=str(e))
+            self.files[path] = repofile
+
+        self.before = {}
+        for path, repofile in self.files.items():
+            self.before[path] = self.dump(repofile)
+
+        # Files of the present repos, the only ones whose attributes are set
+        self.managed = set()
+
+    def dump(self, repofile):
+        repo_string = ""
+
+        for section in sorted(repofile.sections()):
+            repo_string += "[%s]\n" % section
+
+            for key, value in sorted(repofile.items(section)):
+                repo_string += "%s = %s\n" % (key, value)
+
+            repo_string += "\n"
+
+        return repo_string
+
+    def options(self, repo):
+        """Turn one item of repos into (repoid, file path, state, options)."""
+        if not isinstance(repo, dict) or not repo.get('name'):
+            self.module.fail_json(
+                msg="Each item of 'repos' must be a dictionary with a 'name'.")
+
+        repo = dict(repo)
+        if isinstance(repo.get('params'), dict):
+            repo.update(repo.pop('params'))
+
+        repoid = repo['name']
+        state = repo.get('state', 'present')
+        path = os.path.join(
+            self.repos_dir, "%s.repo" % repo.get('file', repoid))
+
+        if state == 'present':
+            if repo.get('baseurl') is None and repo.get('mirrorlist') is None:
+                self.module.fail_json(
+                    msg="Parameter 'baseurl' or 'mirrorlist' is required "
+                    "for repo '%s'." % repoid)
+            if repo.get('description') is None:
+                self.module.fail_json(
+                    msg="Parameter 'description' is required for repo "
+                    "'%s'." % repoid)
+
+        # Same renaming as for a single repo
+        repo['name'] = repo.pop('description', None)
+
+        options = {}
+        for key, value in repo.items():
+            if key not in YumRepo.allowed_params or value is None:
+                continue
+            if key in YumRepo.list_params and isinstance(value, list):
+                value = ' '.join(value)
+            elif key in self.bool_params:
+                value = int(self.module.boolean(value))
+            options[key] = str(value)
+
+        return repoid, path, state, options
+
+    def index(self):
+        """Map each repoid to its file and options."""
+        repos = {}
+        for path, repofile in self.files.items():
+            for section in repofile.sections():
+                repos[section] = (path, dict(repofile.items(section)))
+        return repos
+
+    def reconcile(self, repos, purge):
+        before = self.index()
+        wanted = []
+
+        for repo in repos:
+            repoid, path, state, options = self.options(repo)
+
+            # Drop the repo if it is unwanted, defined in another file or
+            # differs from the desired options
+            for other, repofile in self.files.items():
+                if repofile.has_section(repoid) and (
+                        state == 'absent' or other != path or
+                        dict(repofile.items(repoid)) != options):
+                    repofile.remove_section(repoid)
+
+            if state == 'absent':
+                continue
+            wanted.append(repoid)
+            self.managed.add(path)
+
+            if path not in self.files:
+                self.files[path] = ConfigParser.RawConfigParser()
+            repofile = self.files[path]
+
+            if not repofile.has_section(repoid):
+                repofile.add_section(repoid)
+                for key, value in sorted(options.items()):
+                    repofile.set(repoid, key, value)
+
+        if purge:
+            for repofile in self.files.values():
+                for section in repofile.sections():
+                    if section not in wanted:
+                        repofile.remove_section(section)
+
+        after = self.index()
+        changes = {}
+        for repoid in before:
+            if repoid not in after:
+                changes[repoid] = 'removed'
+            elif before[repoid] != after[repoid]:
+                changes[repoid] = 'changed'
+        for repoid in after:
+            if repoid not in before:
+                changes[repoid] = 'added'
+
+        return changes
+
+    def changed_files(self):
+        changed = []
+        for path in sorted(self.files.keys()):
+            if self.dump(self.files[path]) != self.before.get(path):
+                changed.append(path)
+        return changed
+
+    def save(self, path):
+        repofile = self.files[path]
+        if len(repofile.sections()):
+            try:
+                fd = open(path, 'wb')
+            except IOError:
+                e = get_exception()
+                self.module.fail_json(
+                    msg="Cannot open repo file %s." % path, details=str(e))
+
+            repofile.write(fd)
+
+            try:
+                fd.close()
+            except IOError:
+                e = get_exception()
+                self.module.fail_json(
+                    msg="Cannot write repo file %s." % path, details=str(e))
+        elif os.path.isfile(path):
+            # Remove the file if there are not repos
+            try:
+                os.remove(path)
+            except OSError:
+                e = get_exception()
+                self.module.fail_json(
+                    msg="Cannot remove empty repo file %s." % path,
+                    details=str(e))
+
+
+def reconcile_repos(module):
+    yumrepodir = YumRepoDir(module)
+
+    repos = yumrepodir.reconcile(
+        module.params['repos'], module.params['purge'])
+    changed_files = yumrepodir.changed_files()
+
+    if not module.check_mode:
+        for path in changed_files:
+            yumrepodir.save(path)
+
+    changed = len(changed_files) > 0
+
+    # Change file attributes if needed, only for the files of the repos
+    for path in sorted(yumrepodir.managed):
+        if os.path.isfile(path):
+            module.params['dest'] = path
+            file_args = module.load_file_common_arguments(module.params)
+            changed = module.set_fs_attributes_if_different(file_args, changed)
+
+    module.exit_json(
+        changed=changed, changed_files=changed_files, repos=repos)
+
+
 def main():
     # Module settings
     module = AnsibleModule(
@@ -658,15 +914,17 @@ def main():
             metalink=dict(),
             mirrorlist=dict(),
             mirrorlist_expire=dict(),
-            name=dict(required=True),
+            name=dict(),
             params=dict(type='dict'),
             password=dict(no_log=True),
             priority=dict(),
             protect=dict(type='bool'),
             proxy=dict(),
+            purge=dict(type='bool', default=False),
             proxy_password=dict(no_log=True),
             proxy_username=dict(),
             repo_gpgcheck=dict(type='bool'),
+            repos=dict(type='list'),
             reposdir=dict(default='/etc/yum.repos.d', type='path'),
             retries=dict(),
             s3_enabled=dict(type='bool'),
@@ -684,8 +942,13 @@ def main():
         ),
         add_file_common_args=True,
         supports_check_mode=True,
+        required_one_of=[['name', 'repos']],
+        mutually_exclusive=[['name', 'repos']],
     )
 
+    if module.params['repos'] is not None:
+        reconcile_repos(module)
+
     # Update module parameters by user's parameters if defined
     if 'params' in module.params and isinstance(module.params['params'], dict):
         module.params.update(module.params['params'])
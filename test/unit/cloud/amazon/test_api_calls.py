@@ -0,0 +1,493 @@
+#!/usr/bin/python
+"""
+End-to-end runs of the cloud/amazon modules against moto, counting AWS API calls.
+
+Every scenario runs one or more modules in this process while moto mocks
+the AWS services, so no network is used. Only the last run of a scenario is
+measured; earlier runs prepare the state it starts from. For the measured
+run, the calls made through boto3 and boto are counted per operation, and
+the wall time is recorded.
+
+The measured number of calls is compared with api_calls_baseline.json next
+to this file. A scenario fails when it makes more calls than its baseline,
+so changes that add API round trips are caught. Scenarios that have no
+baseline yet are only reported.
+
+Environment variables:
+
+  AWS_API_CALLS_REPORT=<path>  write the calls, operations and wall time of
+                               every scenario to <path> as JSON
+  AWS_API_CALLS_RECORD=1       write the measured calls to the baseline file
+                               instead of comparing with it, e.g. after a
+                               change that reduces them
+
+The scenarios are skipped when moto or boto3 is not installed. moto 1.3.16
+is the last release that runs on python 2.
+"""
+
+import imp
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from ansible.module_utils import basic
+
+try:
+    import boto3
+    import botocore.client
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+try:
+    import boto.connection
+    import boto.ec2.elb
+    from boto.ec2.elb.healthcheck import HealthCheck
+    HAS_BOTO = True
+except ImportError:
+    HAS_BOTO = False
+
+try:
+    import moto
+    HAS_MOTO = True
+except ImportError:
+    HAS_MOTO = False
+
+aws_region = 'us-west-2'
+
+MODULE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'cloud', 'amazon'))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'api_calls_baseline.json')
+
+
+class ApiCallCounter(object):
+    """ Counts the API calls made through boto3 and boto, per operation """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operations = {}
+        self.patched = []
+
+    def record(self, operation):
+        self.lock.acquire()
+        try:
+            self.operations[operation] = self.operations.get(operation, 0) + 1
+        finally:
+            self.lock.release()
+
+    def reset(self):
+        self.lock.acquire()
+        try:
+            self.operations = {}
+        finally:
+            self.lock.release()
+
+    def total(self):
+        return sum(self.operations.values())
+
+    def patch(self, cls, name, operation_name):
+        original = getattr(cls, name)
+        counter = self
+
+        def counted(self, *args, **kwargs):
+            counter.record(operation_name(self, *args, **kwargs))
+            return original(self, *args, **kwargs)
+
+        setattr(cls, name, counted)
+        self.patched.append((cls, name, original))
+
+    def start(self):
+        self.patch(botocore.client.BaseClient, '_make_api_call',
+                   lambda client, operation, params: '%s:%s' % (client.meta.service_model.service_name, operation))
+        if HAS_BOTO:
+            self.patch(boto.connection.AWSQueryConnection, 'make_request',
+                       lambda connection, action, *args, **kwargs: '%s:%s' % (connection.__class__.__name__, action))
+
+    def stop(self):
+        while self.patched:
+            cls, name, original = self.patched.pop()
+            setattr(cls, name, original)
+
+
+def start_mocks(services):
+    """ Start the moto mocks of the services, for boto3 and for boto """
+    mocks = []
+    for service in services:
+        for name in ('mock_%s' % service, 'mock_%s_deprecated' % service):
+            if hasattr(moto, name):
+                mock = getattr(moto, name)()
+                mock.start()
+                mocks.append(mock)
+    return mocks
+
+
+def run_module(name, args):
+    """
+    Runs the module in this process like ansible would and returns the
+    dict it passed to exit_json or fail_json.
+    """
+    args = dict(args)
+    args.setdefault('region', aws_region)
+    basic._ANSIBLE_ARGS = json.dumps(dict(ANSIBLE_MODULE_ARGS=args)).encode('utf-8')
+
+    stdout = sys.stdout
+    sys.stdout = StringIO()
+    try:
+        try:
+            # some modules call main() when they are loaded
+            module = imp.load_source('api_calls_%s' % name, os.path.join(MODULE_DIR, '%s.py' % name))
+            module.main()
+        except SystemExit:
+            pass
+        output = sys.stdout.getvalue()
+    finally:
+        sys.stdout = stdout
+        basic._ANSIBLE_ARGS = None
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def create_subnet_and_address():
+    ec2 = boto3.client('ec2', region_name=aws_region)
+    vpc_id = ec2.create_vpc(CidrBlock='10.0.0.0/16')['Vpc']['VpcId']
+    subnet_id = ec2.create_subnet(VpcId=vpc_id, CidrBlock='10.0.0.0/24')['Subnet']['SubnetId']
+    allocation_id = ec2.allocate_address(Domain='vpc')['AllocationId']
+    return dict(subnet_id=subnet_id, allocation_id=allocation_id)
+
+
+def create_snapshots():
+    ec2 = boto3.client('ec2', region_name=aws_region)
+    for i in range(3):
+        volume_id = ec2.create_volume(Size=1, AvailabilityZone='%sa' % aws_region)['VolumeId']
+        ec2.create_snapshot(VolumeId=volume_id, Description='snapshot %d' % i)
+    return {}
+
+
+def create_vpc_with_subnets():
+    """ A VPC with an internet gateway and the subnets bench-a and bench-b """
+    ec2 = boto3.client('ec2', region_name=aws_region)
+    vpc_id = ec2.create_vpc(CidrBlock='10.0.0.0/16')['Vpc']['VpcId']
+    for i, name in enumerate(('bench-a', 'bench-b')):
+        subnet_id = ec2.create_subnet(VpcId=vpc_id, CidrBlock='10.0.%d.0/24' % i)['Subnet']['SubnetId']
+        ec2.create_tags(Resources=[subnet_id], Tags=[dict(Key='Name', Value=name)])
+    igw_id = ec2.create_internet_gateway()['InternetGateway']['InternetGatewayId']
+    ec2.attach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
+    return dict(vpc_id=vpc_id)
+
+
+def create_image():
+    ec2 = boto3.client('ec2', region_name=aws_region)
+    instance_id = ec2.run_instances(ImageId='ami-12c6146b', MinCount=1, MaxCount=1)['Instances'][0]['InstanceId']
+    return dict(source_image_id=ec2.create_image(InstanceId=instance_id, Name='bench')['ImageId'])
+
+
+def create_load_balancers():
+    """ Two load balancers, bench-one with two tags and bench-two without """
+    connection = boto.ec2.elb.connect_to_region(aws_region)
+    for name in ('bench-one', 'bench-two'):
+        load_balancer = connection.create_load_balancer(name, ['%sa' % aws_region], [(80, 8080, 'http')])
+        load_balancer.configure_health_check(HealthCheck(target='HTTP:8080/health'))
+    connection.get_status('AddTags', {
+        'LoadBalancerNames.member.1': 'bench-one',
+        'Tags.member.1.Key': 'project', 'Tags.member.1.Value': 'demo',
+        'Tags.member.2.Key': 'env', 'Tags.member.2.Value': 'prod',
+    })
+    return {}
+
+
+def verify_elb_tags(test, result):
+    tags = dict((elb['name'], elb['tags']) for elb in result['elbs'])
+    test.assertEqual(tags, {'bench-one': dict(project='demo', env='prod'), 'bench-two': {}})
+
+
+NACL_ARGS = dict(
+    name='bench-nacl',
+    subnets=['bench-a', 'bench-b'],
+    tags=dict(env='bench'),
+    ingress=[[100, 'tcp', 'allow', '0.0.0.0/0', None, None, 22, 22],
+             [200, 'tcp', 'allow', '0.0.0.0/0', None, None, 80, 80]],
+    egress=[[100, 'all', 'allow', '0.0.0.0/0', None, None, None, None]],
+)
+
+ROUTE_TABLE_ARGS = dict(
+    tags=dict(Name='bench-public'),
+    subnets=['bench-a', 'bench-b'],
+    routes=[dict(dest='0.0.0.0/0', gateway_id='igw')],
+)
+
+STREAM_ARGS = dict(name='bench-stream', shards=2, tags=dict(env='bench'), wait=True, wait_timeout=60)
+
+
+# Each scenario runs its modules in order and measures the last run. setup
+# creates resources the modules need and returns extra arguments for every
+# run. changed is the expected result of the measured run, and verify, if
+# set, checks the rest of it.
+SCENARIOS = {
+    'sqs_queue_create': dict(
+        services=['sqs'],
+        runs=[('sqs_queue', dict(name='bench-queue', default_visibility_timeout=60, message_retention_period=86400))],
+        changed=True,
+    ),
+    'sqs_queue_unchanged': dict(
+        services=['sqs'],
+        runs=[('sqs_queue', dict(name='bench-queue', default_visibility_timeout=60, message_retention_period=86400))] * 2,
+        changed=False,
+    ),
+    'sqs_queue_list': dict(
+        services=['sqs'],
+        runs=[('sqs_queue', dict(queues=['bench-one', 'bench-two', 'bench-three'], default_visibility_timeout=60))],
+        changed=True,
+    ),
+    'dynamodb_table_create': dict(
+        services=['dynamodb2'],
+        runs=[('dynamodb_table', dict(name='bench-table', hash_key_name='id', range_key_name='created',
+                                      range_key_type='NUMBER'))],
+        changed=True,
+    ),
+    'dynamodb_table_throughput': dict(
+        services=['dynamodb2'],
+        runs=[('dynamodb_table', dict(name='bench-table', hash_key_name='id')),
+              ('dynamodb_table', dict(name='bench-table', hash_key_name='id', read_capacity=5, write_capacity=5))],
+        changed=True,
+    ),
+    'dynamodb_table_list': dict(
+        services=['dynamodb2'],
+        runs=[('dynamodb_table', dict(tables=['bench-one', 'bench-two', 'bench-three'], hash_key_name='id'))],
+        changed=True,
+    ),
+    's3_bucket_create': dict(
+        services=['s3'],
+        runs=[('s3_bucket', dict(name='bench-bucket', versioning=True, tags=dict(env='bench')))],
+        changed=True,
+    ),
+    's3_bucket_unchanged': dict(
+        services=['s3'],
+        runs=[('s3_bucket', dict(name='bench-bucket', versioning=True, tags=dict(env='bench')))] * 2,
+        changed=False,
+    ),
+    'ec2_vpc_nat_gateway_create': dict(
+        services=['ec2'],
+        setup=create_subnet_and_address,
+        runs=[('ec2_vpc_nat_gateway', dict(state='present', wait=True, wait_timeout=30))],
+        changed=True,
+    ),
+    'ec2_snapshot_facts': dict(
+        services=['ec2'],
+        setup=create_snapshots,
+        runs=[('ec2_snapshot_facts', dict())],
+        changed=False,
+    ),
+    'ec2_elb_facts': dict(
+        services=['elb'],
+        setup=create_load_balancers,
+        runs=[('ec2_elb_facts', dict())],
+        changed=False,
+        verify=verify_elb_tags,
+    ),
+    'ec2_vpc_nacl_create': dict(
+        services=['ec2'],
+        setup=create_vpc_with_subnets,
+        runs=[('ec2_vpc_nacl', NACL_ARGS)],
+        changed=True,
+    ),
+    'ec2_vpc_nacl_unchanged': dict(
+        services=['ec2'],
+        setup=create_vpc_with_subnets,
+        runs=[('ec2_vpc_nacl', NACL_ARGS)] * 2,
+        changed=False,
+    ),
+    'ec2_vpc_nacl_update': dict(
+        services=['ec2'],
+        setup=create_vpc_with_subnets,
+        runs=[('ec2_vpc_nacl', NACL_ARGS),
+              ('ec2_vpc_nacl', dict(NACL_ARGS, subnets=['bench-a'],
+                                    ingress=[[100, 'tcp', 'allow', '0.0.0.0/0', None, None, 443, 443]]))],
+        changed=True,
+    ),
+    'ec2_vpc_route_table_create': dict(
+        services=['ec2'],
+        setup=create_vpc_with_subnets,
+        runs=[('ec2_vpc_route_table', ROUTE_TABLE_ARGS)],
+        changed=True,
+    ),
+    'ec2_vpc_route_table_unchanged': dict(
+        services=['ec2'],
+        setup=create_vpc_with_subnets,
+        runs=[('ec2_vpc_route_table', ROUTE_TABLE_ARGS)] * 2,
+        changed=False,
+    ),
+    'ec2_ami_copy': dict(
+        services=['ec2'],
+        setup=create_image,
+        runs=[('ec2_ami_copy', dict(source_region=aws_region, name='bench-copy',
+                                    regions=['us-east-1', 'eu-west-1'], wait=True))],
+        changed=True,
+    ),
+    'kinesis_stream_create': dict(
+        services=['kinesis'],
+        runs=[('kinesis_stream', STREAM_ARGS)],
+        changed=True,
+    ),
+    'kinesis_stream_unchanged': dict(
+        services=['kinesis'],
+        runs=[('kinesis_stream', STREAM_ARGS)] * 2,
+        changed=False,
+    ),
+}
+
+
+def load_baseline():
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    f = open(BASELINE_FILE)
+    try:
+        return json.load(f)
+    finally:
+        f.close()
+
+
+def write_json(path, data):
+    f = open(path, 'w')
+    try:
+        json.dump(data, f, indent=2, separators=(',', ': '), sort_keys=True)
+        f.write('\n')
+    finally:
+        f.close()
+
+
+@unittest.skipIf(not (HAS_MOTO and HAS_BOTO3), 'moto and boto3 are required for the API call scenarios')
+class AnsibleAwsApiCalls(unittest.TestCase):
+
+    measured = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.environ = dict(os.environ)
+        os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
+        os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
+        for name in ('AWS_SECURITY_TOKEN', 'AWS_SESSION_TOKEN', 'AWS_PROFILE', 'EC2_URL', 'S3_URL'):
+            os.environ.pop(name, None)
+        cls.baseline = load_baseline()
+
+    @classmethod
+    def tearDownClass(cls):
+        os.environ.clear()
+        os.environ.update(cls.environ)
+        if os.environ.get('AWS_API_CALLS_REPORT'):
+            write_json(os.environ['AWS_API_CALLS_REPORT'], cls.measured)
+        if os.environ.get('AWS_API_CALLS_RECORD') and cls.measured:
+            baseline = load_baseline()
+            for name, measurement in cls.measured.items():
+                baseline[name] = dict(calls=measurement['calls'], operations=measurement['operations'])
+            write_json(BASELINE_FILE, baseline)
+
+    def measure(self, name):
+        scenario = SCENARIOS[name]
+        counter = ApiCallCounter()
+        mocks = start_mocks(scenario['services'])
+        try:
+            extra = {}
+            if scenario.get('setup'):
+                extra = scenario['setup']()
+            counter.start()
+            runs = scenario['runs']
+            for module_name, args in runs[:-1]:
+                result = run_module(module_name, dict(args, **extra))
+                self.assertFalse(result.get('failed'), result.get('msg'))
+
+            module_name, args = runs[-1]
+            counter.reset()
+            start = time.time()
+            result = run_module(module_name, dict(args, **extra))
+            seconds = time.time() - start
+        finally:
+            counter.stop()
+            for mock in reversed(mocks):
+                mock.stop()
+
+        self.assertFalse(result.get('failed'), result.get('msg'))
+        self.assertEqual(result.get('changed', False), scenario['changed'])
+        if scenario.get('verify'):
+            scenario['verify'](self, result)
+        self.measured[name] = dict(calls=counter.total(), operations=counter.operations, seconds=round(seconds, 3))
+        return counter
+
+    def check(self, name):
+        counter = self.measure(name)
+        if os.environ.get('AWS_API_CALLS_RECORD') or name not in self.baseline:
+            return
+        expected = self.baseline[name]
+        if counter.total() > expected['calls']:
+            increased = dict((operation, (expected['operations'].get(operation, 0), calls))
+                             for operation, calls in counter.operations.items()
+                             if calls > expected['operations'].get(operation, 0))
+            self.fail('%s makes %d API calls instead of %d, (baseline, now) per operation: %s'
+                      % (name, counter.total(), expected['calls'], increased))
+
+    def test_sqs_queue_create(self):
+        self.check('sqs_queue_create')
+
+    def test_sqs_queue_unchanged(self):
+        self.check('sqs_queue_unchanged')
+
+    def test_sqs_queue_list(self):
+        self.check('sqs_queue_list')
+
+    def test_dynamodb_table_create(self):
+        self.check('dynamodb_table_create')
+
+    def test_dynamodb_table_throughput(self):
+        self.check('dynamodb_table_throughput')
+
+    def test_dynamodb_table_list(self):
+        self.check('dynamodb_table_list')
+
+    def test_s3_bucket_create(self):
+        self.check('s3_bucket_create')
+
+    def test_s3_bucket_unchanged(self):
+        self.check('s3_bucket_unchanged')
+
+    def test_ec2_vpc_nat_gateway_create(self):
+        self.check('ec2_vpc_nat_gateway_create')
+
+    def test_ec2_snapshot_facts(self):
+        self.check('ec2_snapshot_facts')
+
+    def test_ec2_elb_facts(self):
+        self.check('ec2_elb_facts')
+
+    def test_ec2_vpc_nacl_create(self):
+        self.check('ec2_vpc_nacl_create')
+
+    def test_ec2_vpc_nacl_unchanged(self):
+        self.check('ec2_vpc_nacl_unchanged')
+
+    def test_ec2_vpc_nacl_update(self):
+        self.check('ec2_vpc_nacl_update')
+
+    def test_ec2_vpc_route_table_create(self):
+        self.check('ec2_vpc_route_table_create')
+
+    def test_ec2_vpc_route_table_unchanged(self):
+        self.check('ec2_vpc_route_table_unchanged')
+
+    def test_ec2_ami_copy(self):
+        self.check('ec2_ami_copy')
+
+    def test_kinesis_stream_create(self):
+        self.check('kinesis_stream_create')
+
+    def test_kinesis_stream_unchanged(self):
+        self.check('kinesis_stream_unchanged')
+
+
+if __name__ == '__main__':
+    unittest.main()
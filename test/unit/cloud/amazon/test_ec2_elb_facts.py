@@ -0,0 +1,81 @@
+#!/usr/bin/python
+
+import os
+import unittest
+
+try:
+    import boto.ec2.elb
+    from boto.exception import BotoServerError
+    HAS_BOTO = True
+except ImportError:
+    HAS_BOTO = False
+
+try:
+    import moto
+    HAS_MOTO = True
+except ImportError:
+    HAS_MOTO = False
+
+import cloud.amazon.ec2_elb_facts as elb_facts
+
+aws_region = 'us-west-2'
+
+
+class FailJson(Exception):
+    pass
+
+
+class FakeModule(object):
+
+    def fail_json(self, **kwargs):
+        raise FailJson(kwargs['msg'])
+
+
+@unittest.skipIf(not (HAS_MOTO and HAS_BOTO), 'moto and boto are required for the ELB tests')
+class AnsibleEc2ElbFactsTags(unittest.TestCase):
+
+    def setUp(self):
+        self.environ = dict(os.environ)
+        os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
+        os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
+        self.mock = moto.mock_elb_deprecated()
+        self.mock.start()
+        self.connection = boto.ec2.elb.connect_to_region(aws_region)
+        for name in ('lb1', 'lb2'):
+            self.connection.create_load_balancer(name, ['%sa' % aws_region], [(80, 8080, 'http')])
+
+    def tearDown(self):
+        self.mock.stop()
+        os.environ.clear()
+        os.environ.update(self.environ)
+
+    def add_tags(self, name, tags):
+        params = {'LoadBalancerNames.member.1': name}
+        for i, key in enumerate(sorted(tags)):
+            params['Tags.member.%d.Key' % (i + 1)] = key
+            params['Tags.member.%d.Value' % (i + 1)] = tags[key]
+        self.connection.get_status('AddTags', params)
+
+    def test_get_tags(self):
+        self.add_tags('lb1', dict(project='demo', env='prod'))
+        self.add_tags('lb2', dict(owner='ops'))
+        information = elb_facts.ElbInformation(FakeModule(), None, aws_region)
+        tags = information._get_tags(['lb1', 'lb2'])
+        self.assertEqual(tags, dict(lb1=dict(project='demo', env='prod'), lb2=dict(owner='ops')))
+
+    def test_get_tags_without_tags(self):
+        information = elb_facts.ElbInformation(FakeModule(), None, aws_region)
+        self.assertEqual(information._get_tags(['lb1']), dict(lb1={}))
+
+    def test_get_tags_fails_on_error(self):
+        information = elb_facts.ElbInformation(FakeModule(), None, aws_region)
+
+        def get_list(*args, **kwargs):
+            raise BotoServerError(400, 'Bad Request', body='')
+
+        information.connection.get_list = get_list
+        self.assertRaises(FailJson, information._get_tags, ['lb1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
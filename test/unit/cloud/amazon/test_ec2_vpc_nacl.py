@@ -0,0 +1,116 @@
+#!/usr/bin/python
+
+import unittest
+
+import cloud.amazon.ec2_vpc_nacl as nacl
+
+NACL_ID = 'acl-12345678'
+DEFAULT_NACL_ID = 'acl-87654321'
+
+
+class FakeModule(object):
+
+    def __init__(self, **params):
+        self.params = dict(vpc_id='vpc-12345678', name='dmz', subnets=[], tags=None, ingress=[], egress=[])
+        self.params.update(params)
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs['msg'])
+
+
+class FakeClient(object):
+    """ Records the EC2 calls, describe_subnets answers with the subnet ids asked for """
+
+    def __init__(self):
+        self.calls = []
+
+    def describe_subnets(self, Filters):
+        return dict(Subnets=[dict(SubnetId=subnet_id) for subnet_id in Filters[0]['Values']])
+
+    def __getattr__(self, name):
+        def call(**kwargs):
+            self.calls.append((name, kwargs))
+            return {}
+        return call
+
+
+def aws_rule(number, port, egress=False):
+    return dict(RuleNumber=number, Protocol='6', RuleAction='allow', Egress=egress,
+                CidrBlock='0.0.0.0/0', PortRange=dict(From=port, To=port))
+
+
+def param_rule(number, port):
+    return [number, 'tcp', 'allow', '0.0.0.0/0', None, None, port, port]
+
+
+class AnsibleEc2VpcNaclFunctions(unittest.TestCase):
+
+    def test_rules_unchanged(self):
+        client = FakeClient()
+        changed = nacl.rules_changed([aws_rule(100, 22)], [param_rule(100, 22)], False, NACL_ID, client, FakeModule())
+        self.assertFalse(changed)
+        self.assertEqual(client.calls, [])
+
+    def test_rule_change_replaces_entry(self):
+        client = FakeClient()
+        changed = nacl.rules_changed([aws_rule(100, 22)], [param_rule(100, 80)], False, NACL_ID, client, FakeModule())
+        self.assertTrue(changed)
+        expected = aws_rule(100, 80)
+        expected['NetworkAclId'] = NACL_ID
+        self.assertEqual(client.calls, [('replace_network_acl_entry', expected)])
+
+    def test_create_before_delete(self):
+        client = FakeClient()
+        changed = nacl.rules_changed([aws_rule(100, 22, egress=True)], [param_rule(200, 22)], True, NACL_ID,
+                                     client, FakeModule())
+        self.assertTrue(changed)
+        self.assertEqual([name for name, params in client.calls],
+                         ['create_network_acl_entry', 'delete_network_acl_entry'])
+        self.assertEqual(client.calls[0][1]['RuleNumber'], 200)
+        self.assertEqual(client.calls[1][1], dict(NetworkAclId=NACL_ID, RuleNumber=100, Egress=True))
+
+    def test_removed_subnet_goes_back_to_default_nacl(self):
+        client = FakeClient()
+        snapshot = dict(
+            nacl=dict(NetworkAclId=NACL_ID, Associations=[
+                dict(SubnetId='subnet-aaaaaaaa', NetworkAclAssociationId='aclassoc-aaaaaaaa'),
+                dict(SubnetId='subnet-bbbbbbbb', NetworkAclAssociationId='aclassoc-bbbbbbbb'),
+            ]),
+            default_nacl_id=DEFAULT_NACL_ID,
+            associations={
+                'subnet-aaaaaaaa': 'aclassoc-aaaaaaaa',
+                'subnet-bbbbbbbb': 'aclassoc-bbbbbbbb',
+                'subnet-cccccccc': 'aclassoc-cccccccc',
+            },
+        )
+        module = FakeModule(subnets=['subnet-aaaaaaaa', 'subnet-cccccccc'])
+        self.assertTrue(nacl.subnets_changed(snapshot, client, module))
+        self.assertEqual(client.calls, [
+            ('replace_network_acl_association', dict(NetworkAclId=NACL_ID, AssociationId='aclassoc-cccccccc')),
+            ('replace_network_acl_association', dict(NetworkAclId=DEFAULT_NACL_ID, AssociationId='aclassoc-bbbbbbbb')),
+        ])
+
+    def test_describe_vpc_nacls(self):
+        class DescribeClient(FakeClient):
+            def describe_network_acls(self, Filters):
+                self.calls.append(('describe_network_acls', Filters))
+                return dict(NetworkAcls=[
+                    dict(NetworkAclId=DEFAULT_NACL_ID, IsDefault=True, Tags=[], Associations=[
+                        dict(SubnetId='subnet-aaaaaaaa', NetworkAclAssociationId='aclassoc-aaaaaaaa')]),
+                    dict(NetworkAclId=NACL_ID, IsDefault=False, Tags=[dict(Key='Name', Value='dmz')], Associations=[
+                        dict(SubnetId='subnet-bbbbbbbb', NetworkAclAssociationId='aclassoc-bbbbbbbb')]),
+                ])
+
+        client = DescribeClient()
+        snapshot = nacl.describe_vpc_nacls(client, FakeModule())
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(snapshot['nacl']['NetworkAclId'], NACL_ID)
+        self.assertEqual(snapshot['default_nacl_id'], DEFAULT_NACL_ID)
+        self.assertEqual(snapshot['associations'], {
+            'subnet-aaaaaaaa': 'aclassoc-aaaaaaaa',
+            'subnet-bbbbbbbb': 'aclassoc-bbbbbbbb',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@
 import boto3
 import unittest
 
+from botocore.stub import Stubber
+
 from collections import namedtuple
 from ansible.parsing.dataloader import DataLoader
 from ansible.vars import VariableManager
@@ -310,6 +312,65 @@ class AnsibleEc2VpcNatGatewayFunctions(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(stream, [])
 
+    def test_get_nat_gateways_paginates(self):
+        client = boto3.client('ec2', region_name=aws_region)
+        stubber = Stubber(client)
+        gateway = ng.DRY_RUN_GATEWAY_UNCONVERTED[0]
+        second_gateway = dict(gateway, NatGatewayId='nat-234567891')
+        params = {
+            'Filter': [
+                {'Name': 'subnet-id', 'Values': ['subnet-123456789']},
+                {'Name': 'state', 'Values': ['available', 'pending']}
+            ]
+        }
+        stubber.add_response(
+            'describe_nat_gateways',
+            {'NatGateways': [gateway], 'NextToken': 'page-2'}, params
+        )
+        stubber.add_response(
+            'describe_nat_gateways',
+            {'NatGateways': [second_gateway]},
+            dict(params, NextToken='page-2')
+        )
+        with stubber:
+            success, err_msg, gws = (
+                ng.get_nat_gateways(client, 'subnet-123456789')
+            )
+        self.assertTrue(success)
+        self.assertEqual(
+            [gw['nat_gateway_id'] for gw in gws],
+            ['nat-123456789', 'nat-234567891']
+        )
+
+    def test_wait_for_gateways(self):
+        client = boto3.client('ec2', region_name=aws_region)
+        success, err_msg, gws = (
+            ng.wait_for_gateways(
+                client, 5, ['nat-123456789'], 'available', check_mode=True
+            )
+        )
+        self.assertTrue(success)
+        self.assertEqual(gws, {'nat-123456789': ng.DRY_RUN_GATEWAYS[0]})
+
+    def test_wait_for_gateways_to_timeout(self):
+        client = boto3.client('ec2', region_name=aws_region)
+        success, err_msg, gws = (
+            ng.wait_for_gateways(
+                client, 2, ['nat-123456789', 'nat-12345678'], 'available',
+                check_mode=True
+            )
+        )
+        self.assertFalse(success)
+        self.assertEqual(
+            err_msg, 'Wait time out reached, while waiting for results'
+        )
+
+    def test_backoff_delay(self):
+        for attempt in range(10):
+            delay = ng.backoff_delay(attempt, 1, ng.MAX_POLL_DELAY)
+            self.assertTrue(delay <= ng.MAX_POLL_DELAY)
+            self.assertTrue(delay >= min(ng.MAX_POLL_DELAY, 2 ** attempt) / 2.0)
+
     def test_wait_for_status(self):
         client = boto3.client('ec2', region_name=aws_region)
         success, err_msg, gws = (
@@ -409,6 +470,34 @@ class AnsibleEc2VpcNatGatewayFunctions(unittest.TestCase):
         self.assertTrue(success)
         self.assertTrue(changed)
 
+    def test_create_in_subnets(self):
+        client = boto3.client('ec2', region_name=aws_region)
+        success, changed, err_msg, results = (
+            ng.create_in_subnets(
+                client, ['subnet-123456789', 'subnet-1', 'subnet-2'],
+                check_mode=True
+            )
+        )
+        self.assertTrue(success)
+        self.assertTrue(changed)
+        self.assertEqual(
+            [gw['subnet_id'] for gw in results],
+            ['subnet-123456789', 'subnet-1', 'subnet-2']
+        )
+        self.assertEqual(results[0], ng.DRY_RUN_GATEWAYS[0])
+
+    def test_create_in_subnets_idempotent(self):
+        client = boto3.client('ec2', region_name=aws_region)
+        success, changed, err_msg, results = (
+            ng.create_in_subnets(
+                client, ['subnet-123456789'], wait=True, wait_timeout=5,
+                check_mode=True
+            )
+        )
+        self.assertTrue(success)
+        self.assertFalse(changed)
+        self.assertEqual(results, ng.DRY_RUN_GATEWAYS)
+
     def test_pre_create(self):
         client = boto3.client('ec2', region_name=aws_region)
         success, changed, err_msg, results = (
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+
+import unittest
+
+import cloud.amazon.ec2_vpc_route_table as rt
+
+ROUTE_TABLE_ID = 'rtb-12345678'
+OTHER_ROUTE_TABLE_ID = 'rtb-87654321'
+
+
+class Fake(object):
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+def route(destination_cidr_block, gateway_id=None, instance_id=None):
+    return Fake(destination_cidr_block=destination_cidr_block, gateway_id=gateway_id, instance_id=instance_id,
+                interface_id=None, vpc_peering_connection_id=None)
+
+
+class FakeConnection(object):
+    """ Records the VPC calls, the describe calls answer from route_tables and subnets """
+
+    def __init__(self, route_tables=(), subnets=()):
+        self.route_tables = route_tables
+        self.subnets = subnets
+        self.calls = []
+
+    def get_all_route_tables(self, filters=None):
+        self.calls.append(('get_all_route_tables', filters))
+        return self.route_tables
+
+    def get_all_subnets(self, filters=None):
+        self.calls.append(('get_all_subnets', filters))
+        return self.subnets
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return 'rtbassoc-new'
+        return call
+
+
+class AnsibleEc2VpcRouteTableFunctions(unittest.TestCase):
+
+    def test_get_vpc_snapshot(self):
+        association = Fake(id='rtbassoc-1', subnet_id='subnet-1', route_table_id=ROUTE_TABLE_ID)
+        main_association = Fake(id='rtbassoc-main', subnet_id=None, route_table_id=OTHER_ROUTE_TABLE_ID)
+        connection = FakeConnection(
+            route_tables=[Fake(id=ROUTE_TABLE_ID, associations=[association]),
+                          Fake(id=OTHER_ROUTE_TABLE_ID, associations=[main_association])],
+            subnets=[Fake(id='subnet-1', cidr_block='10.0.1.0/24', tags={'Name': 'app'}),
+                     Fake(id='subnet-2', cidr_block='10.0.2.0/24', tags={})])
+        snapshot = rt.get_vpc_snapshot(connection, 'vpc-12345678', include_subnets=True)
+        self.assertEqual(len(connection.calls), 2)
+        self.assertEqual(snapshot['associations'], {'subnet-1': association})
+        self.assertEqual(sorted(snapshot['route_tables']), [ROUTE_TABLE_ID, OTHER_ROUTE_TABLE_ID])
+        subnets = rt.find_subnets(snapshot, ['subnet-2', 'app', '10.0.1.0/24'])
+        self.assertEqual([subnet.id for subnet in subnets], ['subnet-2', 'subnet-1', 'subnet-1'])
+
+    def test_ensure_routes(self):
+        route_table = Fake(id=ROUTE_TABLE_ID, routes=[
+            route('10.0.0.0/16', gateway_id='local'),
+            route('0.0.0.0/0', gateway_id='igw-1'),
+            route('10.1.0.0/16', instance_id='i-1'),
+            route('10.2.0.0/16', instance_id='i-2'),
+        ])
+        connection = FakeConnection()
+        result = rt.ensure_routes(connection, route_table, [
+            dict(destination_cidr_block='0.0.0.0/0', gateway_id='igw-2'),
+            dict(destination_cidr_block='10.1.0.0/16', instance_id='i-1'),
+            dict(destination_cidr_block='10.3.0.0/16', instance_id='i-3'),
+        ], [], False)
+        self.assertTrue(result['changed'])
+        self.assertEqual(connection.calls, [
+            ('delete_route', (ROUTE_TABLE_ID, '10.2.0.0/16'), dict(dry_run=False)),
+            ('replace_route', (ROUTE_TABLE_ID,),
+             dict(dry_run=False, destination_cidr_block='0.0.0.0/0', gateway_id='igw-2')),
+            ('create_route', (ROUTE_TABLE_ID,),
+             dict(dry_run=False, destination_cidr_block='10.3.0.0/16', instance_id='i-3')),
+        ])
+
+    def test_ensure_routes_skips_routes_without_cidr(self):
+        route_table = Fake(id=ROUTE_TABLE_ID, routes=[
+            route('10.0.0.0/16', gateway_id='local'),
+            route(None, gateway_id='vpce-1'),
+            route(None, gateway_id='igw-1'),
+        ])
+        connection = FakeConnection()
+        result = rt.ensure_routes(connection, route_table, [], [], False)
+        self.assertFalse(result['changed'])
+        self.assertEqual(connection.calls, [])
+
+    def test_ensure_subnet_association(self):
+        snapshot = dict(associations={
+            'subnet-1': Fake(id='rtbassoc-1', route_table_id=ROUTE_TABLE_ID),
+            'subnet-2': Fake(id='rtbassoc-2', route_table_id=OTHER_ROUTE_TABLE_ID),
+        })
+        connection = FakeConnection()
+        result = rt.ensure_subnet_association(connection, snapshot, ROUTE_TABLE_ID, 'subnet-1', False)
+        self.assertEqual(result, {'changed': False, 'association_id': 'rtbassoc-1'})
+        self.assertEqual(connection.calls, [])
+
+        result = rt.ensure_subnet_association(connection, snapshot, ROUTE_TABLE_ID, 'subnet-2', False)
+        self.assertEqual(result, {'changed': True, 'association_id': 'rtbassoc-new'})
+        self.assertEqual(connection.calls, [
+            ('replace_route_table_association_with_assoc', ('rtbassoc-2', ROUTE_TABLE_ID), {})])
+
+        connection = FakeConnection()
+        result = rt.ensure_subnet_association(connection, snapshot, ROUTE_TABLE_ID, 'subnet-3', False)
+        self.assertEqual(result, {'changed': True, 'association_id': 'rtbassoc-new'})
+        self.assertEqual(connection.calls, [('associate_route_table', (ROUTE_TABLE_ID, 'subnet-3'), {})])
+
+    def test_ensure_subnet_association_check_mode(self):
+        snapshot = dict(associations={'subnet-2': Fake(id='rtbassoc-2', route_table_id=OTHER_ROUTE_TABLE_ID)})
+        connection = FakeConnection()
+        result = rt.ensure_subnet_association(connection, snapshot, ROUTE_TABLE_ID, 'subnet-2', True)
+        self.assertEqual(result, {'changed': True})
+        self.assertEqual(connection.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,8 @@
 import boto3
 import unittest
 
+from botocore.stub import Stubber
+
 import cloud.amazon.kinesis_stream as kinesis_stream
 
 aws_region = 'us-west-2'
@@ -106,6 +108,81 @@ class AnsibleKinesisStreamFunctions(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(stream, should_return)
 
+    def test_find_stream_paginates_shards(self):
+        client = boto3.client(
+            'kinesis', region_name=aws_region,
+            aws_access_key_id='test', aws_secret_access_key='test'
+        )
+        description = {
+            'StreamName': 'test',
+            'StreamARN': 'arn:aws:kinesis:east-side:123456789:stream/test',
+            'StreamStatus': 'ACTIVE',
+            'RetentionPeriodHours': 24,
+            'StreamCreationTimestamp': 0,
+            'EnhancedMonitoring': [],
+        }
+
+        def shard(shard_id):
+            return {
+                'ShardId': shard_id,
+                'HashKeyRange': {'StartingHashKey': '0', 'EndingHashKey': '1'},
+                'SequenceNumberRange': {'StartingSequenceNumber': '0'},
+            }
+
+        stubber = Stubber(client)
+        stubber.add_response(
+            'describe_stream',
+            {'StreamDescription': dict(description, HasMoreShards=True, Shards=[shard('shardId-0'), shard('shardId-1')])},
+            {'StreamName': 'test'}
+        )
+        stubber.add_response(
+            'describe_stream',
+            {'StreamDescription': dict(description, HasMoreShards=False, Shards=[shard('shardId-2')])},
+            {'StreamName': 'test', 'ExclusiveStartShardId': 'shardId-1'}
+        )
+        stubber.activate()
+        success, err_msg, stream = (
+            kinesis_stream.find_stream(client, 'test')
+        )
+        self.assertTrue(success)
+        self.assertEqual(stream['ShardsCount'], 3)
+        self.assertEqual(
+            [s['ShardId'] for s in stream['Shards']],
+            ['shardId-0', 'shardId-1', 'shardId-2']
+        )
+        stubber.assert_no_pending_responses()
+
+    def test_find_stream_summary(self):
+        client = boto3.client(
+            'kinesis', region_name=aws_region,
+            aws_access_key_id='test', aws_secret_access_key='test'
+        )
+        if not hasattr(client, 'describe_stream_summary'):
+            return
+        stubber = Stubber(client)
+        stubber.add_response(
+            'describe_stream_summary',
+            {
+                'StreamDescriptionSummary': {
+                    'StreamName': 'test',
+                    'StreamARN': 'arn:aws:kinesis:east-side:123456789:stream/test',
+                    'StreamStatus': 'ACTIVE',
+                    'RetentionPeriodHours': 24,
+                    'StreamCreationTimestamp': 0,
+                    'EnhancedMonitoring': [],
+                    'OpenShardCount': 250,
+                }
+            },
+            {'StreamName': 'test'}
+        )
+        stubber.activate()
+        success, err_msg, stream = (
+            kinesis_stream.find_stream(client, 'test', summary=True)
+        )
+        self.assertTrue(success)
+        self.assertEqual(stream['ShardsCount'], 250)
+        self.assertFalse('Shards' in stream)
+
     def test_wait_for_status(self):
         client = boto3.client('kinesis', region_name=aws_region)
         success, err_msg, stream = (
@@ -123,6 +200,76 @@ class AnsibleKinesisStreamFunctions(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(stream, should_return)
 
+    def test_backoff_delay(self):
+        for attempt in range(1, 10):
+            delay = kinesis_stream.backoff_delay(attempt, 1, kinesis_stream.MAX_POLL_DELAY)
+            self.assertTrue(delay <= 15)
+            self.assertTrue(delay >= min(15, 2 ** attempt) / 2.0)
+
+    def test_wait_for_status_retries_throttling(self):
+        client = boto3.client(
+            'kinesis', region_name=aws_region,
+            aws_access_key_id='test', aws_secret_access_key='test'
+        )
+        description = {
+            'StreamName': 'test',
+            'StreamARN': 'arn:aws:kinesis:east-side:123456789:stream/test',
+            'StreamStatus': 'CREATING',
+            'Shards': [],
+            'HasMoreShards': False,
+            'RetentionPeriodHours': 24,
+            'StreamCreationTimestamp': 0,
+            'EnhancedMonitoring': [],
+        }
+        stubber = Stubber(client)
+        stubber.add_response('describe_stream', {'StreamDescription': description})
+        stubber.add_client_error('describe_stream', 'LimitExceededException')
+        active = dict(description, StreamStatus='ACTIVE')
+        stubber.add_response('describe_stream', {'StreamDescription': active})
+        if hasattr(client, 'describe_stream_summary'):
+            summary = dict(active, OpenShardCount=0)
+            for key in ('Shards', 'HasMoreShards'):
+                summary.pop(key)
+            stubber.add_response(
+                'describe_stream_summary',
+                {'StreamDescriptionSummary': summary}
+            )
+        else:
+            stubber.add_response('describe_stream', {'StreamDescription': active})
+        stubber.activate()
+        waiter_delay = kinesis_stream.WAITER_DELAY
+        kinesis_stream.WAITER_DELAY = 1
+        wait_stats = dict()
+        try:
+            success, err_msg, stream = (
+                kinesis_stream.wait_for_status(
+                    client, 'test', 'ACTIVE', 10, wait_stats=wait_stats
+                )
+            )
+        finally:
+            kinesis_stream.WAITER_DELAY = waiter_delay
+        self.assertTrue(success)
+        self.assertEqual(stream['StreamStatus'], 'ACTIVE')
+        self.assertEqual(wait_stats['polls'], 3)
+        self.assertTrue(wait_stats['elapsed'] < 10)
+
+    def test_wait_for_status_deleted(self):
+        client = boto3.client(
+            'kinesis', region_name=aws_region,
+            aws_access_key_id='test', aws_secret_access_key='test'
+        )
+        stubber = Stubber(client)
+        stubber.add_client_error('describe_stream', 'ResourceNotFoundException')
+        stubber.activate()
+        wait_stats = dict()
+        success, err_msg, stream = (
+            kinesis_stream.wait_for_status(
+                client, 'test', 'DELETING', 10, wait_stats=wait_stats
+            )
+        )
+        self.assertTrue(success)
+        self.assertEqual(wait_stats['polls'], 1)
+
     def test_tags_action_create(self):
         client = boto3.client('kinesis', region_name=aws_region)
         tags = {
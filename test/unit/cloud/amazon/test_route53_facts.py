@@ -0,0 +1,69 @@
+#!/usr/bin/python
+
+import unittest
+
+import cloud.amazon.route53_facts as route53_facts
+
+
+class FakeModule(object):
+
+    def __init__(self, **params):
+        self.params = dict(max_items=None, type=None, record_name=None)
+        self.params.update(params)
+
+
+class FakePaginator(object):
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.read = 0
+
+    def paginate(self, **params):
+        for page in self.pages:
+            self.read += 1
+            yield page
+
+
+class FakeClient(object):
+
+    def __init__(self, pages):
+        self.paginator = FakePaginator(pages)
+
+    def get_paginator(self, operation):
+        return self.paginator
+
+
+def record_set(name, record_type='A'):
+    return dict(Name=name, Type=record_type, TTL=300, ResourceRecords=[dict(Value='192.0.2.1')])
+
+
+class AnsibleRoute53FactsFunctions(unittest.TestCase):
+
+    pages = [
+        dict(ResourceRecordSets=[record_set('a.example.com.'), record_set('www.example.com.')]),
+        dict(ResourceRecordSets=[record_set('b.example.com.'), record_set('api.example.com.')]),
+        dict(ResourceRecordSets=[record_set('c.example.com.'), record_set('mail.example.com.')]),
+    ]
+
+    def test_max_items_applies_after_filter(self):
+        client = FakeClient(self.pages)
+        module = FakeModule(max_items='2', record_name='?.example.com')
+        results = route53_facts.paginate(client, module, 'list_resource_record_sets', 'ResourceRecordSets', {},
+                                         keep=route53_facts.record_set_filter(module))
+        self.assertEqual([item['Name'] for item in results['ResourceRecordSets']],
+                         ['a.example.com.', 'b.example.com.'])
+        self.assertEqual(results['PageCount'], 2)
+        self.assertEqual(client.paginator.read, 2)
+
+    def test_reads_every_page_without_max_items(self):
+        client = FakeClient(self.pages)
+        module = FakeModule(type='A')
+        results = route53_facts.paginate(client, module, 'list_resource_record_sets', 'ResourceRecordSets', {},
+                                         keep=route53_facts.record_set_filter(module),
+                                         transform=route53_facts.compact_record_set)
+        self.assertEqual(len(results['ResourceRecordSets']), 6)
+        self.assertEqual(results['PageCount'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
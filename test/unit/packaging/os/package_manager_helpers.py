@@ -0,0 +1,63 @@
+"""
+Helpers shared by the tests of the packaging/os modules.
+"""
+
+import os
+import imp
+
+MODULE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'packaging', 'os'))
+
+
+def load_module(name):
+    """
+    Load packaging/os/<name>.py straight from its file. The repository's
+    top-level 'packaging' directory shadows the PyPI package of the same
+    name, and some module names (pkgutil, portage) are taken by other
+    packages, so the module is loaded under a name of its own.
+    """
+    return imp.load_source('packaging_os_%s' % name, os.path.join(MODULE_DIR, '%s.py' % name))
+
+
+class FakeModule(object):
+    """
+    Stands in for AnsibleModule. run_command answers from outputs, a list of
+    (prefix, out) or (prefix, rc, out) items: the first item whose prefix
+    starts the command is used, and when out is a list, every call takes
+    the next element of it. Commands that match no prefix get unmatched_rc
+    and no output. exit_json and fail_json store their arguments in result.
+    """
+
+    def __init__(self, outputs=None, check_mode=False, params=None, bin_dir='/usr/bin', unmatched_rc=0):
+        self.outputs = outputs or []
+        self.check_mode = check_mode
+        self.params = params or {}
+        self.bin_dir = bin_dir
+        self.unmatched_rc = unmatched_rc
+        self.commands = []
+        self.result = None
+
+    def get_bin_path(self, name, required=False, opt_dirs=[]):
+        return os.path.join(self.bin_dir, name)
+
+    def run_command(self, cmd, **kwargs):
+        self.commands.append(cmd)
+        for output in self.outputs:
+            if len(output) == 2:
+                prefix, out = output
+                rc = 0
+            else:
+                prefix, rc, out = output
+            if cmd[:len(prefix)] == prefix:
+                if isinstance(out, list):
+                    out = out.pop(0)
+                return rc, out, ''
+        return self.unmatched_rc, '', ''
+
+    def exit_json(self, **kwargs):
+        self.result = kwargs
+        raise SystemExit(0)
+
+    def fail_json(self, **kwargs):
+        kwargs['failed'] = True
+        self.result = kwargs
+        raise SystemExit(1)
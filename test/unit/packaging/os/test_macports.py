@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+macports = load_module('macports')
+
+PORT_INSTALLED = """\
+The following ports are currently installed:
+  curl @7.50.3_0+ssl
+  curl @7.51.0_0+ssl (active)
+  curl-ca-bundle @7.51.0_0 (active)
+  git @2.10.2_0+credential_osxkeychain+doc+pcre+perl5_22 (active)
+  zlib @1.2.8_0
+"""
+
+class AnsibleMacportsFunctions(unittest.TestCase):
+
+    def test_parse_port_installed(self):
+        ports = macports.parse_port_installed(PORT_INSTALLED)
+        self.assertEqual(sorted(ports.keys()), ['curl', 'curl-ca-bundle', 'git', 'zlib'])
+        self.assertEqual(ports['curl'], [('7.50.3_0+ssl', False), ('7.51.0_0+ssl', True)])
+        self.assertEqual(ports['zlib'], [('1.2.8_0', False)])
+
+    def test_parse_port_installed_none(self):
+        self.assertEqual(macports.parse_port_installed('No ports are installed.\n'), {})
+
+    def test_is_active(self):
+        ports = macports.parse_port_installed(PORT_INSTALLED)
+        self.assertTrue(macports.is_active(ports['curl']))
+        self.assertFalse(macports.is_active(ports['zlib']))
+
+    def test_install_packages_single_command(self):
+        installed_after = PORT_INSTALLED + '  wget @1.18_0 (active)\n  vim @8.0.0_0 (active)\n'
+        module = FakeModule([('port installed', [PORT_INSTALLED, installed_after])])
+        self.assertRaises(SystemExit, macports.install_packages, module, 'port', ['git', 'wget', 'vim'])
+        self.assertTrue(module.result['changed'])
+        self.assertEqual(module.commands, ['port installed', 'port install wget vim', 'port installed'])
+
+    def test_activate_packages_only_inactive(self):
+        module = FakeModule([('port installed', [PORT_INSTALLED, PORT_INSTALLED.replace('zlib @1.2.8_0', 'zlib @1.2.8_0 (active)')])])
+        self.assertRaises(SystemExit, macports.activate_packages, module, 'port', ['curl', 'zlib'])
+        self.assertTrue(module.result['changed'])
+        self.assertEqual(module.commands[1], 'port activate zlib')
+
+    def test_activate_packages_not_present(self):
+        module = FakeModule([('port installed', PORT_INSTALLED)])
+        self.assertRaises(SystemExit, macports.activate_packages, module, 'port', ['vim'])
+        self.assertTrue(module.result['failed'])
+        self.assertEqual(len(module.commands), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+opkg = load_module('opkg')
+
+OPKG_LIST_INSTALLED = """\
+base-files - 167-r49389
+busybox - 1.24.2-1
+dropbear - 2015.71-2
+libc - 1.1.14-1
+"""
+
+OPKG_LIST = """\
+base-files - 167-r49389 - This package contains a base filesystem and system scripts for OpenWrt.
+busybox - 1.24.2-1 - The Swiss Army Knife of embedded Linux.
+ It slices, it dices, it makes Julian Fries.
+dropbear - 2015.71-2 - A small SSH2 server/client designed for small memory environments.
+libc - 1.1.14-1 - C Standard Library
+tcpdump - 4.5.1-4 - Network monitoring and data acquisition tool
+vim - 7.4-3 - Vim is an almost compatible version of the UNIX editor Vi.
+"""
+
+class AnsibleOpkgFunctions(unittest.TestCase):
+
+    def test_parse_list_installed(self):
+        packages = opkg.parse_opkg_list(OPKG_LIST_INSTALLED)
+        self.assertEqual(packages, {
+            'base-files': '167-r49389',
+            'busybox': '1.24.2-1',
+            'dropbear': '2015.71-2',
+            'libc': '1.1.14-1',
+        })
+
+    def test_parse_list_skips_description_continuation(self):
+        packages = opkg.parse_opkg_list(OPKG_LIST)
+        self.assertEqual(len(packages), 6)
+        self.assertEqual(packages['vim'], '7.4-3')
+
+    def test_install_packages_single_command(self):
+        module = FakeModule([
+            ('opkg list-installed', [OPKG_LIST_INSTALLED, OPKG_LIST]),
+            ('opkg list', OPKG_LIST),
+        ], params=dict(force=''))
+        self.assertRaises(SystemExit, opkg.install_packages, module, 'opkg', ['busybox', 'tcpdump', 'vim'])
+        self.assertTrue(module.result['changed'])
+        self.assertEqual(module.commands, [
+            'opkg list-installed', 'opkg list', 'opkg install  tcpdump vim', 'opkg list-installed'])
+
+    def test_install_packages_unknown(self):
+        module = FakeModule([
+            ('opkg list-installed', OPKG_LIST_INSTALLED),
+            ('opkg list', OPKG_LIST),
+        ], params=dict(force=''))
+        self.assertRaises(SystemExit, opkg.install_packages, module, 'opkg', ['vim', 'nosuchpackage'])
+        self.assertTrue(module.result['failed'])
+        self.assertEqual(module.commands, ['opkg list-installed', 'opkg list'])
+
+    def test_remove_packages_single_command(self):
+        module = FakeModule([
+            ('opkg list-installed', [OPKG_LIST_INSTALLED, 'libc - 1.1.14-1\n']),
+        ], params=dict(force=''))
+        self.assertRaises(SystemExit, opkg.remove_packages, module, 'opkg', ['busybox', 'dropbear', 'vim'])
+        self.assertTrue(module.result['changed'])
+        self.assertEqual(module.commands[1], 'opkg remove  busybox dropbear')
+
+
+if __name__ == '__main__':
+    unittest.main()
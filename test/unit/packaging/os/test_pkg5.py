@@ -0,0 +1,56 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+pkg5 = load_module('pkg5')
+
+PKG_LIST = """\
+developer/versioning/git                          2.7.4-0.151018             i--
+library/security/openssl (omnios)                 1.0.2.8-0.151018           i--
+pkg:/web/server/nginx                             1.10.1-0.151018            i--
+"""
+
+PKG_LIST_UPDATES = """\
+library/security/openssl (omnios)                 1.0.2.8-0.151018           i--
+"""
+
+class AnsiblePkg5Functions(unittest.TestCase):
+
+    def test_parse_pkg_list(self):
+        packages = pkg5.parse_pkg_list(PKG_LIST)
+        self.assertEqual(packages, {
+            'developer/versioning/git': '2.7.4-0.151018',
+            'library/security/openssl': '1.0.2.8-0.151018',
+            'web/server/nginx': '1.10.1-0.151018',
+        })
+
+    def test_package_matches(self):
+        self.assertTrue(pkg5.package_matches('nginx', 'web/server/nginx'))
+        self.assertTrue(pkg5.package_matches('server/nginx', 'web/server/nginx'))
+        self.assertTrue(pkg5.package_matches('pkg:/web/server/nginx', 'web/server/nginx'))
+        self.assertFalse(pkg5.package_matches('ginx', 'web/server/nginx'))
+
+    def test_installed_packages_single_query(self):
+        module = FakeModule([(['pkg', 'list', '-H', '--'], PKG_LIST)], unmatched_rc=1)
+        installed = pkg5.installed_packages(module, ['git', 'openssl', 'vim', 'nginx'])
+        self.assertEqual(installed, ['git', 'openssl', 'nginx'])
+        self.assertEqual(len(module.commands), 1)
+
+    def test_installed_packages_versioned_fmri(self):
+        module = FakeModule([(['pkg', 'list', '-H', '--'], PKG_LIST)], unmatched_rc=1)
+        installed = pkg5.installed_packages(module, ['git', 'vim@8.0'])
+        self.assertEqual(installed, ['git'])
+        self.assertEqual(module.commands[0], ['pkg', 'list', '--', 'vim@8.0'])
+        self.assertEqual(len(module.commands), 2)
+
+    def test_outdated_packages(self):
+        module = FakeModule([(['pkg', 'list', '-H', '-u', '--'], PKG_LIST_UPDATES)], unmatched_rc=1)
+        outdated = pkg5.outdated_packages(module, ['git', 'openssl'])
+        self.assertEqual(outdated, ['openssl'])
+        self.assertEqual(len(module.commands), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+pkgin = load_module('pkgin')
+
+PKGIN_LIST = """\
+gcc47-libs-4.7.2nb4;The GNU Compiler Collection (GCC) support shared libraries
+emacs24-nox11-24.5nb2;GNU editing macros (no X11)
+py27-setuptools-20.10.1;New Python packaging system
+pkgin-0.9.4nb3;Apt / yum like tool for managing pkgsrc binary packages
+"""
+
+PKGIN_LIST_PLAIN = """\
+gcc47-libs-4.7.2nb4  The GNU Compiler Collection (GCC) support shared libraries
+zsh-5.2nb1           The Z shell
+"""
+
+class AnsiblePkginFunctions(unittest.TestCase):
+
+    def setUp(self):
+        pkgin.PKGIN_PATH = '/opt/local/bin/pkgin'
+        pkgin.PKGIN_PFLAG = ('-p', ';')
+
+    def test_parse_pkgin_list(self):
+        packages = pkgin.parse_pkgin_list(PKGIN_LIST)
+        self.assertEqual(packages, {
+            'gcc47-libs': '4.7.2nb4',
+            'emacs24-nox11': '24.5nb2',
+            'py27-setuptools': '20.10.1',
+            'pkgin': '0.9.4nb3',
+        })
+
+    def test_parse_pkgin_list_without_parsable_flag(self):
+        packages = pkgin.parse_pkgin_list(PKGIN_LIST_PLAIN, ' ')
+        self.assertEqual(sorted(packages.keys()), ['gcc47-libs', 'zsh'])
+        self.assertEqual(packages['zsh'], '5.2nb1')
+
+    def test_parse_pkgin_list_empty(self):
+        self.assertEqual(pkgin.parse_pkgin_list(''), {})
+
+    def test_install_packages_single_command(self):
+        installed_after = PKGIN_LIST + 'zsh-5.2nb1;The Z shell\nvim-7.4nb1;Vim\n'
+        module = FakeModule([
+            ('/opt/local/bin/pkgin -p list', [PKGIN_LIST, installed_after]),
+            ('/opt/local/bin/pkgin -p avail', installed_after),
+        ], params=dict(force=False))
+        self.assertRaises(SystemExit, pkgin.install_packages, module, ['gcc47-libs', 'zsh', 'vim'])
+        self.assertTrue(module.result['changed'])
+        installs = [cmd for cmd in module.commands if ' install ' in cmd]
+        self.assertEqual(len(installs), 1)
+        self.assertTrue(installs[0].endswith('install zsh vim'))
+        self.assertEqual(len(module.commands), 4)
+
+    def test_install_packages_unknown(self):
+        module = FakeModule([
+            ('/opt/local/bin/pkgin -p list', PKGIN_LIST),
+            ('/opt/local/bin/pkgin -p avail', PKGIN_LIST),
+        ], params=dict(force=False))
+        self.assertRaises(SystemExit, pkgin.install_packages, module, ['nosuchpackage'])
+        self.assertTrue(module.result['failed'])
+        self.assertFalse([cmd for cmd in module.commands if ' install ' in cmd])
+
+    def test_remove_packages_already_absent(self):
+        module = FakeModule([('/opt/local/bin/pkgin -p list', PKGIN_LIST)], params=dict(force=False))
+        self.assertRaises(SystemExit, pkgin.remove_packages, module, ['zsh', 'vim'])
+        self.assertFalse(module.result['changed'])
+        self.assertEqual(len(module.commands), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+pkgng = load_module('pkgng')
+
+PKG = '/usr/local/sbin/pkg'
+
+INSTALLED = """\
+nginx 1.10.1_1,2
+zsh 5.2
+"""
+
+class AnsiblePkgngFunctions(unittest.TestCase):
+
+    def test_annotate_package_by_origin(self):
+        module = FakeModule([
+            ("%s  query -a '%%n %%v'" % PKG, 0, INSTALLED),
+            ("%s  query -a '%%n %%At %%Av'" % PKG, 0, ''),
+            ("%s  query -g '%%n' www/nginx" % PKG, 0, 'nginx\n'),
+        ])
+        changed, msg = pkgng.annotate_packages(module, PKG, ['www/nginx'], '+held=yes', '')
+        self.assertTrue(changed)
+        self.assertEqual(module.commands[-1], '%s  annotate -y -A nginx held "yes"' % PKG)
+
+    def test_annotate_origin_not_installed(self):
+        module = FakeModule([
+            ("%s  query -a '%%n %%v'" % PKG, 0, INSTALLED),
+            ("%s  query -a '%%n %%At %%Av'" % PKG, 0, ''),
+            ("%s  query -g '%%n' www/apache24" % PKG, 1, ''),
+        ])
+        self.assertRaises(SystemExit, pkgng.annotate_packages, module, PKG, ['www/apache24'], '+held=yes', '')
+        self.assertEqual(module.result['msg'], 'could not annotate www/apache24: package is not installed')
+
+    def test_annotate_groups_packages_per_tag(self):
+        module = FakeModule([
+            ("%s  query -a '%%n %%v'" % PKG, 0, INSTALLED),
+            ("%s  query -a '%%n %%At %%Av'" % PKG, 0, 'zsh held yes\n'),
+        ])
+        changed, msg = pkgng.annotate_packages(module, PKG, ['*'], '+held=yes,-old', '')
+        self.assertTrue(changed)
+        self.assertEqual(module.commands[2:], ['%s  annotate -y -A nginx held "yes"' % PKG])
+
+
+if __name__ == '__main__':
+    unittest.main()
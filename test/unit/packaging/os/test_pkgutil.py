@@ -0,0 +1,51 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+pkgutil = load_module('pkgutil')
+
+PKGINFO = """\
+system      SUNWcsr                 Core Solaris, (Root)
+application CSWcommon               common - common files and dirs for CSW packages
+application CSWnrpe                 nrpe - Nagios Remote Plugin Executor
+"""
+
+PKGUTIL_COMPARE = """\
+package                              installed                 catalog
+CSWcommon                            1.5,REV=2010.12.11        SAME
+CSWnrpe                              2.15,REV=2014.01.12       2.15,REV=2016.03.31
+CSWwget                              notinst                   1.18,REV=2016.06.29
+"""
+
+class AnsiblePkgutilFunctions(unittest.TestCase):
+
+    def test_parse_pkginfo(self):
+        packages = pkgutil.parse_pkginfo(PKGINFO)
+        self.assertEqual(sorted(packages.keys()), ['CSWcommon', 'CSWnrpe', 'SUNWcsr'])
+
+    def test_parse_pkgutil_compare(self):
+        packages = pkgutil.parse_pkgutil_compare(PKGUTIL_COMPARE)
+        self.assertEqual(packages, {
+            'CSWcommon': ('1.5,REV=2010.12.11', 'SAME'),
+            'CSWnrpe': ('2.15,REV=2014.01.12', '2.15,REV=2016.03.31'),
+            'CSWwget': ('notinst', '1.18,REV=2016.06.29'),
+        })
+
+    def test_outdated_packages_single_query(self):
+        module = FakeModule([(['/opt/csw/bin/pkgutil'], PKGUTIL_COMPARE)], bin_dir='/opt/csw/bin')
+        outdated = pkgutil.outdated_packages(module, ['CSWcommon', 'CSWnrpe'], None)
+        self.assertEqual(outdated, ['CSWnrpe'])
+        self.assertEqual(module.commands, [
+            ['/opt/csw/bin/pkgutil', '-U', '--single', '-c', 'CSWcommon', 'CSWnrpe']])
+
+    def test_installed_packages_single_query(self):
+        module = FakeModule([(['/opt/csw/bin/pkginfo'], PKGINFO)], bin_dir='/opt/csw/bin')
+        installed = pkgutil.installed_packages(module, ['CSWcommon', 'CSWwget', 'CSWnrpe'])
+        self.assertEqual(installed, ['CSWcommon', 'CSWnrpe'])
+        self.assertEqual(len(module.commands), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
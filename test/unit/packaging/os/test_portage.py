@@ -0,0 +1,53 @@
+#!/usr/bin/python
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+portage = load_module('portage')
+
+
+class AnsiblePortageFunctions(unittest.TestCase):
+
+    def setUp(self):
+        self.vdb_path = portage.vdb_path
+        portage.vdb_path = tempfile.mkdtemp()
+        self.install('dev-lang', 'python-2.7.12', '2.7')
+        self.install('dev-lang', 'python-3.4.5', '3.4/3.4m')
+        self.install('app-shells', 'zsh-5.2', '0')
+
+    def tearDown(self):
+        shutil.rmtree(portage.vdb_path)
+        portage.vdb_path = self.vdb_path
+
+    def install(self, category, entry, slot):
+        path = os.path.join(portage.vdb_path, category, entry)
+        os.makedirs(path)
+        f = open(os.path.join(path, 'SLOT'), 'w')
+        f.write(slot + '\n')
+        f.close()
+
+    def test_atom_key(self):
+        self.assertEqual(portage.atom_key('dev-lang/python'), 'dev-lang/python')
+        self.assertEqual(portage.atom_key('dev-lang/python:3.4'), 'dev-lang/python:3.4')
+        self.assertEqual(portage.atom_key('dev-lang/python:3.4/3.4m::gentoo'), 'dev-lang/python:3.4')
+        self.assertEqual(portage.atom_key('dev-lang/python:3.4='), 'dev-lang/python:3.4')
+        self.assertEqual(portage.atom_key('dev-lang/python:*'), 'dev-lang/python')
+        self.assertEqual(portage.atom_key('dev-lang/python::gentoo'), 'dev-lang/python')
+
+    def test_query_vdb_slots(self):
+        module = FakeModule()
+        module.vdb = None
+        self.assertTrue(portage.query_vdb(module, 'dev-lang/python'))
+        self.assertTrue(portage.query_vdb(module, 'dev-lang/python:2.7'))
+        self.assertTrue(portage.query_vdb(module, 'python:3.4'))
+        self.assertFalse(portage.query_vdb(module, 'dev-lang/python:3.5'))
+        self.assertTrue(portage.query_vdb(module, 'zsh'))
+        self.assertFalse(portage.query_vdb(module, 'app-shells/bash'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import load_module
+
+slackpkg = load_module('slackpkg')
+
+# Directory listing of /var/log/packages on Slackware 14.2
+PACKAGE_LOG = [
+    'aaa_base-14.2-x86_64-2',
+    'glibc-solibs-2.23-x86_64-1',
+    'ca-certificates-20160104-noarch-1',
+    'mozilla-firefox-45.2.0esr-x86_64-1_slack14.2',
+    'slackpkg-2.82.1-noarch-3',
+    'README',
+]
+
+
+class AnsibleSlackpkgFunctions(unittest.TestCase):
+
+    def test_parse_package_log(self):
+        packages = slackpkg.parse_package_log(PACKAGE_LOG)
+        self.assertEqual(sorted(packages.keys()), [
+            'aaa_base', 'ca-certificates', 'glibc-solibs', 'mozilla-firefox', 'slackpkg'])
+        self.assertEqual(packages['glibc-solibs'], ('2.23', 'x86_64', '1'))
+        self.assertEqual(packages['mozilla-firefox'], ('45.2.0esr', 'x86_64', '1_slack14.2'))
+
+    def test_parse_package_log_prefix_names(self):
+        # 'glibc' must not be reported as installed because 'glibc-solibs' is
+        packages = slackpkg.parse_package_log(PACKAGE_LOG)
+        self.assertFalse('glibc' in packages)
+
+    def test_parse_package_log_empty(self):
+        self.assertEqual(slackpkg.parse_package_log([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+svr4pkg = load_module('svr4pkg')
+
+PKGINFO = """\
+system      SUNWcsd                 Core Solaris Devices
+system      SUNWcsr                 Core Solaris, (Root)
+application CSWcommon               common - common files and dirs for CSW packages
+application CSWpkgutil              pkgutil - Installs Solaris packages easily
+"""
+
+class AnsibleSvr4pkgFunctions(unittest.TestCase):
+
+    def test_parse_pkginfo(self):
+        packages = svr4pkg.parse_pkginfo(PKGINFO)
+        self.assertEqual(sorted(packages.keys()), ['CSWcommon', 'CSWpkgutil', 'SUNWcsd', 'SUNWcsr'])
+        self.assertEqual(packages['SUNWcsr'], 'system')
+
+    def test_installed_packages_single_query(self):
+        module = FakeModule([('/usr/bin/pkginfo', PKGINFO)])
+        installed = svr4pkg.installed_packages(module, ['CSWcommon', 'CSWwget', 'SUNWcsr'], False)
+        self.assertEqual(installed, ['CSWcommon', 'SUNWcsr'])
+        self.assertEqual(module.commands, ['/usr/bin/pkginfo'])
+
+    def test_package_install_all_names(self):
+        module = FakeModule()
+        svr4pkg.package_install(module, ['CSWwget', 'CSWcurl'], '/tmp/csw.pkg', None, None, 'all', False, '/tmp/admin')
+        self.assertEqual(module.commands, [
+            ['/usr/bin/pkgadd', '-n', '-a', '/tmp/admin', '-d', '/tmp/csw.pkg', 'CSWwget', 'CSWcurl']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import load_module
+
+swdepot = load_module('swdepot')
+
+SWLIST = """\
+# Initializing...
+# Contacting target "hpux01"...
+#
+# Target:  hpux01:/
+#
+
+  gzip                  1.3.5
+  OpenSSL               A.00.9.8zh.001
+  unzip                 6.0
+"""
+
+
+class AnsibleSwdepotFunctions(unittest.TestCase):
+
+    def test_parse_swlist(self):
+        packages = swdepot.parse_swlist(SWLIST)
+        self.assertEqual(packages, {
+            'gzip': '1.3.5',
+            'OpenSSL': 'A.00.9.8zh.001',
+            'unzip': '6.0',
+        })
+
+    def test_compare_package(self):
+        self.assertEqual(swdepot.compare_package('6.0', '6.0.0'), 0)
+        self.assertEqual(swdepot.compare_package('1.3.5', '1.3.12'), -1)
+        self.assertEqual(swdepot.compare_package('1.10', '1.9'), 1)
+
+    def test_compare_package_hpux_revisions(self):
+        self.assertEqual(swdepot.compare_package('B.11.31.1405', 'B.11.31.1503'), -1)
+        self.assertEqual(swdepot.compare_package('A.00.9.8zh.001', 'A.00.9.8zh.001'), 0)
+
+    def test_split_name(self):
+        installed = swdepot.parse_swlist(SWLIST)
+        self.assertEqual(swdepot.split_name('unzip-6.0', installed), ('unzip', '6.0'))
+        self.assertEqual(swdepot.split_name('OpenSSL-A.00.9.8zh.001', installed), ('OpenSSL', 'A.00.9.8zh.001'))
+        self.assertEqual(swdepot.split_name('unzip', installed), ('unzip', None))
+        self.assertEqual(swdepot.split_name('perl-base', installed), ('perl-base', None))
+        installed['gnu-tar-1'] = '1.2'
+        self.assertEqual(swdepot.split_name('gnu-tar-1', installed), ('gnu-tar-1', None))
+
+    def test_selection(self):
+        self.assertEqual(swdepot.selection('unzip', '6.0'), 'unzip,r=6.0')
+        self.assertEqual(swdepot.selection('unzip', None), 'unzip')
+
+
+if __name__ == '__main__':
+    unittest.main()
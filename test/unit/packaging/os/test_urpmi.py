@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+import unittest
+
+from package_manager_helpers import FakeModule, load_module
+
+urpmi = load_module('urpmi')
+
+RPM_QA = """\
+basesystem-minimal 5-8.mga5
+bash 4.3-34.mga5
+gpg-pubkey 80420f66-4c1e3e3a
+gpg-pubkey 3cb1e3a8-5372b5d1
+lib64ncursesw5 5.9-21.1.mga5
+"""
+
+class AnsibleUrpmiFunctions(unittest.TestCase):
+
+    def test_parse_rpm_list(self):
+        packages = urpmi.parse_rpm_list(RPM_QA)
+        self.assertEqual(packages['bash'], ['4.3-34.mga5'])
+        self.assertEqual(packages['gpg-pubkey'], ['80420f66-4c1e3e3a', '3cb1e3a8-5372b5d1'])
+        self.assertEqual(len(packages), 4)
+
+    def test_parse_rpm_list_ignores_garbage(self):
+        self.assertEqual(urpmi.parse_rpm_list('\nwarning: something odd\n'), {})
+
+    def test_is_installed(self):
+        packages = urpmi.parse_rpm_list(RPM_QA)
+        self.assertTrue(urpmi.is_installed(packages, 'bash'))
+        self.assertTrue(urpmi.is_installed(packages, 'bash-4.3'))
+        self.assertTrue(urpmi.is_installed(packages, 'bash-4.3-34.mga5'))
+        self.assertTrue(urpmi.is_installed(packages, 'basesystem-minimal-5-8.mga5'))
+        self.assertTrue(urpmi.is_installed(packages, 'gpg-pubkey-3cb1e3a8'))
+        self.assertFalse(urpmi.is_installed(packages, 'bash-4.2'))
+        self.assertFalse(urpmi.is_installed(packages, 'bash-4.3-33.mga5'))
+        self.assertFalse(urpmi.is_installed(packages, 'basesystem'))
+
+    def test_install_packages_versioned_spec_installed(self):
+        module = FakeModule([('rpm -qa', RPM_QA)])
+        self.assertRaises(SystemExit, urpmi.install_packages, module, ['bash-4.3-34.mga5', 'lib64ncursesw5-5.9'])
+        self.assertFalse(module.result['changed'])
+        self.assertEqual(len(module.commands), 1)
+
+    def test_install_packages_single_command(self):
+        module = FakeModule([
+            ('rpm -qa', [RPM_QA, RPM_QA + 'zsh 5.0.8-1.mga5\nvim 7.4-1.mga5\n']),
+        ])
+        self.assertRaises(SystemExit, urpmi.install_packages, module, ['bash', 'zsh', 'vim'])
+        self.assertTrue(module.result['changed'])
+        installs = [cmd for cmd in module.commands if cmd.startswith(urpmi.URPMI_PATH)]
+        self.assertEqual(len(installs), 1)
+        self.assertTrue(installs[0].endswith("'zsh' 'vim'"))
+        self.assertEqual(len(module.commands), 3)
+
+    def test_install_packages_reports_missing(self):
+        module = FakeModule([('rpm -qa', RPM_QA)])
+        self.assertRaises(SystemExit, urpmi.install_packages, module, ['zsh'])
+        self.assertTrue(module.result['failed'])
+        self.assertEqual(module.result['missing'], ['zsh'])
+
+    def test_remove_packages_single_command(self):
+        module = FakeModule([('rpm -qa', RPM_QA)])
+        self.assertRaises(SystemExit, urpmi.remove_packages, module, ['bash', 'zsh', 'lib64ncursesw5'])
+        self.assertTrue(module.result['changed'])
+        self.assertEqual(module.commands[1], "%s --auto 'bash' 'lib64ncursesw5'" % urpmi.URPME_PATH)
+        self.assertEqual(len(module.commands), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()